@@ -2,24 +2,81 @@
 Configuration de la base de données
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from infrastructure.database.pool_metrics import (
+    PoolMetrics,
+    instrumented_pool_class,
+    register_pool_listeners,
+)
+from infrastructure.database.routing_session import RoutingSession
 from .settings import settings
 
-DATABASE_URL = (
-    f"postgresql://"
+DATABASE_URL = settings.database_url or (
+    f"postgresql+asyncpg://"
     f"{settings.db_user}:{settings.db_password}"
     f"@{settings.db_host}:{settings.db_port}"
     f"/{settings.db_name}"
 )
 
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True
+
+def pool_options(metrics: PoolMetrics) -> dict:
+    """Options de pool de l'engine selon la configuration"""
+    if settings.db_pool_class == "null":
+        return {"poolclass": instrumented_pool_class(NullPool, metrics)}
+    return {
+        "poolclass": instrumented_pool_class(AsyncAdaptedQueuePool, metrics),
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+
+def create_engine_with_metrics(url: str, name: str) -> AsyncEngine:
+    """Créer un engine asynchrone dont le pool est instrumenté"""
+    metrics = PoolMetrics(name=name)
+    async_engine = create_async_engine(
+        url,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        **pool_options(metrics),
+    )
+    register_pool_listeners(async_engine.sync_engine, metrics)
+    return async_engine
+
+
+engine = create_engine_with_metrics(DATABASE_URL, "primary")
+
+replica_engines = [
+    create_engine_with_metrics(url, f"replica-{index}")
+    for index, url in enumerate(settings.db_replica_urls)
+]
+
+# expire_on_commit=False: les attributs restent lisibles après commit
+# sans déclencher de lazy-load (interdit en asynchrone)
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
-SessionLocal = sessionmaker(
-    autocommit=False,
+# Sessions de lecture: routées vers un réplica, le primaire sert de repli
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    primary=engine.sync_engine,
+    replicas=[replica.sync_engine for replica in replica_engines],
     autoflush=False,
-    bind=engine
+    expire_on_commit=False,
 )
+
+
+def all_engines() -> list[AsyncEngine]:
+    """Primaire puis réplicas"""
+    return [engine, *replica_engines]
@@ -3,6 +3,7 @@ Configuration des variables d'environnement
 """
 
 from pathlib import Path
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,11 +22,79 @@ class Settings(BaseSettings):
     db_user: str
     db_password: str
 
+    # URL SQLAlchemy complète, prioritaire sur db_host/db_port/... (ex: sqlite+aiosqlite:///primary.db)
+    database_url: str | None = None
+
+    # Réplicas en lecture (URLs SQLAlchemy complètes, JSON dans l'env)
+    db_replica_urls: list[str] = []
+    # Après une écriture, le client lit sur le primaire pendant cette durée (secondes)
+    db_replica_sticky_seconds: int = 5
+
+    # Pool de connexions (par worker)
+    # "queue": pool classique, "null": aucune connexion conservée (derrière pgbouncer)
+    db_pool_class: Literal["queue", "null"] = "queue"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # secondes d'attente max pour obtenir une connexion
+    db_pool_recycle: int = 1800  # secondes avant recyclage d'une connexion (-1: jamais)
+    db_pool_pre_ping: bool = True
+
+    # Vérification au démarrage de la révision Alembic du schéma
+    # "strict": refuse de démarrer si la base est en retard, "warn": log seulement, "off": aucune
+    db_schema_check: Literal["strict", "warn", "off"] = "strict"
+
+    # Hashage des mots de passe dans un pool de processus dédié
+    password_hash_workers: int = 2  # processus par worker HTTP (0: threadpool, sans processus)
+    password_hash_max_pending: int = 64  # au-delà, les requêtes sont refusées (503)
+    # Algorithme des nouveaux hashes; les anciens sont remplacés à la connexion suivante
+    password_hash_scheme: Literal["bcrypt", "argon2"] = "bcrypt"  # argon2: paquet argon2-cffi
+    password_hash_rounds: int = 12  # facteur de coût bcrypt (2^rounds itérations)
+    password_hash_argon2_time_cost: int = 3
+    password_hash_argon2_memory_kib: int = 65536
+    password_hash_argon2_parallelism: int = 1
+    # Auto-calibrage au démarrage: coût le plus élevé sous ce budget par hash (ms, 0: désactivé)
+    password_hash_target_ms: int = 0
+    password_rehash_max_pending: int = 16  # rehashs en tâche de fond simultanés par worker
+
     # JWT
-    jwt_secret_key: str = "34567890-o[pokjlbcdsbcdwen8u]"
-    jwt_algorithm: str = "HS256"
+    jwt_secret_key: str = "34567890-o[pokjlbcdsbcdwen8u]"  # clé de signature en HS256
+    jwt_algorithm: str = "HS256"  # HS256, RS256 ou ES256 (EdDSA non supporté par python-jose)
+    jwt_key_id: str = "default"  # kid de la clé de signature, porté par chaque token
+    # Clé privée PEM (RS256/ES256): contenu, ou chemin vers le fichier
+    jwt_private_key: str | None = None
+    jwt_private_key_path: str | None = None
+    # Clés de vérification seules (rotation: clé précédente ou suivante), JSON dans l'env
+    # [{"kid": "2026-09", "alg": "RS256", "key": "<PEM ou chemin>"}]
+    jwt_verify_keys: list[dict[str, str]] = []
+    jwt_jwks_max_age: int = 300  # Cache-Control de /.well-known/jwks.json (secondes)
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
+    # Cache des claims vérifiés (clé: empreinte du token, TTL plafonné par exp)
+    jwt_claims_cache_size: int = 1024  # 0: désactivé
+    jwt_claims_cache_ttl: int = 60  # secondes
+
+    # Principal construit depuis les claims du token d'accès (sans SELECT par requête)
+    # La version du token de chaque utilisateur est revérifiée en base après auth_token_version_ttl
+    auth_stateless_principal: bool = False
+    auth_token_version_ttl: int = 30  # secondes
+    auth_token_version_cache_size: int = 10000
+
+    # Cache des utilisateurs authentifiés (par id), invalidé sur update/verify/delete
+    auth_user_cache_size: int = 1000  # 0: désactivé
+    auth_user_cache_ttl: int = 30  # secondes
+
+    # Révocation des tokens: import des révocations des autres workers et purge de la table
+    auth_revocation_sync_seconds: float = 5.0
+    auth_revocation_prune_seconds: int = 3600
+
+    # Limitation des tentatives de connexion (fenêtres glissantes en secondes, limite 0: désactivée)
+    auth_login_ip_limit: int = 20  # tentatives par IP
+    auth_login_ip_window: int = 60
+    auth_login_email_limit: int = 5  # échecs par email
+    auth_login_email_window: int = 900
+    auth_rate_limit_max_keys: int = 100000  # compteurs conservés par worker
+    # IP client lue dans X-Forwarded-For (uniquement derrière un proxy de confiance)
+    auth_trust_forwarded_for: bool = False
 
     # Email SMTP (Gmail)
     smtp_host: str = "smtp.gmail.com"
@@ -33,6 +102,47 @@ class Settings(BaseSettings):
     smtp_user: str = ""  # ton-email@gmail.com
     smtp_password: str = ""  # Mot de passe d'application Google
     smtp_from_name: str = "Task Manager"
+    smtp_from_email: str = ""  # expéditeur, smtp_user par défaut
+    smtp_starttls: bool = True
+    smtp_timeout: float = 30.0  # secondes (connexion, commandes, attente d'une connexion du pool)
+    # Pool de connexions SMTP authentifiées (par worker HTTP)
+    smtp_pool_size: int = 4
+    smtp_pool_max_messages: int = 100  # messages par connexion avant reconnexion
+    smtp_pool_noop_after_seconds: float = 30.0  # NOOP avant réutilisation d'une connexion inactive
+    smtp_pool_max_idle_seconds: float = 240.0  # fermeture d'une connexion sans envoi depuis
+
+    # Langue des emails sans langue demandée (modèles: infrastructure/external/templates/email/<langue>)
+    email_default_locale: str = "fr"
+
+    # Outbox des emails: envoi en tâche de fond avec reprises
+    email_outbox_concurrency: int = 4  # envois simultanés par worker HTTP
+    email_outbox_batch_size: int = 20
+    email_outbox_poll_seconds: float = 2.0
+    email_outbox_lease_seconds: int = 300  # un email réclamé non traité redevient disponible ensuite
+    email_outbox_max_attempts: int = 8
+    email_outbox_backoff_seconds: float = 30.0  # délai après le 1er échec, doublé à chaque tentative
+    email_outbox_backoff_max_seconds: float = 3600.0
+    email_outbox_retention_days: int = 7  # conservation des emails envoyés
+
+    # Invitations groupées: couples (email, tâche) par requête
+    invitation_bulk_max_rows: int = 1000
+    # Balayage des invitations expirées ou acceptées
+    invitation_retention_days: int = 30  # conservation après expiration ou acceptation
+    invitation_sweep_interval_seconds: float = 3600.0
+    invitation_sweep_batch_size: int = 1000  # lignes supprimées par transaction
+    invitation_sweep_pause_seconds: float = 0.1  # pause entre deux lots
+
+    # Exports (NDJSON/CSV): lignes lues et écrites par lot
+    export_batch_size: int = 1000
+
+    # Import de tâches (NDJSON/CSV): lignes validées et insérées par lot
+    task_import_batch_size: int = 1000
+    task_import_max_errors: int = 1000  # lignes refusées détaillées dans le rapport
+
+    # Télémétrie (/health/db, /health/auth, ...): réservée aux OWNER, ou aux sondes
+    # présentant ce jeton dans l'en-tête X-Health-Token (None: jeton désactivé).
+    # /health seul reste public; ne pas exposer /health/* sans cette protection.
+    health_token: str | None = None
 
     # Frontend URL
     frontend_url: str = "http://localhost:3000"
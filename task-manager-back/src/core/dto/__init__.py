@@ -11,6 +11,8 @@ from core.dto.task_dto import (
     TaskCreateDTO,
     TaskUpdateDTO,
     TaskResponseDTO,
+    TaskImportErrorDTO,
+    TaskImportResultDTO,
 )
 from core.dto.assign_dto import (
     AssignCreateDTO,
@@ -25,6 +27,10 @@ from core.dto.auth_dto import (
 )
 from core.dto.invitation_dto import (
     InviteCreateDTO,
+    InviteBulkCreateDTO,
+    InviteBulkStatus,
+    InviteBulkRowDTO,
+    InviteBulkResultDTO,
     InviteAcceptDTO,
     InvitationResponseDTO,
     InvitationDetailDTO,
@@ -34,9 +40,12 @@ from core.dto.response_dto import (
     ApiError,
     PaginatedData,
     PaginatedResponse,
+    CursorPaginatedData,
+    CursorPaginatedResponse,
     success_response,
     error_response,
     paginated_response,
+    cursor_paginated_response,
 )
 
 __all__ = [
@@ -48,6 +57,8 @@ __all__ = [
     "TaskCreateDTO",
     "TaskUpdateDTO",
     "TaskResponseDTO",
+    "TaskImportErrorDTO",
+    "TaskImportResultDTO",
     # Assign
     "AssignCreateDTO",
     "AssignResponseDTO",
@@ -59,6 +70,10 @@ __all__ = [
     "RefreshTokenDTO",
     # Invitation
     "InviteCreateDTO",
+    "InviteBulkCreateDTO",
+    "InviteBulkStatus",
+    "InviteBulkRowDTO",
+    "InviteBulkResultDTO",
     "InviteAcceptDTO",
     "InvitationResponseDTO",
     "InvitationDetailDTO",
@@ -67,7 +82,10 @@ __all__ = [
     "ApiError",
     "PaginatedData",
     "PaginatedResponse",
+    "CursorPaginatedData",
+    "CursorPaginatedResponse",
     "success_response",
     "error_response",
     "paginated_response",
+    "cursor_paginated_response",
 ]
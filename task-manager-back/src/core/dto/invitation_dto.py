@@ -3,8 +3,9 @@ DTOs pour Invitation
 """
 
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 
 class InviteCreateDTO(BaseModel):
@@ -13,6 +14,38 @@ class InviteCreateDTO(BaseModel):
     task_id: UUID
 
 
+class InviteBulkCreateDTO(BaseModel):
+    """DTO pour inviter plusieurs emails à plusieurs tâches (emails validés ligne par ligne)"""
+    emails: list[str] = Field(min_length=1)
+    task_ids: list[UUID] = Field(min_length=1)
+
+
+class InviteBulkStatus(str, Enum):
+    """Résultat d'une ligne (email, tâche) d'une invitation groupée"""
+    CREATED = "created"
+    INVALID_EMAIL = "invalid_email"
+    DUPLICATE = "duplicate"
+    TASK_NOT_FOUND = "task_not_found"
+    USER_EXISTS = "user_exists"
+    ALREADY_PENDING = "already_pending"
+
+
+class InviteBulkRowDTO(BaseModel):
+    """DTO pour le résultat d'une ligne d'invitation groupée"""
+    email: str
+    task_id: UUID
+    status: InviteBulkStatus
+    invitation_id: UUID | None = None
+    detail: str | None = None
+
+
+class InviteBulkResultDTO(BaseModel):
+    """DTO pour la réponse d'une invitation groupée"""
+    created: int
+    rejected: int
+    results: list[InviteBulkRowDTO]
+
+
 class InviteAcceptDTO(BaseModel):
     """DTO pour accepter une invitation"""
     token: str
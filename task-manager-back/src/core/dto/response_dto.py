@@ -60,6 +60,22 @@ class PaginatedResponse(BaseModel, Generic[T]):
     errors: list[dict[str, Any]] | None = None
 
 
+class CursorPaginatedData(BaseModel, Generic[T]):
+    """Données paginées par curseur"""
+    items: list[T]
+    limit: int
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Réponse paginée par curseur standardisée"""
+    success: bool = True
+    data: CursorPaginatedData[T] | None = None
+    message: str | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
 # Helpers pour créer des réponses facilement
 def success_response(
     data: Any = None,
@@ -108,3 +124,24 @@ def paginated_response(
         "message": message,
         "errors": None,
     }
+
+
+def cursor_paginated_response(
+    items: list,
+    limit: int,
+    next_cursor: str | None = None,
+    total: int | None = None,
+    message: str | None = None
+) -> dict:
+    """Créer une réponse paginée par curseur"""
+    return {
+        "success": True,
+        "data": {
+            "items": items,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "total": total,
+        },
+        "message": message,
+        "errors": None,
+    }
@@ -4,14 +4,14 @@ DTOs pour Task
 
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from core.entities.task import TaskStatus, TaskPriority
 
 
 class TaskCreateDTO(BaseModel):
     """DTO pour créer une tâche"""
-    title: str
-    description: str
+    title: str = Field(max_length=255)
+    description: str = Field(max_length=255)
     status: TaskStatus = TaskStatus.TODO
     priority: TaskPriority = TaskPriority.MEDIUM
     start_date: datetime | None = None
@@ -21,8 +21,8 @@ class TaskCreateDTO(BaseModel):
 
 class TaskUpdateDTO(BaseModel):
     """DTO pour mettre à jour une tâche"""
-    title: str | None = None
-    description: str | None = None
+    title: str | None = Field(default=None, max_length=255)
+    description: str | None = Field(default=None, max_length=255)
     status: TaskStatus | None = None
     priority: TaskPriority | None = None
     start_date: datetime | None = None
@@ -44,3 +44,16 @@ class TaskResponseDTO(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TaskImportErrorDTO(BaseModel):
+    """DTO pour une ligne refusée d'un import de tâches"""
+    line: int
+    errors: list[str]
+
+
+class TaskImportResultDTO(BaseModel):
+    """DTO pour le résultat d'un import de tâches"""
+    imported: int = 0
+    rejected: int = 0
+    errors: list[TaskImportErrorDTO] = []  # tronquée à task_import_max_errors lignes
@@ -5,7 +5,9 @@ Core entities
 from core.entities.user import User, UserRole
 from core.entities.task import Task, TaskStatus, TaskPriority
 from core.entities.assign import Assign
-from core.entities.invitation import Invitation
+from core.entities.invitation import Invitation, InvitationDetails
+from core.entities.revoked_token import RevokedToken
+from core.entities.outbox_email import OutboxEmail, OutboxEmailKind, OutboxStatus
 
 __all__ = [
     "User",
@@ -15,4 +17,9 @@ __all__ = [
     "TaskPriority",
     "Assign",
     "Invitation",
+    "InvitationDetails",
+    "RevokedToken",
+    "OutboxEmail",
+    "OutboxEmailKind",
+    "OutboxStatus",
 ]
@@ -3,7 +3,7 @@ Entité Invitation
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 
 
@@ -22,9 +22,25 @@ class Invitation:
     created_at: datetime
 
     def is_expired(self) -> bool:
-        """Vérifier si l'invitation est expirée"""
-        return datetime.utcnow() > self.expires_at
+        """Vérifier si l'invitation est expirée (date sans fuseau: UTC)"""
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) > expires_at
 
     def is_valid(self) -> bool:
         """Vérifier si l'invitation est valide (non acceptée et non expirée)"""
         return not self.accepted and not self.is_expired()
+
+
+@dataclass
+class InvitationDetails:
+    """
+    Invitation accompagnée du titre de la tâche et du nom de l'invitant
+
+    task_title / inviter_name valent None si la tâche ou l'invitant
+    n'existent plus.
+    """
+    invitation: Invitation
+    task_title: str | None
+    inviter_name: str | None
@@ -0,0 +1,53 @@
+"""
+Entité OutboxEmail (email en attente d'envoi)
+"""
+
+from uuid import UUID
+from enum import Enum
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+class OutboxEmailKind(str, Enum):
+    """
+    Type d'email (détermine le modèle utilisé à l'envoi)
+    """
+    INVITATION = "invitation"
+    WELCOME = "welcome"
+    PASSWORD_RESET = "password_reset"
+
+
+class OutboxStatus(str, Enum):
+    """
+    État d'un email de l'outbox
+    """
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"  # abandonné après email_outbox_max_attempts tentatives
+
+
+@dataclass
+class OutboxEmail:
+    """
+    Entité représentant un email à envoyer
+
+    Enregistré dans la même transaction que l'opération qui le déclenche,
+    puis envoyé en tâche de fond (voir infrastructure.workers.email_outbox).
+
+    Attributes:
+        kind: Type d'email
+        to_email: Destinataire
+        payload: Paramètres du modèle (ex: inviter_name, task_title)
+        attempts: Tentatives d'envoi déjà commencées
+        next_attempt_at: Date de la prochaine tentative
+    """
+    id: UUID
+    kind: OutboxEmailKind
+    to_email: str
+    payload: dict = field(default_factory=dict)
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    next_attempt_at: datetime | None = None
+    last_error: str | None = None
+    created_at: datetime | None = None
+    sent_at: datetime | None = None
@@ -0,0 +1,21 @@
+"""
+Entité RevokedToken (token ou session révoqués)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class RevokedToken:
+    """
+    Entité représentant une révocation
+
+    Attributes:
+        jti: jti d'un token, ou sid d'une session entière
+        expires_at: Fin de validité de ce qui est révoqué (la révocation est purgée ensuite)
+        revoked_at: Date de révocation
+    """
+    jti: str
+    expires_at: datetime
+    revoked_at: datetime | None = None
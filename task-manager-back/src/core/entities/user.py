@@ -28,3 +28,5 @@ class User:
     role: UserRole
     created_at: datetime
     updated_at: datetime
+    # Incrémenté à chaque modification: invalide les principals construits depuis les claims
+    token_version: int = 0
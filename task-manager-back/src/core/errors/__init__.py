@@ -9,6 +9,8 @@ from core.errors.base import (
     AuthenticationError,
     AuthorizationError,
     ConflictError,
+    ServiceUnavailableError,
+    RateLimitError,
 )
 from core.errors.user_errors import (
     UserNotFoundError,
@@ -19,6 +21,7 @@ from core.errors.user_errors import (
 from core.errors.task_errors import (
     TaskNotFoundError,
     TaskAccessDeniedError,
+    TaskAssigneesConflictError,
 )
 from core.errors.invitation_errors import (
     InvitationNotFoundError,
@@ -35,6 +38,8 @@ __all__ = [
     "AuthenticationError",
     "AuthorizationError",
     "ConflictError",
+    "ServiceUnavailableError",
+    "RateLimitError",
     # User
     "UserNotFoundError",
     "UserAlreadyExistsError",
@@ -43,6 +48,7 @@ __all__ = [
     # Task
     "TaskNotFoundError",
     "TaskAccessDeniedError",
+    "TaskAssigneesConflictError",
     # Invitation
     "InvitationNotFoundError",
     "InvitationExpiredError",
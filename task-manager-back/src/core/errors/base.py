@@ -121,3 +121,39 @@ class ConflictError(AppError):
             status_code=status.HTTP_409_CONFLICT,
             field=field,
         )
+
+
+class ServiceUnavailableError(AppError):
+    """Service temporairement indisponible (surcharge, etc.)"""
+
+    def __init__(
+        self,
+        message: str = "Service temporairement indisponible",
+        code: str = "SERVICE_UNAVAILABLE",
+        field: str | None = None,
+    ):
+        super().__init__(
+            message=message,
+            code=code,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            field=field,
+        )
+
+
+class RateLimitError(AppError):
+    """Trop de requêtes (limitation de débit)"""
+
+    def __init__(
+        self,
+        message: str = "Trop de requêtes, réessayez plus tard",
+        code: str = "RATE_LIMITED",
+        field: str | None = None,
+        retry_after: int = 1,
+    ):
+        super().__init__(
+            message=message,
+            code=code,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            field=field,
+        )
+        self.retry_after = retry_after
@@ -2,7 +2,7 @@
 Exceptions liées aux tâches
 """
 
-from core.errors.base import NotFoundError, AuthorizationError
+from core.errors.base import NotFoundError, AuthorizationError, ConflictError
 
 
 class TaskNotFoundError(NotFoundError):
@@ -23,3 +23,14 @@ class TaskAccessDeniedError(AuthorizationError):
             message=message,
             code="TASK_ACCESS_DENIED",
         )
+
+
+class TaskAssigneesConflictError(ConflictError):
+    """Assignations refusées par la base (assigné supprimé ou tâche modifiée en parallèle)"""
+
+    def __init__(self, message: str = "Les assignés ou la tâche ont été modifiés entre-temps, réessayez"):
+        super().__init__(
+            message=message,
+            code="TASK_ASSIGNEES_CONFLICT",
+            field="assigned_to",
+        )
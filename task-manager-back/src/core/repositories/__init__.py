@@ -6,10 +6,14 @@ from core.repositories.user_repository import UserRepository
 from core.repositories.task_repository import TaskRepository
 from core.repositories.assign_repository import AssignRepository
 from core.repositories.invitation_repository import InvitationRepository
+from core.repositories.revoked_token_repository import RevokedTokenRepository
+from core.repositories.email_outbox_repository import EmailOutboxRepository
 
 __all__ = [
     "UserRepository",
     "TaskRepository",
     "AssignRepository",
     "InvitationRepository",
+    "RevokedTokenRepository",
+    "EmailOutboxRepository",
 ]
@@ -3,8 +3,11 @@ Core repository interface pour les assignations
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from uuid import UUID
 from core.entities.assign import Assign
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 
 
 class AssignRepository(ABC):
@@ -13,31 +16,50 @@ class AssignRepository(ABC):
     """
 
     @abstractmethod
-    def save(self, assign: Assign) -> Assign:
+    async def save(self, assign: Assign) -> Assign:
         """Sauvegarder une assignation"""
         pass
 
     @abstractmethod
-    def find_all(self) -> list[Assign]:
+    async def find_all(self) -> list[Assign]:
         """Trouver toutes les assignations"""
         pass
 
     @abstractmethod
-    def find_by_id(self, id: UUID) -> Assign | None:
+    async def find_page(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Assign]:
+        """Trouver une page d'assignations triées par (created_at, id)"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, id: UUID) -> Assign | None:
         """Trouver une assignation par son id"""
         pass
 
     @abstractmethod
-    def update(self, assign: Assign) -> Assign:
+    async def update(self, assign: Assign) -> Assign:
         """Mettre à jour une assignation"""
         pass
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer une assignation"""
         pass
 
     @abstractmethod
-    def get_assignments_for_user(self, user_id: UUID) -> list[Assign]:
+    async def get_assignments_for_user(self, user_id: UUID) -> list[Assign]:
         """Trouver les assignations d'un utilisateur"""
         pass
+
+    @abstractmethod
+    async def get_assignments_page_for_user(
+        self, user_id: UUID, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Assign]:
+        """Trouver une page des assignations d'un utilisateur"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[list[Assign]]:
+        """Toutes les assignations par lots, triés par (created_at, id), sans tout charger en mémoire"""
+        pass
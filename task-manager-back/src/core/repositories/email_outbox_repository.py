@@ -0,0 +1,54 @@
+"""
+Core repository interface pour l'outbox des emails
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+from core.entities.outbox_email import OutboxEmail
+
+
+class EmailOutboxRepository(ABC):
+    """
+    Interface du repository pour l'outbox des emails
+    """
+
+    @abstractmethod
+    async def add(self, email: OutboxEmail) -> None:
+        """Ajouter un email à la transaction en cours (enregistré au prochain commit)"""
+        pass
+
+    @abstractmethod
+    async def claim_due(self, limit: int, now: datetime, lease_until: datetime) -> list[OutboxEmail]:
+        """
+        Réclamer les emails à envoyer
+
+        Chaque email réclamé compte une tentative et n'est plus proposé aux
+        autres workers avant lease_until.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_sent(self, id: UUID, sent_at: datetime) -> None:
+        """Marquer un email comme envoyé"""
+        pass
+
+    @abstractmethod
+    async def reschedule(self, id: UUID, error: str, next_attempt_at: datetime) -> None:
+        """Replanifier un email après un échec"""
+        pass
+
+    @abstractmethod
+    async def mark_failed(self, id: UUID, error: str) -> None:
+        """Abandonner un email"""
+        pass
+
+    @abstractmethod
+    async def delete_sent_before(self, before: datetime) -> int:
+        """Supprimer les emails envoyés avant une date"""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self) -> dict[str, int]:
+        """Nombre d'emails par état"""
+        pass
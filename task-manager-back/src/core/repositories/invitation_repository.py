@@ -3,8 +3,11 @@ Core repository interface pour les invitations
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
-from core.entities.invitation import Invitation
+from core.entities.invitation import Invitation, InvitationDetails
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 
 
 class InvitationRepository(ABC):
@@ -13,41 +16,85 @@ class InvitationRepository(ABC):
     """
 
     @abstractmethod
-    def save(self, invitation: Invitation) -> Invitation:
+    async def save(self, invitation: Invitation) -> Invitation:
         """Sauvegarder une invitation"""
         pass
 
     @abstractmethod
-    def find_all(self) -> list[Invitation]:
+    async def save_many(self, invitations: list[Invitation]) -> None:
+        """Sauvegarder plusieurs invitations dans une seule transaction"""
+        pass
+
+    @abstractmethod
+    async def find_all(self) -> list[Invitation]:
         """Trouver toutes les invitations"""
         pass
 
     @abstractmethod
-    def find_by_id(self, id: UUID) -> Invitation | None:
+    async def find_by_id(self, id: UUID) -> Invitation | None:
         """Trouver une invitation par son id"""
         pass
 
     @abstractmethod
-    def find_by_token(self, token: str) -> Invitation | None:
+    async def find_by_token(self, token: str) -> Invitation | None:
         """Trouver une invitation par son token"""
         pass
 
     @abstractmethod
-    def find_by_email(self, email: str) -> list[Invitation]:
+    async def find_by_email(self, email: str) -> list[Invitation]:
         """Trouver les invitations par email"""
         pass
 
     @abstractmethod
-    def find_pending(self) -> list[Invitation]:
+    async def find_pending_pairs(
+        self, emails: list[str], task_ids: list[UUID]
+    ) -> set[tuple[str, UUID]]:
+        """Couples (email en minuscules, tâche) ayant déjà une invitation en attente"""
+        pass
+
+    @abstractmethod
+    async def find_pending(self) -> list[Invitation]:
         """Trouver les invitations en attente (non acceptées et non expirées)"""
         pass
 
     @abstractmethod
-    def update(self, invitation: Invitation) -> Invitation:
+    async def find_pending_with_details(self) -> list[InvitationDetails]:
+        """Trouver les invitations en attente avec tâche et invitant (une seule requête)"""
+        pass
+
+    @abstractmethod
+    async def find_pending_page_with_details(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[InvitationDetails]:
+        """Trouver une page d'invitations en attente avec tâche et invitant"""
+        pass
+
+    @abstractmethod
+    async def find_by_id_with_details(self, id: UUID) -> InvitationDetails | None:
+        """Trouver une invitation par son id avec tâche et invitant"""
+        pass
+
+    @abstractmethod
+    async def find_by_token_with_details(self, token: str) -> InvitationDetails | None:
+        """Trouver une invitation par son token avec tâche et invitant"""
+        pass
+
+    @abstractmethod
+    async def update(self, invitation: Invitation) -> Invitation:
         """Mettre à jour une invitation"""
         pass
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer une invitation"""
         pass
+
+    @abstractmethod
+    async def delete_stale(self, before: datetime, limit: int) -> int:
+        """
+        Supprimer un lot d'invitations expirées ou acceptées avant `before`
+
+        Returns:
+            Nombre d'invitations supprimées (moins que limit: plus rien à supprimer)
+        """
+        pass
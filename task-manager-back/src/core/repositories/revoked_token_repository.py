@@ -0,0 +1,28 @@
+"""
+Core repository interface pour les révocations de tokens
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from core.entities.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository(ABC):
+    """
+    Interface du repository pour les révocations de tokens
+    """
+
+    @abstractmethod
+    async def revoke(self, revoked_token: RevokedToken) -> bool:
+        """Enregistrer une révocation (False si déjà révoqué)"""
+        pass
+
+    @abstractmethod
+    async def find_active(self, revoked_since: datetime | None = None) -> list[RevokedToken]:
+        """Trouver les révocations non expirées (révoquées depuis une date)"""
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, now: datetime) -> int:
+        """Supprimer les révocations expirées"""
+        pass
@@ -3,8 +3,11 @@ Core repository interface pour les tâches
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from uuid import UUID
 from core.entities.task import Task
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 
 
 class TaskRepository(ABC):
@@ -13,31 +16,60 @@ class TaskRepository(ABC):
     """
 
     @abstractmethod
-    def save(self, task: Task) -> Task:
-        """Sauvegarder une tâche"""
+    async def save(self, task: Task) -> Task:
+        """Sauvegarder une tâche et ses assignations (task.assigned_to)"""
         pass
 
     @abstractmethod
-    def find_all(self) -> list[Task]:
+    async def insert_many(self, tasks: list[Task]) -> None:
+        """Insérer des tâches et leurs assignations dans une seule transaction"""
+        pass
+
+    @abstractmethod
+    async def find_all(self) -> list[Task]:
         """Trouver toutes les tâches"""
         pass
 
     @abstractmethod
-    def find_by_id(self, id: UUID) -> Task | None:
+    async def find_page(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Task]:
+        """Trouver une page de tâches triées par (created_at, id)"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, id: UUID) -> Task | None:
         """Trouver une tâche par son id"""
         pass
 
     @abstractmethod
-    def update(self, task: Task) -> Task:
-        """Mettre à jour une tâche"""
+    async def find_titles(self, ids: list[UUID]) -> dict[UUID, str]:
+        """Titres des tâches existantes parmi les ids donnés"""
         pass
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    async def update(self, task: Task) -> Task | None:
+        """Mettre à jour une tâche; ses assignations sont alignées sur task.assigned_to (None si elle n'existe plus)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, id: UUID) -> None:
         """Supprimer une tâche"""
         pass
 
     @abstractmethod
-    def get_tasks_for_user(self, user_id: UUID) -> list[Task]:
+    async def get_tasks_for_user(self, user_id: UUID) -> list[Task]:
         """Trouver les tâches assignées à un utilisateur"""
         pass
+
+    @abstractmethod
+    async def get_tasks_page_for_user(
+        self, user_id: UUID, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Task]:
+        """Trouver une page des tâches assignées à un utilisateur"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[list[Task]]:
+        """Toutes les tâches par lots, triés par (created_at, id), sans tout charger en mémoire"""
+        pass
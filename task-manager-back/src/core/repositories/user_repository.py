@@ -3,8 +3,11 @@ Core repository interface pour les utilisateurs
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from uuid import UUID
 from core.entities.user import User
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 
 
 class UserRepository(ABC):
@@ -13,36 +16,72 @@ class UserRepository(ABC):
     """
 
     @abstractmethod
-    def save(self, user: User) -> User:
+    async def save(self, user: User) -> User:
         """Sauvegarder un utilisateur"""
         pass
 
     @abstractmethod
-    def find_all(self) -> list[User]:
+    async def find_all(self) -> list[User]:
         """Trouver tous les utilisateurs"""
         pass
 
     @abstractmethod
-    def find_by_id(self, id: UUID) -> User | None:
+    async def find_page(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[User]:
+        """Trouver une page d'utilisateurs triés par (created_at, id)"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, id: UUID) -> User | None:
         """Trouver un utilisateur par son id"""
         pass
 
     @abstractmethod
-    def update(self, user: User) -> User:
+    async def update(self, user: User) -> User:
         """Mettre à jour un utilisateur"""
         pass
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer un utilisateur"""
         pass
 
     @abstractmethod
-    def verify(self, id: UUID) -> User:
+    async def verify(self, id: UUID) -> User:
         """Vérifier un utilisateur"""
         pass
 
     @abstractmethod
-    def find_by_email(self, email: str) -> User | None:
+    async def update_password_hash(self, id: UUID, old_hash: str, new_hash: str) -> bool:
+        """
+        Remplacer le hash du mot de passe s'il n'a pas changé entre-temps
+
+        Même mot de passe, autre hash: les sessions restent valides.
+        """
+        pass
+
+    @abstractmethod
+    async def get_token_version(self, id: UUID) -> int | None:
+        """Version du token d'un utilisateur (None s'il n'existe pas)"""
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> User | None:
         """Trouver un utilisateur par son email"""
         pass
+
+    @abstractmethod
+    async def find_existing_emails(self, emails: list[str]) -> set[str]:
+        """Emails (en minuscules) déjà utilisés par un compte, parmi ceux donnés"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[list[User]]:
+        """Tous les utilisateurs par lots, triés par (created_at, id), sans tout charger en mémoire"""
+        pass
+
+    @abstractmethod
+    async def find_existing_ids(self, ids: list[UUID]) -> set[UUID]:
+        """Ids des utilisateurs existants parmi ceux donnés"""
+        pass
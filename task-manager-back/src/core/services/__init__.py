@@ -3,5 +3,7 @@ Core Services
 """
 
 from core.services.auth_service import AuthService
+from core.services.key_ring import KeyRing, key_ring
+from core.services.password_hasher import HashPolicy, PasswordHasher, password_hasher
 
-__all__ = ["AuthService"]
+__all__ = ["AuthService", "KeyRing", "key_ring", "HashPolicy", "PasswordHasher", "password_hasher"]
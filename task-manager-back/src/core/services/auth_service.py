@@ -2,35 +2,63 @@
 Service d'authentification
 """
 
-from datetime import datetime, timedelta
-from uuid import UUID
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+import hashlib
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+from jose import JWTError
 from config.settings import settings
 from core.entities.user import User, UserRole
+from core.errors.base import ValidationError
+from core.services.key_ring import key_ring
+from core.services.ttl_cache import TTLCache
+from core.valueObjects.token_claims import TokenClaims
 
 
-# Configuration du hashage de mot de passe
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Claims déjà vérifiés, indexés par empreinte du token (évite de revérifier la signature)
+claims_cache: TTLCache[bytes, TokenClaims] = TTLCache(
+    max_size=settings.jwt_claims_cache_size,
+    ttl=settings.jwt_claims_cache_ttl,
+)
+
+# Dernière version connue du token de chaque utilisateur (principal sans état)
+token_versions: TTLCache[UUID, int] = TTLCache(
+    max_size=settings.auth_token_version_cache_size,
+    ttl=settings.auth_token_version_ttl,
+)
+# Version enregistrée pour un utilisateur supprimé
+TOKEN_VERSION_DELETED = -1
+
+# Utilisateurs authentifiés récemment, par id (dépendance get_current_user)
+user_cache: TTLCache[UUID, User] = TTLCache(
+    max_size=settings.auth_user_cache_size,
+    ttl=settings.auth_user_cache_ttl,
+)
 
 
 class AuthService:
     """Service pour l'authentification JWT"""
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        """Hasher un mot de passe"""
-        return pwd_context.hash(password)
+    def create_token_pair(user: User, session_id: str | None = None) -> tuple[str, str]:
+        """
+        Créer un token d'accès et un token de rafraîchissement d'une même session
 
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Vérifier un mot de passe"""
-        return pwd_context.verify(plain_password, hashed_password)
+        Args:
+            session_id: Session existante (rotation du refresh token), sinon nouvelle session
+
+        Returns:
+            (access_token, refresh_token)
+        """
+        session_id = session_id or uuid4().hex
+        return (
+            AuthService.create_access_token(user, session_id),
+            AuthService.create_refresh_token(user, session_id),
+        )
 
     @staticmethod
-    def create_access_token(user: User) -> str:
+    def create_access_token(user: User, session_id: str | None = None) -> str:
         """Créer un token d'accès JWT"""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         expire = now + timedelta(
             minutes=settings.jwt_access_token_expire_minutes
         )
@@ -41,48 +69,105 @@ class AuthService:
             "verified": user.verified,
             "first_name": user.first_name,
             "last_name": user.last_name,
+            "ver": user.token_version,
+            "jti": uuid4().hex,
+            "sid": session_id or uuid4().hex,
             "type": "access",
             "iat": now.timestamp(),
             "exp": expire,
         }
-        return jwt.encode(
-            payload,
-            settings.jwt_secret_key,
-            algorithm=settings.jwt_algorithm
-        )
+        return key_ring.sign(payload)
 
     @staticmethod
-    def create_refresh_token(user: User) -> str:
+    def create_refresh_token(user: User, session_id: str | None = None) -> str:
         """Créer un token de rafraîchissement JWT"""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         expire = now + timedelta(
             days=settings.jwt_refresh_token_expire_days
         )
         payload = {
             "sub": str(user.id),
+            "jti": uuid4().hex,
+            "sid": session_id or uuid4().hex,
             "type": "refresh",
             "iat": now.timestamp(),
             "exp": expire,
         }
-        return jwt.encode(
-            payload,
-            settings.jwt_secret_key,
-            algorithm=settings.jwt_algorithm
-        )
+        return key_ring.sign(payload)
 
     @staticmethod
     def decode_token(token: str) -> dict | None:
-        """Décoder un token JWT"""
+        """Décoder un token JWT (clé sélectionnée par le kid de l'en-tête)"""
         try:
-            payload = jwt.decode(
-                token,
-                settings.jwt_secret_key,
-                algorithms=[settings.jwt_algorithm]
-            )
-            return payload
+            return key_ring.decode(token)
         except JWTError:
             return None
 
+    @staticmethod
+    def verify_token(
+        token: str, expected_type: str | None = "access", use_cache: bool = True
+    ) -> TokenClaims | None:
+        """
+        Vérifier un token JWT (signature et expiration) et retourner ses claims
+
+        La signature n'est vérifiée qu'une fois par token: les claims sont
+        ensuite servis depuis le cache jusqu'à exp (ou le TTL du cache).
+
+        Args:
+            expected_type: Type attendu ("access", "refresh"), None pour ne pas vérifier
+            use_cache: Utiliser le cache des claims
+
+        Returns:
+            Les claims, ou None si le token est invalide, expiré ou d'un autre type
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = claims_cache.get(digest) if use_cache else None
+        if claims is None:
+            payload = AuthService.decode_token(token)
+            if payload is None:
+                return None
+            try:
+                claims = TokenClaims.from_payload(payload)
+            except ValidationError:
+                return None
+            if use_cache:
+                claims_cache.set(digest, claims, expires_at=claims.exp.timestamp())
+
+        if claims.is_expired:
+            return None
+        if expected_type is not None and claims.type != expected_type:
+            return None
+        return claims
+
+    @staticmethod
+    def principal_from_claims(claims: TokenClaims) -> User | None:
+        """
+        Construire l'utilisateur courant depuis les claims d'un token d'accès
+
+        Le principal ne porte ni mot de passe ni dates réelles: il sert aux
+        contrôles d'accès, pas à l'affichage du profil.
+
+        Returns:
+            L'utilisateur, ou None si les claims sont incomplets (ancien token)
+        """
+        payload = claims.payload
+        try:
+            issued_at = datetime.fromtimestamp(payload["iat"], tz=timezone.utc)
+            return User(
+                id=claims.user_id,
+                first_name=payload["first_name"],
+                last_name=payload["last_name"],
+                email=payload["email"],
+                password="",
+                verified=bool(payload["verified"]),
+                role=UserRole(payload["role"]),
+                created_at=issued_at,
+                updated_at=issued_at,
+                token_version=int(payload["ver"]),
+            )
+        except (KeyError, ValueError, TypeError):
+            return None
+
     @staticmethod
     def get_user_id_from_token(token: str) -> UUID | None:
         """Extraire l'ID utilisateur du token"""
@@ -114,7 +199,7 @@ class AuthService:
         exp = payload.get("exp")
         if exp is None:
             return True
-        return datetime.utcnow() > datetime.fromtimestamp(exp)
+        return datetime.now(timezone.utc) > datetime.fromtimestamp(exp, tz=timezone.utc)
 
     @staticmethod
     def is_refresh_token(token: str) -> bool:
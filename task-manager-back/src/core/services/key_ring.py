@@ -0,0 +1,156 @@
+"""
+Trousseau de clés JWT (signature, vérification, JWKS)
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from jose import jwk, jwt, JWTError
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
+from config.settings import Settings, settings
+
+# Algorithmes acceptés (python-jose ne supporte pas EdDSA)
+SUPPORTED_ALGORITHMS = ALGORITHMS.HMAC | ALGORITHMS.RSA_DS | ALGORITHMS.EC_DS
+
+
+class KeyRingError(RuntimeError):
+    """Configuration des clés JWT invalide"""
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Clé du trousseau, analysée une seule fois au chargement"""
+    kid: str
+    alg: str
+    key: Key
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.alg in ALGORITHMS.HMAC
+
+    def public_jwk(self) -> dict:
+        """Représentation JWK publique (jamais pour une clé symétrique)"""
+        data = self.key.public_key().to_dict()
+        data.update({"kid": self.kid, "alg": self.alg, "use": "sig"})
+        return data
+
+
+def _load_material(value: str, alg: str) -> str:
+    """Contenu PEM, chemin vers un fichier PEM, ou secret (HMAC)"""
+    if alg in ALGORITHMS.HMAC or value.lstrip().startswith("-----BEGIN"):
+        return value
+    path = Path(value)
+    if not path.is_file():
+        raise KeyRingError(f"Clé JWT introuvable: {value}")
+    return path.read_text()
+
+
+def _construct(kid: str, alg: str, material: str) -> SigningKey:
+    """Analyser une clé pour un algorithme donné"""
+    if alg not in SUPPORTED_ALGORITHMS:
+        raise KeyRingError(f"Algorithme JWT non supporté: {alg}")
+    try:
+        return SigningKey(kid=kid, alg=alg, key=jwk.construct(_load_material(material, alg), alg))
+    except KeyRingError:
+        raise
+    except Exception as exc:
+        raise KeyRingError(f"Clé JWT invalide ({kid}): {exc}") from exc
+
+
+class KeyRing:
+    """
+    Clé de signature courante et clés de vérification seules
+
+    Les tokens portent le `kid` de la clé qui les a signés; la vérification
+    sélectionne la clé par ce `kid`. Rotation: publier la nouvelle clé
+    publique parmi les clés de vérification, la passer en clé de signature,
+    puis retirer l'ancienne une fois ses derniers tokens expirés.
+    """
+
+    def __init__(self, signing_key: SigningKey, verify_keys: list[SigningKey]):
+        self.signing_key = signing_key
+        self._keys: dict[str, SigningKey] = {}
+        for key in [signing_key, *verify_keys]:
+            if key.kid in self._keys:
+                raise KeyRingError(f"kid JWT en double: {key.kid}")
+            if not key.is_symmetric and not key.key.is_public():
+                # Seule la partie publique sert à vérifier
+                key = SigningKey(kid=key.kid, alg=key.alg, key=key.key.public_key())
+            self._keys[key.kid] = key
+        # Tokens émis avant l'introduction du kid: première clé symétrique du trousseau
+        self._legacy_key = next(
+            (key for key in self._keys.values() if key.is_symmetric), self._keys[signing_key.kid]
+        )
+        self._jwks = json.dumps(
+            {"keys": [key.public_jwk() for key in self._keys.values() if not key.is_symmetric]},
+            separators=(",", ":"),
+        ).encode()
+        self.jwks_etag = '"' + hashlib.sha256(self._jwks).hexdigest()[:32] + '"'
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> "KeyRing":
+        """Charger le trousseau depuis la configuration"""
+        if config.jwt_algorithm in ALGORITHMS.HMAC:
+            material = config.jwt_secret_key
+        else:
+            material = config.jwt_private_key or config.jwt_private_key_path
+            if not material:
+                raise KeyRingError(
+                    f"jwt_private_key ou jwt_private_key_path requis pour {config.jwt_algorithm}"
+                )
+        signing_key = _construct(config.jwt_key_id, config.jwt_algorithm, material)
+        if not signing_key.is_symmetric and signing_key.key.is_public():
+            raise KeyRingError("La clé de signature JWT doit être une clé privée")
+
+        verify_keys = []
+        for entry in config.jwt_verify_keys:
+            try:
+                verify_keys.append(_construct(entry["kid"], entry["alg"], entry["key"]))
+            except KeyError as exc:
+                raise KeyRingError(f"Clé de vérification JWT incomplète: {exc} manquant") from exc
+        return cls(signing_key, verify_keys)
+
+    def sign(self, payload: dict) -> str:
+        """Signer des claims avec la clé courante"""
+        return jwt.encode(
+            payload,
+            self.signing_key.key,
+            algorithm=self.signing_key.alg,
+            headers={"kid": self.signing_key.kid},
+        )
+
+    def decode(self, token: str) -> dict:
+        """
+        Vérifier la signature et l'expiration d'un token
+
+        Raises:
+            JWTError: Token malformé, kid inconnu, signature ou expiration invalide
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            raise
+        except Exception as exc:
+            raise JWTError("Invalid token header") from exc
+        kid = header.get("kid")
+        # En-tête non vérifié: un kid non chaîne (liste, objet) n'est pas hashable
+        if kid is not None and not isinstance(kid, str):
+            raise JWTError("Invalid key id")
+        key = self._legacy_key if kid is None else self._keys.get(kid)
+        if key is None:
+            raise JWTError("Unknown key id")
+        return jwt.decode(token, key.key, algorithms=[key.alg])
+
+    @property
+    def kids(self) -> list[str]:
+        return list(self._keys)
+
+    @property
+    def jwks(self) -> bytes:
+        """Document JWKS sérialisé une fois (clés publiques uniquement)"""
+        return self._jwks
+
+
+key_ring = KeyRing.from_settings(settings)
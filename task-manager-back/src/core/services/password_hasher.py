@@ -0,0 +1,261 @@
+"""
+Service de hashage des mots de passe (pool de processus)
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import secrets
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from passlib.context import CryptContext
+from config.settings import Settings, settings
+from core.errors.base import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Bornes du coût choisi par l'auto-calibrage
+BCRYPT_ROUNDS_RANGE = (10, 16)
+ARGON2_TIME_COST_RANGE = (2, 10)
+
+
+@dataclass(frozen=True)
+class HashPolicy:
+    """
+    Algorithme et coût des nouveaux hashes
+
+    Les hashes d'un autre algorithme, ou d'un coût inférieur, restent
+    vérifiables et sont signalés par `needs_update`.
+    """
+    scheme: str = "bcrypt"  # "bcrypt" ou "argon2" (argon2id)
+    rounds: int = 12  # bcrypt: log2 des itérations, argon2: time_cost
+    memory_cost: int = 65536  # argon2: mémoire en KiB
+    parallelism: int = 1  # argon2
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> "HashPolicy":
+        """Politique configurée (avant auto-calibrage)"""
+        if config.password_hash_scheme == "argon2":
+            return cls(
+                scheme="argon2",
+                rounds=config.password_hash_argon2_time_cost,
+                memory_cost=config.password_hash_argon2_memory_kib,
+                parallelism=config.password_hash_argon2_parallelism,
+            )
+        return cls(scheme="bcrypt", rounds=config.password_hash_rounds)
+
+    def context_kwargs(self) -> dict:
+        """Arguments du CryptContext passlib (transmis aux processus du pool)"""
+        other = "argon2" if self.scheme == "bcrypt" else "bcrypt"
+        kwargs = {
+            "schemes": [self.scheme, other],
+            "deprecated": "auto",
+            f"{self.scheme}__default_rounds": self.rounds,
+            f"{self.scheme}__min_rounds": self.rounds,
+        }
+        if self.scheme == "argon2":
+            kwargs.update(
+                argon2__type="ID",
+                argon2__memory_cost=self.memory_cost,
+                argon2__parallelism=self.parallelism,
+            )
+        return kwargs
+
+    def with_rounds(self, rounds: int) -> "HashPolicy":
+        return replace(self, rounds=rounds)
+
+
+# Contexte passlib propre à chaque processus du pool (initialisé par _init_worker)
+_worker_context: CryptContext | None = None
+
+
+def _init_worker(policy: HashPolicy) -> None:
+    """Initialisation d'un processus du pool"""
+    global _worker_context
+    _worker_context = CryptContext(**policy.context_kwargs())
+
+
+def _hash(password: str) -> str:
+    """Hasher un mot de passe (exécuté dans le pool)"""
+    return _worker_context.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    """Vérifier un mot de passe (exécuté dans le pool)"""
+    return _worker_context.verify(password, hashed_password)
+
+
+@dataclass
+class HasherMetrics:
+    """Compteurs du pool de hashage (par worker HTTP)"""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    pending: int = 0
+    pending_max: int = 0
+    duration_total: float = 0.0
+    duration_max: float = 0.0
+
+    def record(self, duration: float) -> None:
+        """Enregistrer la durée d'une opération (attente + calcul)"""
+        self.duration_total += duration
+        self.duration_max = max(self.duration_max, duration)
+
+
+class PasswordHasher:
+    """
+    Hashage et vérification des mots de passe hors de la boucle d'événements
+
+    Le travail CPU est exécuté dans un pool de processus borné: il s'étale
+    sur les cœurs sans occuper le threadpool des requêtes. Au-delà de
+    `max_pending` opérations en cours, les appels sont refusés.
+    """
+
+    def __init__(self, workers: int, max_pending: int, policy: HashPolicy):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.policy = policy
+        self.metrics = HasherMetrics()
+        self.calibration: dict | None = None
+        self._executor: Executor | None = None
+        self._dummy_hash: str | None = None
+        # Analyse des hashes seulement (needs_update), sans calcul
+        self._context = CryptContext(**policy.context_kwargs())
+
+    def _get_executor(self) -> Executor:
+        """Créer le pool à la première utilisation (après le fork du serveur)"""
+        if self._executor is None:
+            if self.workers > 0:
+                # "spawn": pas de fork d'un processus ayant déjà une boucle asyncio et des threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.policy,),
+                )
+            else:
+                _init_worker(self.policy)
+                self._executor = ThreadPoolExecutor(thread_name_prefix="password-hasher")
+        return self._executor
+
+    async def _submit(self, fn, *args):
+        """Soumettre une opération au pool en respectant la borne"""
+        if self.metrics.pending >= self.max_pending:
+            self.metrics.rejected += 1
+            raise ServiceUnavailableError(
+                message="Trop de requêtes d'authentification, réessayez plus tard",
+                code="PASSWORD_HASHER_OVERLOADED",
+            )
+        self.metrics.submitted += 1
+        self.metrics.pending += 1
+        self.metrics.pending_max = max(self.metrics.pending_max, self.metrics.pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), fn, *args)
+        except Exception:
+            self.metrics.failed += 1
+            raise
+        finally:
+            self.metrics.pending -= 1
+            self.metrics.record(time.perf_counter() - start)
+        self.metrics.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        """Hasher un mot de passe"""
+        return await self._submit(_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Vérifier un mot de passe"""
+        return await self._submit(_verify, password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Le hash utilise-t-il un autre algorithme ou un coût inférieur à la politique?"""
+        try:
+            return self._context.needs_update(hashed_password)
+        except ValueError:
+            return False
+
+    def set_policy(self, policy: HashPolicy) -> None:
+        """Changer de politique (le pool est recréé à la prochaine opération)"""
+        self.shutdown()
+        self.policy = policy
+        self._context = CryptContext(**policy.context_kwargs())
+        self._dummy_hash = None
+
+    async def calibrate(self, target_ms: float) -> HashPolicy:
+        """
+        Ajuster le coût pour qu'un hash prenne au plus `target_ms` sur cette machine
+
+        Un hash est mesuré au coût configuré puis extrapolé: le temps double à
+        chaque round bcrypt et croît linéairement avec le time_cost argon2.
+        Le coût est borné par BCRYPT_ROUNDS_RANGE / ARGON2_TIME_COST_RANGE.
+        """
+        # Premier appel: démarrage du pool, non mesuré
+        await self._submit(_hash, secrets.token_urlsafe(16))
+        start = time.perf_counter()
+        await self._submit(_hash, secrets.token_urlsafe(16))
+        measured_ms = (time.perf_counter() - start) * 1000
+
+        rounds = self.policy.rounds
+        if self.policy.scheme == "bcrypt":
+            low, high = BCRYPT_ROUNDS_RANGE
+            rounds += math.floor(math.log2(target_ms / measured_ms))
+        else:
+            low, high = ARGON2_TIME_COST_RANGE
+            rounds = math.floor(rounds * target_ms / measured_ms)
+        rounds = min(max(rounds, low), high)
+
+        self.calibration = {
+            "target_ms": target_ms,
+            "measured_ms": round(measured_ms, 1),
+            "measured_rounds": self.policy.rounds,
+            "rounds": rounds,
+        }
+        logger.info(
+            f"Password hashing calibrated: {self.policy.scheme} rounds={rounds} "
+            f"({measured_ms:.0f} ms at rounds={self.policy.rounds}, target {target_ms:.0f} ms)"
+        )
+        if rounds != self.policy.rounds:
+            self.set_policy(self.policy.with_rounds(rounds))
+        return self.policy
+
+    async def dummy_verify(self, password: str) -> bool:
+        """
+        Vérification au coût d'une vraie pour un compte inexistant (toujours False)
+
+        Un email inconnu ne doit pas répondre plus vite qu'un mauvais mot de passe.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(secrets.token_urlsafe(16))
+        await self.verify(password, self._dummy_hash)
+        return False
+
+    def snapshot(self) -> dict:
+        """État du pool et compteurs"""
+        return {
+            "workers": self.workers,
+            "policy": self.policy.__dict__,
+            "calibration": self.calibration,
+            "max_pending": self.max_pending,
+            # Opérations en attente d'un processus libre
+            "queue_depth": max(0, self.metrics.pending - max(self.workers, 1)),
+            **self.metrics.__dict__,
+        }
+
+    def shutdown(self) -> None:
+        """Arrêter le pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    policy=HashPolicy.from_settings(settings),
+)
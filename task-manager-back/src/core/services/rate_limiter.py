@@ -0,0 +1,217 @@
+"""
+Limitation de débit par fenêtres glissantes (tentatives de connexion)
+"""
+
+import hashlib
+import math
+import time
+from abc import ABC, abstractmethod
+from config.settings import settings
+from core.errors.base import RateLimitError
+from core.services.ttl_cache import TTLCache
+
+
+class RateLimitStorage(ABC):
+    """
+    Stockage des compteurs de débit
+
+    L'implémentation mémoire limite chaque worker séparément; une
+    implémentation partagée (Redis, etc.) applique les limites à
+    l'ensemble des workers.
+    """
+
+    @abstractmethod
+    async def incr(self, key: str, expires_at: float, amount: int = 1) -> int:
+        """Incrémenter un compteur (créé à 0) et retourner sa nouvelle valeur (atomique)"""
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[int]:
+        """Valeurs de plusieurs compteurs (0 si absent ou expiré)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, keys: list[str]) -> None:
+        """Supprimer des compteurs"""
+        pass
+
+
+class MemoryRateLimitStorage(RateLimitStorage):
+    """Compteurs en mémoire du worker (LRU borné)"""
+
+    def __init__(self, max_keys: int, max_ttl: float):
+        self._counters: TTLCache[str, int] = TTLCache(max_size=max_keys, ttl=max_ttl)
+
+    async def incr(self, key: str, expires_at: float, amount: int = 1) -> int:
+        # Sans await entre lecture et écriture: atomique dans la boucle du worker
+        value = (self._counters.get(key) or 0) + amount
+        self._counters.set(key, value, expires_at=expires_at)
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[int]:
+        return [self._counters.get(key) or 0 for key in keys]
+
+    async def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self._counters.invalidate(key)
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class SlidingWindowLimiter:
+    """
+    Au plus `limit` événements par `window` secondes glissantes
+
+    Approximation à deux compteurs: le compteur de la fenêtre précédente
+    est pondéré par la part de celle-ci encore couverte par la fenêtre
+    glissante. Deux clés par sujet, quel que soit le débit.
+    """
+
+    def __init__(self, storage: RateLimitStorage, name: str, limit: int, window: int):
+        self.storage = storage
+        self.name = name
+        self.limit = limit
+        self.window = window
+
+    def _keys(self, subject: str, window_id: int) -> tuple[str, str]:
+        prefix = f"{self.name}:{subject}:"
+        return prefix + str(window_id), prefix + str(window_id - 1)
+
+    def _wait(self, current: int, previous: int, elapsed: float) -> int:
+        """Secondes d'attente pour des compteurs donnés (0: événement autorisé)"""
+        if previous * (1 - elapsed / self.window) + current < self.limit:
+            return 0
+        if current < self.limit:
+            # Attendre que le poids de la fenêtre précédente décroisse assez
+            wait = self.window * (1 - (self.limit - current) / previous) - elapsed
+        else:
+            # La fenêtre courante devient la précédente et doit décroître à son tour
+            wait = self.window - elapsed + self.window * (1 - self.limit / current)
+        # À l'échéance exacte, le total pondéré égale encore la limite: arrondi au-delà
+        return max(1, math.floor(wait) + 1)
+
+    async def retry_after(self, subject: str) -> int:
+        """Secondes avant le prochain événement autorisé (0: autorisé maintenant)"""
+        if self.limit <= 0:
+            return 0
+        now = time.time()
+        window_id = int(now // self.window)
+        current, previous = await self.storage.get_many(list(self._keys(subject, window_id)))
+        return self._wait(current, previous, now - window_id * self.window)
+
+    async def acquire(self, subject: str) -> int:
+        """
+        Vérifier et compter un événement en une seule étape
+
+        Le compteur est incrémenté avant la décision: des requêtes simultanées
+        ne peuvent pas toutes passer la vérification. Un événement refusé
+        n'est pas compté.
+
+        Returns:
+            0 si l'événement est accepté (et compté), sinon les secondes d'attente
+        """
+        if self.limit <= 0:
+            return 0
+        now = time.time()
+        window_id = int(now // self.window)
+        current_key, previous_key = self._keys(subject, window_id)
+        expires_at = (window_id + 2) * self.window
+        current = await self.storage.incr(current_key, expires_at=expires_at)
+        (previous,) = await self.storage.get_many([previous_key])
+        wait = self._wait(current - 1, previous, now - window_id * self.window)
+        if wait:
+            await self.storage.incr(current_key, expires_at=expires_at, amount=-1)
+        return wait
+
+    async def hit(self, subject: str) -> None:
+        """Enregistrer un événement"""
+        if self.limit <= 0:
+            return
+        window_id = int(time.time() // self.window)
+        current_key, _ = self._keys(subject, window_id)
+        await self.storage.incr(current_key, expires_at=(window_id + 2) * self.window)
+
+    async def reset(self, subject: str) -> None:
+        """Oublier les événements d'un sujet"""
+        if self.limit <= 0:
+            return
+        window_id = int(time.time() // self.window)
+        await self.storage.delete(list(self._keys(subject, window_id)))
+
+
+class LoginThrottle:
+    """
+    Limitation des tentatives de connexion, avant tout hashage
+
+    - par IP: toutes les tentatives (bourrage d'identifiants)
+    - par email: les échecs seulement, remis à zéro par une connexion réussie.
+      La tentative est comptée comme un échec avant la vérification du mot de
+      passe, puis libérée si la connexion réussit.
+    """
+
+    def __init__(self, storage: RateLimitStorage):
+        self.storage = storage
+        self.by_ip = SlidingWindowLimiter(
+            storage, "login:ip", settings.auth_login_ip_limit, settings.auth_login_ip_window
+        )
+        self.by_email = SlidingWindowLimiter(
+            storage, "login:email", settings.auth_login_email_limit, settings.auth_login_email_window
+        )
+        self.rejected_ip = 0
+        self.rejected_email = 0
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        """Empreinte de l'email (pas d'adresse en clair dans le stockage)"""
+        return hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
+
+    async def check(self, ip: str | None, email: str) -> None:
+        """
+        Vérifier les limites et réserver la tentative
+
+        La tentative compte pour l'IP et comme un échec pour l'email jusqu'à
+        record_success: une rafale simultanée sur un même email ne dépasse pas
+        la limite, même si aucun mot de passe n'a encore été vérifié.
+
+        Raises:
+            RateLimitError: Limite atteinte pour l'IP ou l'email
+        """
+        if ip is not None:
+            retry_after = await self.by_ip.acquire(ip)
+            if retry_after:
+                self.rejected_ip += 1
+                raise RateLimitError(
+                    message="Trop de tentatives de connexion, réessayez plus tard",
+                    retry_after=retry_after,
+                )
+        retry_after = await self.by_email.acquire(self._email_key(email))
+        if retry_after:
+            self.rejected_email += 1
+            raise RateLimitError(
+                message="Trop de tentatives de connexion, réessayez plus tard",
+                retry_after=retry_after,
+            )
+
+    async def record_success(self, email: str) -> None:
+        """Connexion réussie: libérer la tentative et remettre à zéro les échecs de cet email"""
+        await self.by_email.reset(self._email_key(email))
+
+    def snapshot(self) -> dict:
+        """Compteurs de rejets"""
+        return {
+            "ip_limit": self.by_ip.limit,
+            "ip_window": self.by_ip.window,
+            "email_limit": self.by_email.limit,
+            "email_window": self.by_email.window,
+            "rejected_ip": self.rejected_ip,
+            "rejected_email": self.rejected_email,
+        }
+
+
+login_throttle = LoginThrottle(
+    MemoryRateLimitStorage(
+        max_keys=settings.auth_rate_limit_max_keys,
+        max_ttl=2 * max(settings.auth_login_ip_window, settings.auth_login_email_window),
+    )
+)
@@ -0,0 +1,122 @@
+"""
+Registre des tokens révoqués (logout, rotation des refresh tokens)
+"""
+
+import heapq
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from config.settings import settings
+from core.entities.revoked_token import RevokedToken
+from core.repositories.revoked_token_repository import RevokedTokenRepository
+from core.valueObjects.token_claims import TokenClaims
+
+
+class RevocationStore:
+    """
+    Ensemble en mémoire des jti/sid révoqués, devant la table revoked_token
+
+    La vérification d'un token est une recherche dans un dict (O(1), sans
+    requête). Chaque entrée est purgée à l'expiration de ce qu'elle révoque.
+    Les révocations des autres workers sont importées périodiquement depuis
+    la base (voir infrastructure.workers.revocation_sync).
+    """
+
+    def __init__(self):
+        self._revoked: dict[str, float] = {}
+        self._expirations: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self.reuse_detected = 0
+
+    def add(self, key: str, expires_at: float) -> None:
+        """Ajouter un jti ou un sid révoqué jusqu'à expires_at (timestamp)"""
+        with self._lock:
+            if self._revoked.get(key, 0) >= expires_at:
+                return
+            self._revoked[key] = expires_at
+            heapq.heappush(self._expirations, (expires_at, key))
+        self.prune()
+
+    def is_revoked(self, claims: TokenClaims) -> bool:
+        """Le token ou sa session sont-ils révoqués?"""
+        return (
+            (claims.jti is not None and claims.jti in self._revoked)
+            or (claims.sid is not None and claims.sid in self._revoked)
+        )
+
+    def prune(self, now: float | None = None) -> int:
+        """Supprimer les entrées expirées"""
+        now = time.time() if now is None else now
+        pruned = 0
+        with self._lock:
+            while self._expirations and self._expirations[0][0] <= now:
+                expires_at, key = heapq.heappop(self._expirations)
+                if self._revoked.get(key) == expires_at:
+                    del self._revoked[key]
+                    pruned += 1
+        return pruned
+
+    async def revoke(
+        self, repository: RevokedTokenRepository, key: str, expires_at: datetime
+    ) -> bool:
+        """
+        Révoquer un jti ou un sid (base puis mémoire)
+
+        Returns:
+            False si la révocation existait déjà en base
+        """
+        created = await repository.revoke(RevokedToken(jti=key, expires_at=expires_at))
+        self.add(key, expires_at.timestamp())
+        return created
+
+    async def revoke_session(self, repository: RevokedTokenRepository, claims: TokenClaims) -> bool:
+        """
+        Révoquer la session d'un token (tous les tokens de la même connexion)
+
+        Returns:
+            False si le token ne porte ni sid ni jti (émis avant la révocation):
+            il ne peut pas être révoqué
+        """
+        if claims.sid is None:
+            if claims.jti is None:
+                return False
+            await self.revoke(repository, claims.jti, claims.exp)
+            return True
+        # La session vit au plus aussi longtemps que le dernier refresh token émis
+        session_expires_at = datetime.now(timezone.utc) + timedelta(
+            days=settings.jwt_refresh_token_expire_days
+        )
+        await self.revoke(repository, claims.sid, session_expires_at)
+        return True
+
+    async def consume_refresh_token(
+        self, repository: RevokedTokenRepository, claims: TokenClaims
+    ) -> bool:
+        """
+        Consommer un refresh token (rotation)
+
+        Un refresh token ne sert qu'une fois: son jti est révoqué à l'usage.
+        Une deuxième présentation signale un vol: toute la session est révoquée.
+
+        Returns:
+            True si le token peut être échangé contre une nouvelle paire
+        """
+        if claims.jti is None or claims.sid is None:
+            return False
+        if claims.sid in self._revoked:
+            return False
+        if claims.jti in self._revoked or not await self.revoke(repository, claims.jti, claims.exp):
+            self.reuse_detected += 1
+            await self.revoke_session(repository, claims)
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def snapshot(self) -> dict:
+        """Taille et compteurs"""
+        return {"size": len(self._revoked), "reuse_detected": self.reuse_detected}
+
+
+revocation_store = RevocationStore()
@@ -2,10 +2,13 @@
 Use Case: Connexion d'un utilisateur
 """
 
+from collections.abc import Callable
 from core.useCase.base import UseCase
 from core.dto.auth_dto import LoginDTO, TokenDTO
+from core.entities.user import User
 from core.repositories.user_repository import UserRepository
 from core.services.auth_service import AuthService
+from core.services.password_hasher import password_hasher
 from core.valueObjects.email import Email
 from core.errors.user_errors import InvalidCredentialsError
 
@@ -18,12 +21,18 @@ class LoginUseCase(UseCase[LoginDTO, TokenDTO]):
     - L'email doit exister
     - Le mot de passe doit correspondre
     - Génère un access token et un refresh token
+    - Un hash obsolète (algorithme ou coût) est confié à `schedule_rehash`
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        schedule_rehash: Callable[[User, str], None] | None = None,
+    ):
         self.user_repository = user_repository
+        self.schedule_rehash = schedule_rehash
 
-    def execute(self, input_dto: LoginDTO) -> TokenDTO:
+    async def execute(self, input_dto: LoginDTO) -> TokenDTO:
         """
         Connecter un utilisateur
 
@@ -40,17 +49,20 @@ class LoginUseCase(UseCase[LoginDTO, TokenDTO]):
         email = Email.from_string(input_dto.email)
 
         # Trouver l'utilisateur
-        user = self.user_repository.find_by_email(email.value)
+        user = await self.user_repository.find_by_email(email.value)
         if user is None:
             raise InvalidCredentialsError()
 
         # Vérifier le mot de passe
-        if not AuthService.verify_password(input_dto.password, user.password):
+        if not await password_hasher.verify(input_dto.password, user.password):
             raise InvalidCredentialsError()
 
+        # Remplacer le hash hors du chemin de la requête
+        if self.schedule_rehash is not None:
+            self.schedule_rehash(user, input_dto.password)
+
         # Générer les tokens
-        access_token = AuthService.create_access_token(user)
-        refresh_token = AuthService.create_refresh_token(user)
+        access_token, refresh_token = AuthService.create_token_pair(user)
 
         return TokenDTO(
             access_token=access_token,
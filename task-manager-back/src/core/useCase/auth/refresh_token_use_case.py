@@ -5,7 +5,9 @@ Use Case: Rafraîchir le token d'accès
 from core.useCase.base import UseCase
 from core.dto.auth_dto import RefreshTokenDTO, TokenDTO
 from core.repositories.user_repository import UserRepository
+from core.repositories.revoked_token_repository import RevokedTokenRepository
 from core.services.auth_service import AuthService
+from core.services.revocation_store import revocation_store
 from core.errors.base import AuthenticationError
 from core.errors.user_errors import UserNotFoundError
 
@@ -18,12 +20,18 @@ class RefreshTokenUseCase(UseCase[RefreshTokenDTO, TokenDTO]):
     - Le refresh token doit être valide
     - Le refresh token ne doit pas être expiré
     - L'utilisateur doit exister
+    - Le refresh token n'est utilisable qu'une fois (une réutilisation révoque la session)
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        revoked_token_repository: RevokedTokenRepository,
+    ):
         self.user_repository = user_repository
+        self.revoked_token_repository = revoked_token_repository
 
-    def execute(self, input_dto: RefreshTokenDTO) -> TokenDTO:
+    async def execute(self, input_dto: RefreshTokenDTO) -> TokenDTO:
         """
         Rafraîchir le token d'accès
 
@@ -37,36 +45,30 @@ class RefreshTokenUseCase(UseCase[RefreshTokenDTO, TokenDTO]):
             AuthenticationError: Si le refresh token est invalide
             UserNotFoundError: Si l'utilisateur n'existe plus
         """
-        # Vérifier que c'est bien un refresh token
-        if not AuthService.is_refresh_token(input_dto.refresh_token):
-            raise AuthenticationError(
-                message="Token invalide",
-                code="INVALID_TOKEN_TYPE"
-            )
-
-        # Vérifier si le token est expiré
-        if AuthService.is_token_expired(input_dto.refresh_token):
+        # Vérifier le refresh token (signature, expiration et type) en un seul décodage
+        claims = AuthService.verify_token(
+            input_dto.refresh_token, expected_type="refresh", use_cache=False
+        )
+        if claims is None:
             raise AuthenticationError(
-                message="Refresh token expiré",
-                code="TOKEN_EXPIRED"
+                message="Refresh token invalide ou expiré",
+                code="INVALID_TOKEN"
             )
 
-        # Récupérer l'ID utilisateur du token
-        user_id = AuthService.get_user_id_from_token(input_dto.refresh_token)
-        if user_id is None:
+        # Rotation: usage unique, une réutilisation révoque toute la session
+        if not await revocation_store.consume_refresh_token(self.revoked_token_repository, claims):
             raise AuthenticationError(
-                message="Token invalide",
-                code="INVALID_TOKEN"
+                message="Refresh token révoqué ou déjà utilisé",
+                code="TOKEN_REVOKED"
             )
 
         # Trouver l'utilisateur
-        user = self.user_repository.find_by_id(user_id)
+        user = await self.user_repository.find_by_id(claims.user_id)
         if user is None:
             raise UserNotFoundError()
 
         # Générer de nouveaux tokens
-        access_token = AuthService.create_access_token(user)
-        refresh_token = AuthService.create_refresh_token(user)
+        access_token, refresh_token = AuthService.create_token_pair(user, session_id=claims.sid)
 
         return TokenDTO(
             access_token=access_token,
@@ -9,7 +9,7 @@ from core.dto.auth_dto import RegisterDTO
 from core.dto.user_dto import UserResponseDTO
 from core.entities.user import User
 from core.repositories.user_repository import UserRepository
-from core.services.auth_service import AuthService
+from core.services.password_hasher import password_hasher
 from core.valueObjects.email import Email
 from core.valueObjects.password import Password
 from core.errors.user_errors import UserAlreadyExistsError
@@ -30,7 +30,7 @@ class RegisterUseCase(UseCase[RegisterDTO, UserResponseDTO]):
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def execute(self, input_dto: RegisterDTO) -> UserResponseDTO:
+    async def execute(self, input_dto: RegisterDTO) -> UserResponseDTO:
         """
         Inscrire un nouvel utilisateur
 
@@ -51,7 +51,7 @@ class RegisterUseCase(UseCase[RegisterDTO, UserResponseDTO]):
         password = Password.from_string(input_dto.password)
 
         # Vérifier que l'email n'existe pas
-        existing_user = self.user_repository.find_by_email(email.value)
+        existing_user = await self.user_repository.find_by_email(email.value)
         if existing_user is not None:
             raise UserAlreadyExistsError()
 
@@ -62,7 +62,7 @@ class RegisterUseCase(UseCase[RegisterDTO, UserResponseDTO]):
             first_name=input_dto.first_name,
             last_name=input_dto.last_name,
             email=email.value,
-            password=AuthService.hash_password(password.value),
+            password=await password_hasher.hash(password.value),
             verified=False,
             role=input_dto.role,
             created_at=now,
@@ -70,7 +70,7 @@ class RegisterUseCase(UseCase[RegisterDTO, UserResponseDTO]):
         )
 
         # Sauvegarder
-        saved_user = self.user_repository.save(user)
+        saved_user = await self.user_repository.save(user)
 
         # Retourner le DTO de réponse
         return map_user_entity_to_response(saved_user)
@@ -18,7 +18,7 @@ class UseCase(ABC, Generic[InputDTO, OutputDTO]):
     """
 
     @abstractmethod
-    def execute(self, input_dto: InputDTO) -> OutputDTO:
+    async def execute(self, input_dto: InputDTO) -> OutputDTO:
         """
         Exécuter le use case
 
@@ -3,16 +3,19 @@ Use Case: Accepter une invitation
 """
 
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from core.useCase.base import UseCase
 from core.dto.invitation_dto import InviteAcceptDTO
 from core.dto.auth_dto import TokenDTO
 from core.entities.user import User, UserRole
 from core.entities.assign import Assign
+from core.entities.outbox_email import OutboxEmail, OutboxEmailKind
+from core.repositories.email_outbox_repository import EmailOutboxRepository
 from core.repositories.invitation_repository import InvitationRepository
 from core.repositories.user_repository import UserRepository
 from core.repositories.assign_repository import AssignRepository
 from core.services.auth_service import AuthService
+from core.services.password_hasher import password_hasher
 from core.valueObjects.password import Password
 from core.errors.user_errors import UserAlreadyExistsError
 from core.errors.invitation_errors import (
@@ -20,7 +23,7 @@ from core.errors.invitation_errors import (
     InvitationExpiredError,
     InvitationAlreadyAcceptedError,
 )
-from infrastructure.external.email_service import EmailService
+from infrastructure.workers.email_outbox import email_outbox_worker
 
 
 class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
@@ -33,6 +36,7 @@ class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
     - L'invitation ne doit pas déjà être acceptée
     - Crée un nouveau compte utilisateur
     - Assigne automatiquement la tâche
+    - Enregistre l'email de bienvenue dans l'outbox (envoi en tâche de fond)
     - Retourne les tokens pour connexion immédiate
     """
 
@@ -41,13 +45,14 @@ class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
         invitation_repository: InvitationRepository,
         user_repository: UserRepository,
         assign_repository: AssignRepository,
+        email_outbox_repository: EmailOutboxRepository,
     ):
         self.invitation_repository = invitation_repository
         self.user_repository = user_repository
         self.assign_repository = assign_repository
-        self.email_service = EmailService()
+        self.email_outbox_repository = email_outbox_repository
 
-    def execute(self, input_dto: InviteAcceptDTO) -> TokenDTO:
+    async def execute(self, input_dto: InviteAcceptDTO) -> TokenDTO:
         """
         Accepter une invitation
 
@@ -64,7 +69,7 @@ class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
             UserAlreadyExistsError: Si l'email est déjà utilisé
         """
         # Trouver l'invitation
-        invitation = self.invitation_repository.find_by_token(input_dto.token)
+        invitation = await self.invitation_repository.find_by_token(input_dto.token)
         if invitation is None:
             raise InvitationNotFoundError()
 
@@ -77,7 +82,7 @@ class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
             raise InvitationExpiredError()
 
         # Vérifier que l'email n'est pas déjà utilisé
-        existing_user = self.user_repository.find_by_email(invitation.email)
+        existing_user = await self.user_repository.find_by_email(invitation.email)
         if existing_user is not None:
             raise UserAlreadyExistsError()
 
@@ -85,20 +90,28 @@ class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
         password = Password.from_string(input_dto.password)
 
         # Créer l'utilisateur
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         new_user = User(
             id=uuid4(),
             first_name=input_dto.first_name,
             last_name=input_dto.last_name,
             email=invitation.email,
-            password=AuthService.hash_password(password.value),
+            password=await password_hasher.hash(password.value),
             verified=True,  # Vérifié car invité par un OWNER
             role=UserRole.MEMBER,
             created_at=now,
             updated_at=now,
         )
 
-        saved_user = self.user_repository.save(new_user)
+        # Email de bienvenue: enregistré dans la transaction de l'utilisateur
+        await self.email_outbox_repository.add(OutboxEmail(
+            id=uuid4(),
+            kind=OutboxEmailKind.WELCOME,
+            to_email=new_user.email,
+            payload={"first_name": new_user.first_name},
+        ))
+
+        saved_user = await self.user_repository.save(new_user)
 
         # Créer l'assignation
         assign = Assign(
@@ -106,21 +119,15 @@ class AcceptInvitationUseCase(UseCase[InviteAcceptDTO, TokenDTO]):
             task_id=invitation.task_id,
             user_id=saved_user.id,
         )
-        self.assign_repository.save(assign)
+        await self.assign_repository.save(assign)
 
         # Marquer l'invitation comme acceptée
         invitation.accepted = True
-        self.invitation_repository.update(invitation)
-
-        # Envoyer l'email de bienvenue
-        self.email_service.send_welcome_email(
-            to_email=saved_user.email,
-            first_name=saved_user.first_name,
-        )
+        await self.invitation_repository.update(invitation)
+        email_outbox_worker.wake()
 
         # Générer les tokens
-        access_token = AuthService.create_access_token(saved_user)
-        refresh_token = AuthService.create_refresh_token(saved_user)
+        access_token, refresh_token = AuthService.create_token_pair(saved_user)
 
         return TokenDTO(
             access_token=access_token,
@@ -3,12 +3,14 @@ Use Case: Créer une invitation
 """
 
 from uuid import uuid4
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 from core.useCase.base import UseCase
 from core.dto.invitation_dto import InviteCreateDTO, InvitationResponseDTO
 from core.entities.invitation import Invitation
+from core.entities.outbox_email import OutboxEmail, OutboxEmailKind
 from core.entities.user import User
+from core.repositories.email_outbox_repository import EmailOutboxRepository
 from core.repositories.invitation_repository import InvitationRepository
 from core.repositories.user_repository import UserRepository
 from core.repositories.task_repository import TaskRepository
@@ -17,7 +19,7 @@ from core.valueObjects.token import Token
 from core.errors.user_errors import UserAlreadyExistsError
 from core.errors.task_errors import TaskNotFoundError
 from core.errors.invitation_errors import InvitationAlreadyExistsError
-from infrastructure.external.email_service import EmailService
+from infrastructure.workers.email_outbox import email_outbox_worker
 from interface.http.mappers.invitation_mapper import map_invitation_entity_to_response
 
 
@@ -37,6 +39,8 @@ class CreateInvitationUseCase(UseCase[CreateInvitationInput, InvitationResponseD
     - La tâche doit exister
     - Il ne doit pas y avoir d'invitation en attente pour cet email et cette tâche
     - L'invitation expire après 7 jours
+    - L'email d'invitation est enregistré dans l'outbox, dans la transaction
+      de l'invitation, puis envoyé en tâche de fond
     """
 
     def __init__(
@@ -44,13 +48,14 @@ class CreateInvitationUseCase(UseCase[CreateInvitationInput, InvitationResponseD
         invitation_repository: InvitationRepository,
         user_repository: UserRepository,
         task_repository: TaskRepository,
+        email_outbox_repository: EmailOutboxRepository,
     ):
         self.invitation_repository = invitation_repository
         self.user_repository = user_repository
         self.task_repository = task_repository
-        self.email_service = EmailService()
+        self.email_outbox_repository = email_outbox_repository
 
-    def execute(self, input_dto: CreateInvitationInput) -> InvitationResponseDTO:
+    async def execute(self, input_dto: CreateInvitationInput) -> InvitationResponseDTO:
         """
         Créer une invitation
 
@@ -72,28 +77,28 @@ class CreateInvitationUseCase(UseCase[CreateInvitationInput, InvitationResponseD
         email = Email.from_string(dto.email)
 
         # Vérifier que la tâche existe
-        task = self.task_repository.find_by_id(dto.task_id)
+        task = await self.task_repository.find_by_id(dto.task_id)
         if task is None:
             raise TaskNotFoundError()
 
         # Vérifier que l'utilisateur n'existe pas déjà
-        existing_user = self.user_repository.find_by_email(email.value)
+        existing_user = await self.user_repository.find_by_email(email.value)
         if existing_user is not None:
             raise UserAlreadyExistsError(
                 message="Un utilisateur avec cet email existe déjà. Assignez-le directement à la tâche."
             )
 
         # Vérifier s'il y a déjà une invitation en attente
-        existing_invitations = self.invitation_repository.find_by_email(email.value)
+        existing_invitations = await self.invitation_repository.find_by_email(email.value)
         for inv in existing_invitations:
             if inv.task_id == dto.task_id and inv.is_valid():
                 raise InvitationAlreadyExistsError()
 
         # Générer le token
-        token = Token.generate(length=32, expires_in=timedelta(days=7))
+        token = Token.generate(length=32)
 
         # Créer l'invitation
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         invitation = Invitation(
             id=uuid4(),
             email=email.value,
@@ -101,19 +106,23 @@ class CreateInvitationUseCase(UseCase[CreateInvitationInput, InvitationResponseD
             token=token.value,
             invited_by=current_user.id,
             accepted=False,
-            expires_at=token.expires_at,
+            expires_at=now + timedelta(days=7),
             created_at=now,
         )
 
-        saved_invitation = self.invitation_repository.save(invitation)
-
-        # Envoyer l'email
-        inviter_name = f"{current_user.first_name} {current_user.last_name}"
-        self.email_service.send_invitation_email(
+        # Email d'invitation: enregistré dans la transaction de l'invitation
+        await self.email_outbox_repository.add(OutboxEmail(
+            id=uuid4(),
+            kind=OutboxEmailKind.INVITATION,
             to_email=email.value,
-            inviter_name=inviter_name,
-            task_title=task.title,
-            invitation_token=token.value,
-        )
+            payload={
+                "inviter_name": f"{current_user.first_name} {current_user.last_name}",
+                "task_title": task.title,
+                "invitation_token": token.value,
+            },
+        ))
+
+        saved_invitation = await self.invitation_repository.save(invitation)
+        email_outbox_worker.wake()
 
         return map_invitation_entity_to_response(saved_invitation)
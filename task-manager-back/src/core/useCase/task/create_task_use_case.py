@@ -24,7 +24,7 @@ class CreateTaskUseCase(UseCase[TaskCreateDTO, TaskResponseDTO]):
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
-    def execute(self, input_dto: TaskCreateDTO) -> TaskResponseDTO:
+    async def execute(self, input_dto: TaskCreateDTO) -> TaskResponseDTO:
         """
         Créer une nouvelle tâche
 
@@ -49,5 +49,5 @@ class CreateTaskUseCase(UseCase[TaskCreateDTO, TaskResponseDTO]):
             updated_at=now,
         )
 
-        saved_task = self.task_repository.save(task)
+        saved_task = await self.task_repository.save(task)
         return map_task_entity_to_response(saved_task)
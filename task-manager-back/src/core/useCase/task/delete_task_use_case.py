@@ -20,7 +20,7 @@ class DeleteTaskUseCase(UseCase[UUID, bool]):
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
-    def execute(self, task_id: UUID) -> bool:
+    async def execute(self, task_id: UUID) -> bool:
         """
         Supprimer une tâche
 
@@ -33,9 +33,9 @@ class DeleteTaskUseCase(UseCase[UUID, bool]):
         Raises:
             TaskNotFoundError: Si la tâche n'existe pas
         """
-        task = self.task_repository.find_by_id(task_id)
+        task = await self.task_repository.find_by_id(task_id)
         if task is None:
             raise TaskNotFoundError()
 
-        self.task_repository.delete(task_id)
+        await self.task_repository.delete(task_id)
         return True
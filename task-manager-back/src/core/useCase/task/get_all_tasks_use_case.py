@@ -21,7 +21,7 @@ class GetAllTasksUseCase(UseCase[User, list[TaskResponseDTO]]):
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
-    def execute(self, current_user: User) -> list[TaskResponseDTO]:
+    async def execute(self, current_user: User) -> list[TaskResponseDTO]:
         """
         Récupérer les tâches selon le rôle
 
@@ -32,8 +32,8 @@ class GetAllTasksUseCase(UseCase[User, list[TaskResponseDTO]]):
             Liste des tâches accessibles
         """
         if current_user.role == UserRole.OWNER:
-            tasks = self.task_repository.find_all()
+            tasks = await self.task_repository.find_all()
         else:
-            tasks = self.task_repository.get_tasks_for_user(current_user.id)
+            tasks = await self.task_repository.get_tasks_for_user(current_user.id)
 
         return [map_task_entity_to_response(task) for task in tasks]
@@ -31,7 +31,7 @@ class GetTaskUseCase(UseCase[GetTaskInput, TaskResponseDTO]):
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
-    def execute(self, input_dto: GetTaskInput) -> TaskResponseDTO:
+    async def execute(self, input_dto: GetTaskInput) -> TaskResponseDTO:
         """
         Récupérer une tâche
 
@@ -45,7 +45,7 @@ class GetTaskUseCase(UseCase[GetTaskInput, TaskResponseDTO]):
             TaskNotFoundError: Si la tâche n'existe pas
             TaskAccessDeniedError: Si l'utilisateur n'a pas accès
         """
-        task = self.task_repository.find_by_id(input_dto.task_id)
+        task = await self.task_repository.find_by_id(input_dto.task_id)
         if task is None:
             raise TaskNotFoundError()
 
@@ -31,7 +31,7 @@ class GetUserTasksUseCase(UseCase[GetUserTasksInput, list[TaskResponseDTO]]):
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
-    def execute(self, input_dto: GetUserTasksInput) -> list[TaskResponseDTO]:
+    async def execute(self, input_dto: GetUserTasksInput) -> list[TaskResponseDTO]:
         """
         Récupérer les tâches d'un utilisateur
 
@@ -52,5 +52,5 @@ class GetUserTasksUseCase(UseCase[GetUserTasksInput, list[TaskResponseDTO]]):
                     code="ACCESS_DENIED"
                 )
 
-        tasks = self.task_repository.get_tasks_for_user(input_dto.user_id)
+        tasks = await self.task_repository.get_tasks_for_user(input_dto.user_id)
         return [map_task_entity_to_response(task) for task in tasks]
@@ -32,7 +32,7 @@ class UpdateTaskUseCase(UseCase[UpdateTaskInput, TaskResponseDTO]):
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
-    def execute(self, input_dto: UpdateTaskInput) -> TaskResponseDTO:
+    async def execute(self, input_dto: UpdateTaskInput) -> TaskResponseDTO:
         """
         Mettre à jour une tâche
 
@@ -45,7 +45,7 @@ class UpdateTaskUseCase(UseCase[UpdateTaskInput, TaskResponseDTO]):
         Raises:
             TaskNotFoundError: Si la tâche n'existe pas
         """
-        task = self.task_repository.find_by_id(input_dto.task_id)
+        task = await self.task_repository.find_by_id(input_dto.task_id)
         if task is None:
             raise TaskNotFoundError()
 
@@ -69,5 +69,7 @@ class UpdateTaskUseCase(UseCase[UpdateTaskInput, TaskResponseDTO]):
 
         task.updated_at = datetime.utcnow()
 
-        updated_task = self.task_repository.update(task)
+        updated_task = await self.task_repository.update(task)
+        if updated_task is None:
+            raise TaskNotFoundError()
         return map_task_entity_to_response(updated_task)
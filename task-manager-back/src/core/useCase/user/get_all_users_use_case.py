@@ -16,12 +16,12 @@ class GetAllUsersUseCase(UseCase[None, list[UserResponseDTO]]):
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def execute(self, input_dto: None = None) -> list[UserResponseDTO]:
+    async def execute(self, input_dto: None = None) -> list[UserResponseDTO]:
         """
         Récupérer tous les utilisateurs
 
         Returns:
             Liste des utilisateurs
         """
-        users = self.user_repository.find_all()
+        users = await self.user_repository.find_all()
         return [map_user_entity_to_response(user) for user in users]
@@ -18,7 +18,7 @@ class GetUserUseCase(UseCase[UUID, UserResponseDTO]):
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def execute(self, user_id: UUID) -> UserResponseDTO:
+    async def execute(self, user_id: UUID) -> UserResponseDTO:
         """
         Récupérer un utilisateur
 
@@ -31,7 +31,7 @@ class GetUserUseCase(UseCase[UUID, UserResponseDTO]):
         Raises:
             UserNotFoundError: Si l'utilisateur n'existe pas
         """
-        user = self.user_repository.find_by_id(user_id)
+        user = await self.user_repository.find_by_id(user_id)
         if user is None:
             raise UserNotFoundError()
 
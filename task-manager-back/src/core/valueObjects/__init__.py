@@ -5,5 +5,8 @@ Value Objects - Objets immuables avec validation intégrée
 from core.valueObjects.email import Email
 from core.valueObjects.password import Password
 from core.valueObjects.token import Token
+from core.valueObjects.token_claims import TokenClaims
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 
-__all__ = ["Email", "Password", "Token"]
+__all__ = ["Email", "Password", "Token", "TokenClaims", "Cursor", "Page"]
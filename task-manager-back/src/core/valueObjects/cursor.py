@@ -0,0 +1,52 @@
+"""
+Value Object pour Cursor (pagination par clé)
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+from core.errors.base import ValidationError
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Value Object représentant une position dans une liste triée par (created_at, id)
+
+    Le client le manipule sous forme opaque (base64 URL-safe) et le renvoie
+    tel quel pour obtenir la page suivante.
+
+    Attributes:
+        created_at: Date de création du dernier élément de la page
+        id: ID du dernier élément de la page
+
+    Raises:
+        ValidationError: Si le curseur encodé est invalide
+    """
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """Encoder le curseur en chaîne opaque"""
+        raw = f"{self.created_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        """Décoder un curseur opaque"""
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            created_at, id = raw.split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(id))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError(
+                message="Curseur de pagination invalide",
+                code="INVALID_CURSOR",
+                field="cursor"
+            )
+
+    def __str__(self) -> str:
+        return self.encode()
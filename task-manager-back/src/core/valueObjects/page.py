@@ -0,0 +1,33 @@
+"""
+Value Object pour Page (résultat paginé par curseur)
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+from core.valueObjects.cursor import Cursor
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    Value Object représentant une page de résultats
+
+    Attributes:
+        items: Les éléments de la page
+        next_cursor: Curseur de la page suivante (None si dernière page)
+        total: Nombre total d'éléments (None si non demandé)
+    """
+    items: list[T]
+    next_cursor: Cursor | None = None
+    total: int | None = None
+
+    def map(self, mapper: Callable[[T], U]) -> "Page[U]":
+        """Transformer les éléments en conservant la pagination"""
+        return Page(
+            items=[mapper(item) for item in self.items],
+            next_cursor=self.next_cursor,
+            total=self.total,
+        )
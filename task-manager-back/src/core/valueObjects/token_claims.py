@@ -0,0 +1,61 @@
+"""
+Value Object pour TokenClaims (claims JWT vérifiés)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import UUID
+from core.errors.base import ValidationError
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """
+    Value Object représentant les claims d'un JWT dont la signature a été vérifiée
+
+    Attributes:
+        sub: ID de l'utilisateur
+        type: Type de token ("access" ou "refresh")
+        exp: Date d'expiration (UTC)
+        jti: Identifiant unique du token (révocation)
+        sid: Identifiant de session, partagé par les tokens issus d'une même connexion
+        payload: Claims bruts
+
+    Raises:
+        ValidationError: Si les claims obligatoires sont absents ou invalides
+    """
+    sub: UUID
+    type: str
+    exp: datetime
+    jti: str | None = None
+    sid: str | None = None
+    payload: dict = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "TokenClaims":
+        """Construire les claims à partir d'un payload décodé"""
+        try:
+            return cls(
+                sub=UUID(payload["sub"]),
+                type=payload.get("type", "access"),
+                exp=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+                jti=payload.get("jti"),
+                sid=payload.get("sid"),
+                payload=payload,
+            )
+        except (KeyError, ValueError, TypeError):
+            raise ValidationError(
+                message="Claims du token invalides",
+                code="INVALID_TOKEN_CLAIMS",
+                field="token"
+            )
+
+    @property
+    def user_id(self) -> UUID:
+        """ID de l'utilisateur (claim sub)"""
+        return self.sub
+
+    @property
+    def is_expired(self) -> bool:
+        """Vérifier si le token est expiré"""
+        return datetime.now(timezone.utc) >= self.exp
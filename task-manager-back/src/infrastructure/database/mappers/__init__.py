@@ -8,7 +8,8 @@ from infrastructure.database.mappers.user_mappers import (
 )
 from infrastructure.database.mappers.task_mappers import (
     map_task_model_to_entity,
-    map_entity_to_task_model
+    map_entity_to_task_model,
+    map_entity_to_task_values,
 )
 from infrastructure.database.mappers.task_assignment_mappers import (
     map_task_assignment_model_to_entity,
@@ -18,14 +19,27 @@ from infrastructure.database.mappers.invitation_mappers import (
     map_invitation_model_to_entity,
     map_entity_to_invitation_model
 )
+from infrastructure.database.mappers.revoked_token_mappers import (
+    map_revoked_token_model_to_entity,
+    map_entity_to_revoked_token_model
+)
+from infrastructure.database.mappers.email_outbox_mappers import (
+    map_email_outbox_model_to_entity,
+    map_entity_to_email_outbox_model
+)
 
 __all__ = [
     "map_user_model_to_entity",
     "map_entity_to_user_model",
     "map_task_model_to_entity",
     "map_entity_to_task_model",
+    "map_entity_to_task_values",
     "map_task_assignment_model_to_entity",
     "map_entity_to_task_assignment_model",
     "map_invitation_model_to_entity",
     "map_entity_to_invitation_model",
+    "map_revoked_token_model_to_entity",
+    "map_entity_to_revoked_token_model",
+    "map_email_outbox_model_to_entity",
+    "map_entity_to_email_outbox_model",
 ]
@@ -0,0 +1,41 @@
+"""
+Mappers de la base de données
+"""
+
+from core.entities.outbox_email import OutboxEmail, OutboxEmailKind, OutboxStatus
+from infrastructure.database.models.emailOutboxModel import EmailOutboxModel
+
+def map_email_outbox_model_to_entity(email_outbox_model: EmailOutboxModel) -> OutboxEmail:
+    """
+    Mappage d'un modèle de la base de données à un entité
+    """
+    return OutboxEmail(
+        id=email_outbox_model.id,
+        kind=OutboxEmailKind(email_outbox_model.kind),
+        to_email=email_outbox_model.to_email,
+        payload=email_outbox_model.payload,
+        status=OutboxStatus(email_outbox_model.status),
+        attempts=email_outbox_model.attempts,
+        next_attempt_at=email_outbox_model.next_attempt_at,
+        last_error=email_outbox_model.last_error,
+        created_at=email_outbox_model.created_at,
+        sent_at=email_outbox_model.sent_at,
+    )
+
+def map_entity_to_email_outbox_model(entity: OutboxEmail) -> EmailOutboxModel:
+    """
+    Mappage d'une entité à un modèle de la base de données
+    """
+    model = EmailOutboxModel(
+        id=entity.id,
+        kind=entity.kind.value,
+        to_email=entity.to_email,
+        payload=entity.payload,
+        status=entity.status.value,
+        attempts=entity.attempts,
+        last_error=entity.last_error,
+    )
+    # Sinon: défaut côté serveur (envoi immédiat)
+    if entity.next_attempt_at is not None:
+        model.next_attempt_at = entity.next_attempt_at
+    return model
@@ -0,0 +1,32 @@
+"""
+Mappers de la base de données
+"""
+
+from datetime import datetime, timezone
+from core.entities.revoked_token import RevokedToken
+from infrastructure.database.models.revokedTokenModel import RevokedTokenModel
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Dates stockées en UTC: SQLite les relit sans fuseau"""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+def map_revoked_token_model_to_entity(revoked_token_model: RevokedTokenModel) -> RevokedToken:
+    """
+    Mappage d'un modèle de la base de données à un entité
+    """
+    return RevokedToken(
+        jti=revoked_token_model.jti,
+        expires_at=_as_utc(revoked_token_model.expires_at),
+        revoked_at=_as_utc(revoked_token_model.revoked_at),
+    )
+
+def map_entity_to_revoked_token_model(entity: RevokedToken) -> RevokedTokenModel:
+    """
+    Mappage d'une entité à un modèle de la base de données
+    """
+    return RevokedTokenModel(
+        jti=entity.jti,
+        expires_at=entity.expires_at,
+    )
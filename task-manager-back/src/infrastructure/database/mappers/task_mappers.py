@@ -42,3 +42,21 @@ def map_entity_to_task_model(entity: Task) -> TaskModel:
         created_at=entity.created_at,
         updated_at=entity.updated_at,
     )
+
+
+def map_entity_to_task_values(entity: Task) -> dict:
+    """
+    Mappage d'une entité Task vers les valeurs d'une ligne (INSERT groupé)
+    Note: assigned_to n'est pas mappé car géré via TaskAssignment
+    """
+    return {
+        "id": entity.id,
+        "title": entity.title,
+        "description": entity.description,
+        "status": entity.status,
+        "priority": entity.priority,
+        "start_date": entity.start_date,
+        "due_date": entity.due_date,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
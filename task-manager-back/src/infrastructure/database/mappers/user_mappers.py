@@ -19,6 +19,7 @@ def map_user_model_to_entity(user_model: UserModel) -> User:
         role=user_model.role,
         created_at=user_model.created_at,
         updated_at=user_model.updated_at,
+        token_version=user_model.token_version,
     )
 
 def map_entity_to_user_model(entity: User) -> UserModel:
@@ -35,4 +36,5 @@ def map_entity_to_user_model(entity: User) -> UserModel:
         role=entity.role,
         created_at=entity.created_at,
         updated_at=entity.updated_at,
+        token_version=entity.token_version,
     )
@@ -0,0 +1,72 @@
+"""
+Schéma initial (user, task, task_assignment, invitation)
+
+Une base créée auparavant par Base.metadata.create_all correspond à cette
+révision: la marquer avec `alembic stamp 0001` avant `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("first_name", sa.String(255), nullable=False),
+        sa.Column("last_name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("password", sa.String(255), nullable=False),
+        sa.Column("verified", sa.Boolean(), nullable=False),
+        sa.Column("role", sa.Enum("OWNER", "MEMBER", name="userrole"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_table(
+        "task",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.String(255), nullable=False),
+        sa.Column("status", sa.Enum("TODO", "IN_PROGRESS", "DONE", name="taskstatus"), nullable=False),
+        sa.Column("priority", sa.Enum("LOW", "MEDIUM", "HIGH", name="taskpriority"), nullable=False),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_table(
+        "task_assignment",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("task.id"), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("user.id"), nullable=False),
+    )
+    op.create_table(
+        "invitation",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("task.id"), nullable=False),
+        sa.Column("token", sa.String(255), nullable=False, unique=True),
+        sa.Column("invited_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("accepted", sa.Boolean(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("invitation")
+    op.drop_table("task_assignment")
+    op.drop_table("task")
+    op.drop_table("user")
+    for name in ("taskpriority", "taskstatus", "userrole"):
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,32 @@
+"""
+Pagination par curseur: task_assignment.created_at et index (created_at, id)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+TABLES = ("user", "task", "task_assignment", "invitation")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "task_assignment",
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    for table in TABLES:
+        op.create_index(f"ix_{table}_created_at_id", table, ["created_at", "id"])
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_created_at_id", table_name=table)
+    op.drop_column("task_assignment", "created_at")
@@ -0,0 +1,80 @@
+"""
+Index des colonnes de recherche et contraintes d'unicité
+
+- user: email unique sans tenir compte de la casse
+- task_assignment: (task_id, user_id) unique, index sur user_id
+- invitation: index sur lower(email) et (accepted, expires_at)
+
+Les doublons d'assignation existants sont supprimés avant la contrainte.
+Des emails utilisateur en doublon (à la casse près) font échouer la
+migration: ils doivent être fusionnés manuellement.
+
+SQLite (base de développement) ne connaît ni DELETE ... USING ni ALTER
+TABLE ADD CONSTRAINT: la table est recréée par batch_alter_table.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def _is_sqlite() -> bool:
+    return op.get_bind().dialect.name == "sqlite"
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uq_user_email_lower", "user", [sa.text("lower(email)")], unique=True
+    )
+
+    if _is_sqlite():
+        op.execute(
+            """
+            DELETE FROM task_assignment
+            WHERE EXISTS (
+                SELECT 1 FROM task_assignment b
+                WHERE b.task_id = task_assignment.task_id
+                  AND b.user_id = task_assignment.user_id
+                  AND (b.created_at < task_assignment.created_at
+                       OR (b.created_at = task_assignment.created_at
+                           AND b.id < task_assignment.id))
+            )
+            """
+        )
+    else:
+        op.execute(
+            """
+            DELETE FROM task_assignment a
+            USING task_assignment b
+            WHERE a.task_id = b.task_id
+              AND a.user_id = b.user_id
+              AND (a.created_at, a.id) > (b.created_at, b.id)
+            """
+        )
+    with op.batch_alter_table("task_assignment") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_task_assignment_task_user", ["task_id", "user_id"]
+        )
+    op.create_index("ix_task_assignment_user_id", "task_assignment", ["user_id"])
+
+    op.create_index("ix_invitation_email_lower", "invitation", [sa.text("lower(email)")])
+    op.create_index(
+        "ix_invitation_accepted_expires_at", "invitation", ["accepted", "expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invitation_accepted_expires_at", table_name="invitation")
+    op.drop_index("ix_invitation_email_lower", table_name="invitation")
+    op.drop_index("ix_task_assignment_user_id", table_name="task_assignment")
+    with op.batch_alter_table("task_assignment") as batch_op:
+        batch_op.drop_constraint("uq_task_assignment_task_user", type_="unique")
+    op.drop_index("uq_user_email_lower", table_name="user")
@@ -0,0 +1,32 @@
+"""
+revoked_token: révocation des tokens (logout, rotation des refresh tokens)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_token",
+        sa.Column("jti", sa.String(64), primary_key=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_revoked_token_expires_at", "revoked_token", ["expires_at"])
+    op.create_index("ix_revoked_token_revoked_at", "revoked_token", ["revoked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revoked_token_revoked_at", table_name="revoked_token")
+    op.drop_index("ix_revoked_token_expires_at", table_name="revoked_token")
+    op.drop_table("revoked_token")
@@ -0,0 +1,39 @@
+"""
+invitation: index partiel des invitations en attente, index de balayage des expirées
+
+L'index (accepted, expires_at) couvrait tout l'historique; il est remplacé
+par un index (created_at, id) limité aux invitations non acceptées, qui
+sert la liste paginée des invitations en attente.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_invitation_pending_created_at_id",
+        "invitation",
+        ["created_at", "id"],
+        postgresql_where=sa.text("accepted = false"),
+        sqlite_where=sa.text("accepted = 0"),
+    )
+    op.create_index("ix_invitation_expires_at", "invitation", ["expires_at"])
+    op.drop_index("ix_invitation_accepted_expires_at", table_name="invitation")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_invitation_accepted_expires_at", "invitation", ["accepted", "expires_at"]
+    )
+    op.drop_index("ix_invitation_expires_at", table_name="invitation")
+    op.drop_index("ix_invitation_pending_created_at_id", table_name="invitation")
@@ -7,5 +7,15 @@ from infrastructure.database.models.userModel import UserModel
 from infrastructure.database.models.taskModel import TaskModel
 from infrastructure.database.models.taskAssignment import TaskAssignmentModel
 from infrastructure.database.models.invitationModel import InvitationModel
+from infrastructure.database.models.revokedTokenModel import RevokedTokenModel
+from infrastructure.database.models.emailOutboxModel import EmailOutboxModel
 
-__all__ = ["Base", "UserModel", "TaskModel", "TaskAssignmentModel", "InvitationModel"]
+__all__ = [
+    "Base",
+    "UserModel",
+    "TaskModel",
+    "TaskAssignmentModel",
+    "InvitationModel",
+    "RevokedTokenModel",
+    "EmailOutboxModel",
+]
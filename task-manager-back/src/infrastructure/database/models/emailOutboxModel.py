@@ -0,0 +1,38 @@
+"""
+Modèle de la base de données EMAIL_OUTBOX
+"""
+
+import uuid
+
+from sqlalchemy import Column, String, DateTime, Index, Integer, JSON, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from infrastructure.database.models.base import Base
+
+
+class EmailOutboxModel(Base):
+    """
+    Modèle de la base de données EMAIL_OUTBOX
+    """
+
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)
+    to_email = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String(16), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Réclamation des emails à envoyer (status = pending, next_attempt_at <= now)
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    # Récupère created_at / next_attempt_at (défauts côté serveur) via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
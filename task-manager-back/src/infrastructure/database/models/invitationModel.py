@@ -3,9 +3,9 @@ Modèle de la base de données INVITATION
 """
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from infrastructure.database.models.base import Base
@@ -13,7 +13,7 @@ from infrastructure.database.models.base import Base
 
 def default_expiration():
     """Expiration par défaut : 7 jours"""
-    return datetime.utcnow() + timedelta(days=7)
+    return datetime.now(timezone.utc) + timedelta(days=7)
 
 
 class InvitationModel(Base):
@@ -31,3 +31,20 @@ class InvitationModel(Base):
     accepted = Column(Boolean, default=False, nullable=False)
     expires_at = Column(DateTime(timezone=True), default=default_expiration, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Recherche par email sans tenir compte de la casse
+        Index("ix_invitation_email_lower", func.lower(email)),
+        # Invitations en attente: index partiel, ne grossit pas avec l'historique accepté
+        Index(
+            "ix_invitation_pending_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=accepted == False,
+            sqlite_where=accepted == False,
+        ),
+        # Pagination par curseur sur (created_at, id)
+        Index("ix_invitation_created_at_id", "created_at", "id"),
+        # Balayage des invitations expirées
+        Index("ix_invitation_expires_at", "expires_at"),
+    )
@@ -0,0 +1,29 @@
+"""
+Modèle de la base de données REVOKED_TOKEN
+"""
+
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.sql import func
+from infrastructure.database.models.base import Base
+
+
+class RevokedTokenModel(Base):
+    """
+    Modèle de la base de données REVOKED_TOKEN
+    """
+
+    __tablename__ = "revoked_token"
+
+    jti = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Purge des révocations expirées
+        Index("ix_revoked_token_expires_at", "expires_at"),
+        # Synchronisation incrémentale entre workers
+        Index("ix_revoked_token_revoked_at", "revoked_at"),
+    )
+
+    # Récupère revoked_at (défaut côté serveur) via RETURNING: pas de lazy-load en asynchrone
+    __mapper_args__ = {"eager_defaults": True}
@@ -4,8 +4,9 @@ Modèle de la base de données TASK_ASSIGNMENT
 
 import uuid
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
 from infrastructure.database.models.base import Base
 
 
@@ -19,3 +20,16 @@ class TaskAssignmentModel(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     task_id = Column(UUID(as_uuid=True), ForeignKey("task.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Une seule assignation par couple; sert aussi d'index sur task_id
+        UniqueConstraint("task_id", "user_id", name="uq_task_assignment_task_user"),
+        # Tâches d'un utilisateur
+        Index("ix_task_assignment_user_id", "user_id"),
+        # Pagination par curseur sur (created_at, id)
+        Index("ix_task_assignment_created_at_id", "created_at", "id"),
+    )
+
+    # Récupère created_at (défaut côté serveur) via RETURNING: pas de lazy-load en asynchrone
+    __mapper_args__ = {"eager_defaults": True}
@@ -5,7 +5,7 @@ Modèle de la base de données TASK
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, Enum
+from sqlalchemy import Column, String, DateTime, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from infrastructure.database.models.base import Base
@@ -28,3 +28,8 @@ class TaskModel(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # Pagination par curseur sur (created_at, id)
+    __table_args__ = (Index("ix_task_created_at_id", "created_at", "id"),)
+
+    # Récupère updated_at (onupdate côté serveur) via RETURNING: pas de lazy-load en asynchrone
+    __mapper_args__ = {"eager_defaults": True}
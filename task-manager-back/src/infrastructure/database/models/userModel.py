@@ -5,7 +5,7 @@ Modèle de la base de données USER
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, Enum, Boolean
+from sqlalchemy import Column, String, DateTime, Enum, Index, Boolean, Integer
 from sqlalchemy.dialects.postgresql import UUID
 
 from infrastructure.database.models.base import Base
@@ -28,4 +28,15 @@ class UserModel(Base):
     verified = Column(Boolean, nullable=False)
     role = Column(Enum(UserRole), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    token_version = Column(Integer, server_default="0", default=0, nullable=False)
+
+    __table_args__ = (
+        # Email unique sans tenir compte de la casse (login, inscription, invitations)
+        Index("uq_user_email_lower", func.lower(email), unique=True),
+        # Pagination par curseur sur (created_at, id)
+        Index("ix_user_created_at_id", "created_at", "id"),
+    )
+
+    # Récupère updated_at (onupdate côté serveur) via RETURNING: pas de lazy-load en asynchrone
+    __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,58 @@
+"""
+Pagination par clé (keyset) sur (created_at, id)
+"""
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    model,
+    limit: int,
+    after: Cursor | None = None,
+    with_total: bool = False,
+    scalars: bool = True,
+) -> Page:
+    """
+    Exécuter une requête paginée par curseur
+
+    La requête est triée sur (created_at, id) et filtrée après le curseur:
+    le coût d'une page ne dépend pas de sa position dans la table (pas d'OFFSET).
+    Une ligne de plus que `limit` est lue pour savoir s'il existe une page suivante.
+
+    Args:
+        stmt: Requête de base (filtres métier, sans tri ni limite)
+        model: Modèle portant les colonnes created_at et id
+        limit: Taille de la page
+        after: Curseur de la page précédente
+        with_total: Compter le nombre total de lignes (requête COUNT séparée)
+        scalars: True si la requête sélectionne une seule entité,
+            sinon les lignes sont retournées telles quelles (entité en première position)
+
+    Returns:
+        Page contenant les modèles (ou lignes) de la page
+    """
+    total = None
+    if with_total:
+        total = await session.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    page_stmt = stmt.order_by(model.created_at, model.id).limit(limit + 1)
+    if after is not None:
+        page_stmt = page_stmt.where(
+            tuple_(model.created_at, model.id) > tuple_(after.created_at, after.id)
+        )
+
+    result = await session.execute(page_stmt)
+    rows = list(result.scalars() if scalars else result)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1] if scalars else rows[-1][0]
+        next_cursor = Cursor(created_at=last.created_at, id=last.id)
+
+    return Page(items=rows, next_cursor=next_cursor, total=total)
@@ -0,0 +1,115 @@
+"""
+Télémétrie du pool de connexions
+
+Chaque worker (processus uvicorn) possède son propre pool: les compteurs
+sont donc exposés par processus et doivent être agrégés côté supervision.
+"""
+
+import os
+from dataclasses import dataclass, asdict
+from time import perf_counter
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+
+@dataclass
+class PoolMetrics:
+    """Compteurs cumulés d'un pool de connexions"""
+    name: str
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_count: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record_wait(self, duration: float) -> None:
+        """Enregistrer le temps d'attente d'une obtention de connexion"""
+        self.wait_count += 1
+        self.wait_time_total += duration
+        if duration > self.wait_time_max:
+            self.wait_time_max = duration
+
+
+class _InstrumentedPoolMixin:
+    """Mesure le temps passé à obtenir une connexion du pool"""
+
+    metrics: PoolMetrics
+
+    def connect(self):
+        start = perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(perf_counter() - start)
+
+
+def instrumented_pool_class(pool_class: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    Créer une sous-classe instrumentée d'une classe de pool
+
+    La classe porte les métriques: un pool recréé (pool.recreate(),
+    engine.dispose()) continue donc d'alimenter les mêmes compteurs.
+    """
+    return type(
+        f"Instrumented{pool_class.__name__}",
+        (_InstrumentedPoolMixin, pool_class),
+        {"metrics": metrics},
+    )
+
+
+def register_pool_listeners(engine: Engine, metrics: PoolMetrics) -> None:
+    """Brancher les compteurs sur les événements du pool de l'engine (synchrone)"""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+
+def pool_snapshot(engine: Engine) -> dict:
+    """Photographie de l'état courant du pool et de ses compteurs"""
+    pool = engine.pool
+    metrics: PoolMetrics | None = getattr(pool, "metrics", None)
+    snapshot = {
+        "pid": os.getpid(),
+        "pool_class": type(pool).__name__.removeprefix("Instrumented"),
+    }
+
+    if isinstance(pool, QueuePool):
+        snapshot.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout=pool.timeout(),
+        )
+    elif metrics is not None:
+        # NullPool: aucune connexion conservée, on déduit l'usage des événements
+        snapshot["checked_out"] = metrics.checkouts - metrics.checkins
+
+    if metrics is not None:
+        counters = asdict(metrics)
+        counters["wait_time_avg"] = (
+            metrics.wait_time_total / metrics.wait_count if metrics.wait_count else 0.0
+        )
+        snapshot["counters"] = counters
+
+    return snapshot
@@ -6,10 +6,14 @@ from infrastructure.database.repository.user_repository import UserRepositoryImp
 from infrastructure.database.repository.task_repository import TaskRepositoryImpl
 from infrastructure.database.repository.assign_repository import AssignRepositoryImpl
 from infrastructure.database.repository.invitation_repository import InvitationRepositoryImpl
+from infrastructure.database.repository.revoked_token_repository import RevokedTokenRepositoryImpl
+from infrastructure.database.repository.email_outbox_repository import EmailOutboxRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
     "TaskRepositoryImpl",
     "AssignRepositoryImpl",
     "InvitationRepositoryImpl",
+    "RevokedTokenRepositoryImpl",
+    "EmailOutboxRepositoryImpl",
 ]
@@ -2,11 +2,16 @@
 Repository implementation pour les assignations
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.entities.assign import Assign
 from core.repositories.assign_repository import AssignRepository
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 from infrastructure.database.models.taskAssignment import TaskAssignmentModel
+from infrastructure.database.pagination import fetch_page
 from infrastructure.database.mappers.task_assignment_mappers import (
     map_entity_to_task_assignment_model,
     map_task_assignment_model_to_entity
@@ -18,52 +23,84 @@ class AssignRepositoryImpl(AssignRepository):
     Implémentation du repository pour les assignations
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def save(self, assign: Assign) -> Assign:
+    async def save(self, assign: Assign) -> Assign:
         """Sauvegarder une assignation"""
         task_assignment_model = map_entity_to_task_assignment_model(assign)
         self.session.add(task_assignment_model)
-        self.session.commit()
+        await self.session.commit()
         return map_task_assignment_model_to_entity(task_assignment_model)
 
-    def find_all(self) -> list[Assign]:
+    async def find_all(self) -> list[Assign]:
         """Trouver toutes les assignations"""
-        task_assignment_models = self.session.query(TaskAssignmentModel).all()
+        task_assignment_models = (await self.session.scalars(select(TaskAssignmentModel))).all()
         return [map_task_assignment_model_to_entity(m) for m in task_assignment_models]
 
-    def find_by_id(self, id: UUID) -> Assign | None:
+    async def find_page(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Assign]:
+        """Trouver une page d'assignations triées par (created_at, id)"""
+        page = await fetch_page(
+            self.session, select(TaskAssignmentModel), TaskAssignmentModel, limit, after, with_total
+        )
+        return page.map(map_task_assignment_model_to_entity)
+
+    async def find_by_id(self, id: UUID) -> Assign | None:
         """Trouver une assignation par son id"""
-        task_assignment_model = self.session.query(TaskAssignmentModel).filter(
-            TaskAssignmentModel.id == id
-        ).first()
+        task_assignment_model = await self.session.get(TaskAssignmentModel, id)
         if task_assignment_model is None:
             return None
         return map_task_assignment_model_to_entity(task_assignment_model)
 
-    def update(self, assign: Assign) -> Assign:
+    async def update(self, assign: Assign) -> Assign:
         """Mettre à jour une assignation"""
-        task_assignment_model = self.session.query(TaskAssignmentModel).filter(
-            TaskAssignmentModel.id == assign.id
-        ).first()
+        task_assignment_model = await self.session.get(TaskAssignmentModel, assign.id)
         task_assignment_model.task_id = assign.task_id
         task_assignment_model.user_id = assign.user_id
-        self.session.commit()
+        await self.session.commit()
         return map_task_assignment_model_to_entity(task_assignment_model)
 
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer une assignation"""
-        task_assignment_model = self.session.query(TaskAssignmentModel).filter(
-            TaskAssignmentModel.id == id
-        ).first()
+        task_assignment_model = await self.session.get(TaskAssignmentModel, id)
         if task_assignment_model:
-            self.session.delete(task_assignment_model)
-            self.session.commit()
+            await self.session.delete(task_assignment_model)
+            await self.session.commit()
+
+    @staticmethod
+    def _assignments_for_user_query(user_id: UUID) -> Select:
+        """Assignations d'un utilisateur"""
+        return select(TaskAssignmentModel).where(TaskAssignmentModel.user_id == user_id)
 
-    def get_assignments_for_user(self, user_id: UUID) -> list[Assign]:
+    async def get_assignments_for_user(self, user_id: UUID) -> list[Assign]:
         """Trouver les assignations d'un utilisateur"""
-        task_assignment_models = self.session.query(TaskAssignmentModel).filter(
-            TaskAssignmentModel.user_id == user_id
+        task_assignment_models = (
+            await self.session.scalars(self._assignments_for_user_query(user_id))
         ).all()
         return [map_task_assignment_model_to_entity(m) for m in task_assignment_models]
+
+    async def get_assignments_page_for_user(
+        self, user_id: UUID, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Assign]:
+        """Trouver une page des assignations d'un utilisateur"""
+        page = await fetch_page(
+            self.session,
+            self._assignments_for_user_query(user_id),
+            TaskAssignmentModel,
+            limit,
+            after,
+            with_total,
+        )
+        return page.map(map_task_assignment_model_to_entity)
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[list[Assign]]:
+        """Toutes les assignations par lots, triées par (created_at, id), sans tout charger en mémoire"""
+        result = await self.session.stream_scalars(
+            select(TaskAssignmentModel)
+            .order_by(TaskAssignmentModel.created_at, TaskAssignmentModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for task_assignment_models in result.partitions():
+            yield [map_task_assignment_model_to_entity(m) for m in task_assignment_models]
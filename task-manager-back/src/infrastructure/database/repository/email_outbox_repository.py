@@ -0,0 +1,88 @@
+"""
+Repository implementation pour l'outbox des emails
+"""
+
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.entities.outbox_email import OutboxEmail, OutboxStatus
+from core.repositories.email_outbox_repository import EmailOutboxRepository
+from infrastructure.database.models.emailOutboxModel import EmailOutboxModel
+from infrastructure.database.mappers.email_outbox_mappers import (
+    map_entity_to_email_outbox_model,
+    map_email_outbox_model_to_entity,
+)
+
+
+class EmailOutboxRepositoryImpl(EmailOutboxRepository):
+    """
+    Implémentation du repository pour l'outbox des emails
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, email: OutboxEmail) -> None:
+        """Ajouter un email à la transaction en cours (enregistré au prochain commit)"""
+        self.session.add(map_entity_to_email_outbox_model(email))
+
+    async def claim_due(self, limit: int, now: datetime, lease_until: datetime) -> list[OutboxEmail]:
+        """
+        Réclamer les emails à envoyer
+
+        Chaque email réclamé compte une tentative et n'est plus proposé aux
+        autres workers avant lease_until.
+        """
+        models = (await self.session.scalars(
+            select(EmailOutboxModel)
+            .where(
+                EmailOutboxModel.status == OutboxStatus.PENDING.value,
+                EmailOutboxModel.next_attempt_at <= now,
+            )
+            .order_by(EmailOutboxModel.next_attempt_at)
+            .limit(limit)
+            # Les lignes déjà verrouillées par un autre worker sont ignorées, pas attendues
+            .with_for_update(skip_locked=True)
+        )).all()
+        for model in models:
+            model.attempts += 1
+            model.next_attempt_at = lease_until
+        await self.session.commit()
+        return [map_email_outbox_model_to_entity(m) for m in models]
+
+    async def mark_sent(self, id: UUID, sent_at: datetime) -> None:
+        """Marquer un email comme envoyé"""
+        await self._update(id, status=OutboxStatus.SENT.value, sent_at=sent_at, last_error=None)
+
+    async def reschedule(self, id: UUID, error: str, next_attempt_at: datetime) -> None:
+        """Replanifier un email après un échec"""
+        await self._update(id, last_error=error, next_attempt_at=next_attempt_at)
+
+    async def mark_failed(self, id: UUID, error: str) -> None:
+        """Abandonner un email"""
+        await self._update(id, status=OutboxStatus.FAILED.value, last_error=error)
+
+    async def _update(self, id: UUID, **values) -> None:
+        await self.session.execute(
+            update(EmailOutboxModel).where(EmailOutboxModel.id == id).values(**values)
+        )
+        await self.session.commit()
+
+    async def delete_sent_before(self, before: datetime) -> int:
+        """Supprimer les emails envoyés avant une date"""
+        result = await self.session.execute(
+            delete(EmailOutboxModel).where(
+                EmailOutboxModel.status == OutboxStatus.SENT.value,
+                EmailOutboxModel.sent_at < before,
+            )
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Nombre d'emails par état"""
+        rows = await self.session.execute(
+            select(EmailOutboxModel.status, func.count()).group_by(EmailOutboxModel.status)
+        )
+        return {status: count for status, count in rows}
@@ -2,12 +2,18 @@
 Repository implementation pour les invitations
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
-from sqlalchemy.orm import Session
-from core.entities.invitation import Invitation
+from sqlalchemy import Select, and_, delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.entities.invitation import Invitation, InvitationDetails
 from core.repositories.invitation_repository import InvitationRepository
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 from infrastructure.database.models.invitationModel import InvitationModel
+from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.models.userModel import UserModel
+from infrastructure.database.pagination import fetch_page
 from infrastructure.database.mappers.invitation_mappers import (
     map_entity_to_invitation_model,
     map_invitation_model_to_entity,
@@ -19,70 +25,184 @@ class InvitationRepositoryImpl(InvitationRepository):
     Implémentation du repository pour les invitations
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def save(self, invitation: Invitation) -> Invitation:
+    async def save(self, invitation: Invitation) -> Invitation:
         """Sauvegarder une invitation"""
         invitation_model = map_entity_to_invitation_model(invitation)
         self.session.add(invitation_model)
-        self.session.commit()
-        self.session.refresh(invitation_model)
+        await self.session.commit()
+        await self.session.refresh(invitation_model)
         return map_invitation_model_to_entity(invitation_model)
 
-    def find_all(self) -> list[Invitation]:
+    async def save_many(self, invitations: list[Invitation]) -> None:
+        """Sauvegarder plusieurs invitations dans une seule transaction"""
+        self.session.add_all([map_entity_to_invitation_model(i) for i in invitations])
+        await self.session.commit()
+
+    async def find_all(self) -> list[Invitation]:
         """Trouver toutes les invitations"""
-        invitation_models = self.session.query(InvitationModel).all()
+        invitation_models = (await self.session.scalars(select(InvitationModel))).all()
         return [map_invitation_model_to_entity(m) for m in invitation_models]
 
-    def find_by_id(self, id: UUID) -> Invitation | None:
+    async def find_by_id(self, id: UUID) -> Invitation | None:
         """Trouver une invitation par son id"""
-        invitation_model = self.session.query(InvitationModel).filter(
-            InvitationModel.id == id
-        ).first()
+        invitation_model = await self.session.get(InvitationModel, id)
         if invitation_model is None:
             return None
         return map_invitation_model_to_entity(invitation_model)
 
-    def find_by_token(self, token: str) -> Invitation | None:
+    async def find_by_token(self, token: str) -> Invitation | None:
         """Trouver une invitation par son token"""
-        invitation_model = self.session.query(InvitationModel).filter(
-            InvitationModel.token == token
-        ).first()
+        invitation_model = await self.session.scalar(
+            select(InvitationModel).where(InvitationModel.token == token)
+        )
         if invitation_model is None:
             return None
         return map_invitation_model_to_entity(invitation_model)
 
-    def find_by_email(self, email: str) -> list[Invitation]:
+    async def find_by_email(self, email: str) -> list[Invitation]:
         """Trouver les invitations par email"""
-        invitation_models = self.session.query(InvitationModel).filter(
-            InvitationModel.email == email
+        invitation_models = (
+            await self.session.scalars(
+                select(InvitationModel).where(func.lower(InvitationModel.email) == email.lower())
+            )
         ).all()
         return [map_invitation_model_to_entity(m) for m in invitation_models]
 
-    def find_pending(self) -> list[Invitation]:
+    async def find_pending_pairs(
+        self, emails: list[str], task_ids: list[UUID]
+    ) -> set[tuple[str, UUID]]:
+        """Couples (email en minuscules, tâche) ayant déjà une invitation en attente"""
+        if not emails or not task_ids:
+            return set()
+        now = datetime.now(timezone.utc)
+        email = func.lower(InvitationModel.email)
+        rows = await self.session.execute(
+            select(email, InvitationModel.task_id).where(
+                email.in_([e.lower() for e in emails]),
+                InvitationModel.task_id.in_(task_ids),
+                InvitationModel.accepted == False,
+                InvitationModel.expires_at > now
+            )
+        )
+        return {(row[0], row[1]) for row in rows}
+
+    async def find_pending(self) -> list[Invitation]:
         """Trouver les invitations en attente (non acceptées et non expirées)"""
-        now = datetime.utcnow()
-        invitation_models = self.session.query(InvitationModel).filter(
-            InvitationModel.accepted == False,
-            InvitationModel.expires_at > now
+        now = datetime.now(timezone.utc)
+        invitation_models = (
+            await self.session.scalars(
+                select(InvitationModel).where(
+                    InvitationModel.accepted == False,
+                    InvitationModel.expires_at > now
+                )
+            )
         ).all()
         return [map_invitation_model_to_entity(m) for m in invitation_models]
 
-    def update(self, invitation: Invitation) -> Invitation:
-        """Mettre à jour une invitation"""
-        invitation_model = self.session.query(InvitationModel).filter(
-            InvitationModel.id == invitation.id
+    @staticmethod
+    def _details_query() -> Select:
+        """Invitation + titre de la tâche + nom de l'invitant en une jointure"""
+        return (
+            select(
+                InvitationModel,
+                TaskModel.title,
+                UserModel.first_name,
+                UserModel.last_name,
+            )
+            .outerjoin(TaskModel, TaskModel.id == InvitationModel.task_id)
+            .outerjoin(UserModel, UserModel.id == InvitationModel.invited_by)
+        )
+
+    @staticmethod
+    def _map_details_row(row) -> InvitationDetails:
+        """Mappage d'une ligne de _details_query vers InvitationDetails"""
+        invitation_model, task_title, first_name, last_name = row
+        inviter_name = f"{first_name} {last_name}" if first_name is not None else None
+        return InvitationDetails(
+            invitation=map_invitation_model_to_entity(invitation_model),
+            task_title=task_title,
+            inviter_name=inviter_name,
+        )
+
+    async def find_pending_with_details(self) -> list[InvitationDetails]:
+        """Trouver les invitations en attente avec tâche et invitant (une seule requête)"""
+        now = datetime.now(timezone.utc)
+        rows = await self.session.execute(
+            self._details_query().where(
+                InvitationModel.accepted == False,
+                InvitationModel.expires_at > now
+            )
+        )
+        return [self._map_details_row(row) for row in rows]
+
+    async def find_pending_page_with_details(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[InvitationDetails]:
+        """Trouver une page d'invitations en attente avec tâche et invitant"""
+        now = datetime.now(timezone.utc)
+        stmt = self._details_query().where(
+            InvitationModel.accepted == False,
+            InvitationModel.expires_at > now
+        )
+        page = await fetch_page(
+            self.session, stmt, InvitationModel, limit, after, with_total, scalars=False
+        )
+        return page.map(self._map_details_row)
+
+    async def find_by_id_with_details(self, id: UUID) -> InvitationDetails | None:
+        """Trouver une invitation par son id avec tâche et invitant"""
+        row = (
+            await self.session.execute(self._details_query().where(InvitationModel.id == id))
+        ).first()
+        if row is None:
+            return None
+        return self._map_details_row(row)
+
+    async def find_by_token_with_details(self, token: str) -> InvitationDetails | None:
+        """Trouver une invitation par son token avec tâche et invitant"""
+        row = (
+            await self.session.execute(self._details_query().where(InvitationModel.token == token))
         ).first()
+        if row is None:
+            return None
+        return self._map_details_row(row)
+
+    async def update(self, invitation: Invitation) -> Invitation:
+        """Mettre à jour une invitation"""
+        invitation_model = await self.session.get(InvitationModel, invitation.id)
         invitation_model.accepted = invitation.accepted
-        self.session.commit()
+        await self.session.commit()
         return map_invitation_model_to_entity(invitation_model)
 
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer une invitation"""
-        invitation_model = self.session.query(InvitationModel).filter(
-            InvitationModel.id == id
-        ).first()
+        invitation_model = await self.session.get(InvitationModel, id)
         if invitation_model:
-            self.session.delete(invitation_model)
-            self.session.commit()
+            await self.session.delete(invitation_model)
+            await self.session.commit()
+
+    async def delete_stale(self, before: datetime, limit: int) -> int:
+        """
+        Supprimer un lot d'invitations expirées ou acceptées avant `before`
+
+        Returns:
+            Nombre d'invitations supprimées (moins que limit: plus rien à supprimer)
+        """
+        batch = (
+            select(InvitationModel.id)
+            .where(or_(
+                InvitationModel.expires_at <= before,
+                and_(InvitationModel.accepted == True, InvitationModel.created_at <= before),
+            ))
+            .limit(limit)
+            # Lignes déjà prises par le balayage d'un autre worker: ignorées, pas attendues
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            delete(InvitationModel).where(InvitationModel.id.in_(batch))
+        )
+        await self.session.commit()
+        return result.rowcount
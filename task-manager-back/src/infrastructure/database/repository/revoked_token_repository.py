@@ -0,0 +1,51 @@
+"""
+Repository implementation pour les révocations de tokens
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.entities.revoked_token import RevokedToken
+from core.repositories.revoked_token_repository import RevokedTokenRepository
+from infrastructure.database.models.revokedTokenModel import RevokedTokenModel
+from infrastructure.database.mappers.revoked_token_mappers import (
+    map_entity_to_revoked_token_model,
+    map_revoked_token_model_to_entity,
+)
+
+
+class RevokedTokenRepositoryImpl(RevokedTokenRepository):
+    """
+    Implémentation du repository pour les révocations de tokens
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def revoke(self, revoked_token: RevokedToken) -> bool:
+        """Enregistrer une révocation (False si déjà révoqué)"""
+        self.session.add(map_entity_to_revoked_token_model(revoked_token))
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Clé primaire: un seul worker peut consommer un même jti
+            await self.session.rollback()
+            return False
+        return True
+
+    async def find_active(self, revoked_since: datetime | None = None) -> list[RevokedToken]:
+        """Trouver les révocations non expirées (révoquées depuis une date)"""
+        stmt = select(RevokedTokenModel).where(RevokedTokenModel.expires_at > datetime.now(timezone.utc))
+        if revoked_since is not None:
+            stmt = stmt.where(RevokedTokenModel.revoked_at > revoked_since)
+        models = (await self.session.scalars(stmt)).all()
+        return [map_revoked_token_model_to_entity(m) for m in models]
+
+    async def delete_expired(self, now: datetime) -> int:
+        """Supprimer les révocations expirées"""
+        result = await self.session.execute(
+            delete(RevokedTokenModel).where(RevokedTokenModel.expires_at <= now)
+        )
+        await self.session.commit()
+        return result.rowcount
@@ -2,13 +2,21 @@
 Repository implementation pour les tasks
 """
 
-from uuid import UUID
-from sqlalchemy.orm import Session
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from uuid import UUID, uuid4
+from sqlalchemy import Select, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.entities.task import Task
 from core.repositories.task_repository import TaskRepository
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.models.taskAssignment import TaskAssignmentModel
+from infrastructure.database.pagination import fetch_page
 from infrastructure.database.mappers.task_mappers import (
     map_entity_to_task_model,
+    map_entity_to_task_values,
     map_task_model_to_entity
 )
 
@@ -18,53 +26,175 @@ class TaskRepositoryImpl(TaskRepository):
     Implémentation du repository pour les tasks
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def save(self, task: Task) -> Task:
-        """Sauvegarder une tâche"""
+    async def _load_assignees(self, task_ids: Iterable[UUID]) -> dict[UUID, list[UUID]]:
+        """Charger les assignés de plusieurs tâches en une seule requête"""
+        task_ids = list(task_ids)
+        assignees: dict[UUID, list[UUID]] = defaultdict(list)
+        if not task_ids:
+            return assignees
+        rows = await self.session.execute(
+            select(TaskAssignmentModel.task_id, TaskAssignmentModel.user_id).where(
+                TaskAssignmentModel.task_id.in_(task_ids)
+            )
+        )
+        for task_id, user_id in rows:
+            assignees[task_id].append(user_id)
+        return assignees
+
+    async def _map_with_assignees(self, task_models: list[TaskModel]) -> list[Task]:
+        """Mapper des tâches avec leurs assignés (requête groupée)"""
+        assignees = await self._load_assignees(m.id for m in task_models)
+        return [map_task_model_to_entity(m, assignees.get(m.id)) for m in task_models]
+
+    async def _map_page_with_assignees(self, page: Page[TaskModel]) -> Page[Task]:
+        """Mapper une page de tâches avec leurs assignés"""
+        return Page(
+            items=await self._map_with_assignees(page.items),
+            next_cursor=page.next_cursor,
+            total=page.total,
+        )
+
+    async def _sync_assignees(
+        self, task_id: UUID, assigned_to: list[UUID], is_new: bool = False
+    ) -> list[UUID]:
+        """
+        Aligner les assignations d'une tâche sur `assigned_to` (sans commit)
+
+        Différence entre les assignés enregistrés et ceux voulus: au plus un
+        DELETE et un INSERT groupés.
+        """
+        desired = list(dict.fromkeys(assigned_to))
+        current = set() if is_new else set(await self.session.scalars(
+            select(TaskAssignmentModel.user_id).where(TaskAssignmentModel.task_id == task_id)
+        ))
+        removed = current.difference(desired)
+        added = [user_id for user_id in desired if user_id not in current]
+        if removed:
+            await self.session.execute(
+                delete(TaskAssignmentModel).where(
+                    TaskAssignmentModel.task_id == task_id,
+                    TaskAssignmentModel.user_id.in_(removed),
+                )
+            )
+        if added:
+            await self.session.execute(
+                insert(TaskAssignmentModel.__table__),
+                [{"id": uuid4(), "task_id": task_id, "user_id": user_id} for user_id in added],
+            )
+        return desired
+
+    async def save(self, task: Task) -> Task:
+        """Sauvegarder une tâche et ses assignations (une transaction)"""
         task_model = map_entity_to_task_model(task)
         self.session.add(task_model)
-        self.session.commit()
-        return map_task_model_to_entity(task_model)
+        # La tâche doit exister avant ses assignations (clé étrangère)
+        await self.session.flush()
+        assigned_to = await self._sync_assignees(task_model.id, task.assigned_to, is_new=True)
+        await self.session.commit()
+        return map_task_model_to_entity(task_model, assigned_to)
+
+    async def insert_many(self, tasks: list[Task]) -> None:
+        """
+        Insérer des tâches et leurs assignations dans une seule transaction
 
-    def find_all(self) -> list[Task]:
+        INSERT exécuté sur une liste de lignes: SQLAlchemy envoie des
+        INSERT ... VALUES multi-lignes (insertmanyvalues) depuis une requête
+        compilée une seule fois, sans objets ORM.
+        """
+        await self.session.execute(
+            insert(TaskModel.__table__), [map_entity_to_task_values(t) for t in tasks]
+        )
+        assignments = [
+            {"id": uuid4(), "task_id": task.id, "user_id": user_id}
+            for task in tasks
+            for user_id in dict.fromkeys(task.assigned_to)
+        ]
+        if assignments:
+            await self.session.execute(insert(TaskAssignmentModel.__table__), assignments)
+        await self.session.commit()
+
+    async def find_all(self) -> list[Task]:
         """Trouver toutes les tâches"""
-        task_models = self.session.query(TaskModel).all()
-        return [map_task_model_to_entity(task_model) for task_model in task_models]
+        task_models = (await self.session.scalars(select(TaskModel))).all()
+        return await self._map_with_assignees(task_models)
+
+    async def find_page(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Task]:
+        """Trouver une page de tâches triées par (created_at, id)"""
+        page = await fetch_page(self.session, select(TaskModel), TaskModel, limit, after, with_total)
+        return await self._map_page_with_assignees(page)
 
-    def find_by_id(self, id: UUID) -> Task | None:
+    async def find_by_id(self, id: UUID) -> Task | None:
         """Trouver une tâche par son id"""
-        task_model = self.session.query(TaskModel).filter(TaskModel.id == id).first()
+        task_model = await self.session.get(TaskModel, id)
         if task_model is None:
             return None
-        return map_task_model_to_entity(task_model)
+        return (await self._map_with_assignees([task_model]))[0]
 
-    def update(self, task: Task) -> Task:
-        """Mettre à jour une tâche"""
-        task_model = self.session.query(TaskModel).filter(TaskModel.id == task.id).first()
+    async def find_titles(self, ids: list[UUID]) -> dict[UUID, str]:
+        """Titres des tâches existantes parmi les ids donnés"""
+        if not ids:
+            return {}
+        rows = await self.session.execute(
+            select(TaskModel.id, TaskModel.title).where(TaskModel.id.in_(ids))
+        )
+        return {task_id: title for task_id, title in rows}
+
+    async def update(self, task: Task) -> Task | None:
+        """Mettre à jour une tâche et aligner ses assignations (une transaction)"""
+        task_model = await self.session.get(TaskModel, task.id)
+        if task_model is None:
+            # Supprimée depuis sa lecture
+            return None
         task_model.title = task.title
         task_model.description = task.description
         task_model.status = task.status
         task_model.priority = task.priority
         task_model.start_date = task.start_date
         task_model.due_date = task.due_date
-        self.session.commit()
-        return map_task_model_to_entity(task_model)
+        assigned_to = await self._sync_assignees(task_model.id, task.assigned_to)
+        await self.session.commit()
+        return map_task_model_to_entity(task_model, assigned_to)
 
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer une tâche"""
-        task_model = self.session.query(TaskModel).filter(TaskModel.id == id).first()
+        task_model = await self.session.get(TaskModel, id)
         if task_model:
-            self.session.delete(task_model)
-            self.session.commit()
+            await self.session.delete(task_model)
+            await self.session.commit()
 
-    def get_tasks_for_user(self, user_id: UUID) -> list[Task]:
-        """Trouver les tâches assignées à un utilisateur"""
-        from infrastructure.database.models.taskAssignment import TaskAssignmentModel
-        task_ids = self.session.query(TaskAssignmentModel.task_id).filter(
+    @staticmethod
+    def _tasks_for_user_query(user_id: UUID) -> Select:
+        """Tâches dont l'utilisateur est assigné"""
+        task_ids = select(TaskAssignmentModel.task_id).where(
             TaskAssignmentModel.user_id == user_id
-        ).all()
-        task_ids = [t[0] for t in task_ids]
-        task_models = self.session.query(TaskModel).filter(TaskModel.id.in_(task_ids)).all()
-        return [map_task_model_to_entity(task_model) for task_model in task_models]
+        )
+        return select(TaskModel).where(TaskModel.id.in_(task_ids))
+
+    async def get_tasks_for_user(self, user_id: UUID) -> list[Task]:
+        """Trouver les tâches assignées à un utilisateur"""
+        task_models = (await self.session.scalars(self._tasks_for_user_query(user_id))).all()
+        return await self._map_with_assignees(task_models)
+
+    async def get_tasks_page_for_user(
+        self, user_id: UUID, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[Task]:
+        """Trouver une page des tâches assignées à un utilisateur"""
+        page = await fetch_page(
+            self.session, self._tasks_for_user_query(user_id), TaskModel, limit, after, with_total
+        )
+        return await self._map_page_with_assignees(page)
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[list[Task]]:
+        """Toutes les tâches par lots, triées par (created_at, id), sans tout charger en mémoire"""
+        result = await self.session.stream_scalars(
+            select(TaskModel)
+            .order_by(TaskModel.created_at, TaskModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for task_models in result.partitions():
+            yield await self._map_with_assignees(task_models)
@@ -2,11 +2,17 @@
 Repository implementation pour les users
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.entities.user import User
 from core.repositories.user_repository import UserRepository
+from core.services.auth_service import TOKEN_VERSION_DELETED, token_versions, user_cache
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
 from infrastructure.database.models.userModel import UserModel
+from infrastructure.database.pagination import fetch_page
 from infrastructure.database.mappers.user_mappers import (
     map_entity_to_user_model,
     map_user_model_to_entity
@@ -18,57 +24,123 @@ class UserRepositoryImpl(UserRepository):
     Implémentation du repository pour les users
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def save(self, user: User) -> User:
+    async def save(self, user: User) -> User:
         """Sauvegarder un utilisateur"""
         user_model = map_entity_to_user_model(user)
         self.session.add(user_model)
-        self.session.commit()
+        await self.session.commit()
         return map_user_model_to_entity(user_model)
 
-    def find_all(self) -> list[User]:
+    async def find_all(self) -> list[User]:
         """Trouver tous les utilisateurs"""
-        user_models = self.session.query(UserModel).all()
+        user_models = (await self.session.scalars(select(UserModel))).all()
         return [map_user_model_to_entity(user_model) for user_model in user_models]
 
-    def find_by_id(self, id: UUID) -> User | None:
+    async def find_page(
+        self, limit: int, after: Cursor | None = None, with_total: bool = False
+    ) -> Page[User]:
+        """Trouver une page d'utilisateurs triés par (created_at, id)"""
+        page = await fetch_page(self.session, select(UserModel), UserModel, limit, after, with_total)
+        return page.map(map_user_model_to_entity)
+
+    async def find_by_id(self, id: UUID) -> User | None:
         """Trouver un utilisateur par son id"""
-        user_model = self.session.query(UserModel).filter(UserModel.id == id).first()
+        user_model = await self.session.get(UserModel, id)
         if user_model is None:
             return None
         return map_user_model_to_entity(user_model)
 
-    def update(self, user: User) -> User:
+    async def update(self, user: User) -> User:
         """Mettre à jour un utilisateur"""
-        user_model = self.session.query(UserModel).filter(UserModel.id == user.id).first()
+        user_model = await self.session.get(UserModel, user.id)
         user_model.first_name = user.first_name
         user_model.last_name = user.last_name
         user_model.email = user.email
         user_model.password = user.password
         user_model.verified = user.verified
         user_model.role = user.role
-        self.session.commit()
+        user_model.token_version += 1
+        await self.session.commit()
+        token_versions.set(user_model.id, user_model.token_version)
+        user_cache.invalidate(user_model.id)
         return map_user_model_to_entity(user_model)
 
-    def delete(self, id: UUID) -> None:
+    async def delete(self, id: UUID) -> None:
         """Supprimer un utilisateur"""
-        user_model = self.session.query(UserModel).filter(UserModel.id == id).first()
+        user_model = await self.session.get(UserModel, id)
         if user_model:
-            self.session.delete(user_model)
-            self.session.commit()
+            await self.session.delete(user_model)
+            await self.session.commit()
+            token_versions.set(id, TOKEN_VERSION_DELETED)
+            user_cache.invalidate(id)
 
-    def verify(self, id: UUID) -> User:
+    async def verify(self, id: UUID) -> User:
         """Vérifier un utilisateur"""
-        user_model = self.session.query(UserModel).filter(UserModel.id == id).first()
+        user_model = await self.session.get(UserModel, id)
         user_model.verified = True
-        self.session.commit()
+        user_model.token_version += 1
+        await self.session.commit()
+        token_versions.set(user_model.id, user_model.token_version)
+        user_cache.invalidate(user_model.id)
         return map_user_model_to_entity(user_model)
 
-    def find_by_email(self, email: str) -> User | None:
+    async def update_password_hash(self, id: UUID, old_hash: str, new_hash: str) -> bool:
+        """
+        Remplacer le hash du mot de passe s'il n'a pas changé entre-temps
+
+        Même mot de passe, autre hash: les sessions restent valides.
+        """
+        result = await self.session.execute(
+            update(UserModel)
+            .where(UserModel.id == id, UserModel.password == old_hash)
+            # updated_at inchangé: pas de modification visible du compte
+            .values(password=new_hash, updated_at=UserModel.updated_at)
+        )
+        await self.session.commit()
+        user_cache.invalidate(id)
+        return result.rowcount == 1
+
+    async def get_token_version(self, id: UUID) -> int | None:
+        """Version du token d'un utilisateur (None s'il n'existe pas)"""
+        return await self.session.scalar(
+            select(UserModel.token_version).where(UserModel.id == id)
+        )
+
+    async def find_by_email(self, email: str) -> User | None:
         """Trouver un utilisateur par son email"""
-        user_model = self.session.query(UserModel).filter(UserModel.email == email).first()
+        user_model = await self.session.scalar(
+            select(UserModel).where(func.lower(UserModel.email) == email.lower()).limit(1)
+        )
         if user_model is None:
             return None
         return map_user_model_to_entity(user_model)
+
+    async def find_existing_emails(self, emails: list[str]) -> set[str]:
+        """Emails (en minuscules) déjà utilisés par un compte, parmi ceux donnés"""
+        if not emails:
+            return set()
+        email = func.lower(UserModel.email)
+        rows = await self.session.scalars(
+            select(email).where(email.in_([e.lower() for e in emails]))
+        )
+        return set(rows)
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[list[User]]:
+        """Tous les utilisateurs par lots, triés par (created_at, id), sans tout charger en mémoire"""
+        result = await self.session.stream_scalars(
+            select(UserModel)
+            .order_by(UserModel.created_at, UserModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for user_models in result.partitions():
+            yield [map_user_model_to_entity(m) for m in user_models]
+
+    async def find_existing_ids(self, ids: list[UUID]) -> set[UUID]:
+        """Ids des utilisateurs existants parmi ceux donnés"""
+        if not ids:
+            return set()
+        rows = await self.session.scalars(select(UserModel.id).where(UserModel.id.in_(ids)))
+        return set(rows)
@@ -0,0 +1,33 @@
+"""
+Session de routage primaire / réplicas
+"""
+
+import random
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+class RoutingSession(Session):
+    """
+    Session qui lit sur un réplica et écrit sur le primaire
+
+    - Le réplica est tiré une fois par session: toutes les lectures d'une
+      requête voient le même instantané
+    - Les flush et les INSERT/UPDATE/DELETE explicites partent sur le primaire
+    - Après une écriture (ou si info["use_primary"] est positionné), la session
+      reste sur le primaire pour lire ses propres écritures
+    """
+
+    def __init__(self, primary: Engine, replicas: list[Engine], **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = random.choice(replicas) if replicas else primary
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info["use_primary"] = True
+            return self.primary
+        if self.info.get("use_primary"):
+            return self.primary
+        return self.replica
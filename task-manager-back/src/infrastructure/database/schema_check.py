@@ -0,0 +1,77 @@
+"""
+Vérification de la révision du schéma au démarrage
+"""
+
+import logging
+from pathlib import Path
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+
+class SchemaRevisionError(RuntimeError):
+    """La base n'est pas à la révision attendue par le code"""
+
+
+async def current_revisions(engine: AsyncEngine) -> set[str]:
+    """
+    Révision(s) enregistrée(s) dans alembic_version (vide si non migrée)
+
+    Table absente: ProgrammingError sous PostgreSQL, OperationalError sous
+    SQLite. Une base injoignable lève toujours à l'ouverture de la connexion.
+    """
+    async with engine.connect() as conn:
+        try:
+            rows = await conn.scalars(text("SELECT version_num FROM alembic_version"))
+        except DBAPIError:
+            return set()
+        return set(rows)
+
+
+async def check_schema_revision(engine: AsyncEngine, mode: str = "strict") -> None:
+    """
+    Comparer la révision stockée à la révision attendue
+
+    Une seule requête sur alembic_version: aucune réflexion du catalogue,
+    le démarrage d'un worker reste instantané. Les migrations s'appliquent
+    à part (`alembic upgrade head`), avant le déploiement du code.
+
+    Une révision inconnue du code (base plus récente, déploiement progressif
+    en cours) est tolérée: les migrations doivent rester rétrocompatibles.
+
+    Args:
+        mode: "strict" lève une erreur si la base est en retard,
+            "warn" la journalise, "off" désactive la vérification
+
+    Raises:
+        SchemaRevisionError: Base non migrée ou en retard (mode strict)
+    """
+    if mode == "off":
+        return
+
+    script = ScriptDirectory(str(MIGRATIONS_DIR))
+    expected = set(script.get_heads())
+    current = await current_revisions(engine)
+    if current == expected:
+        return
+
+    known = {revision.revision for revision in script.walk_revisions()}
+    if current and not current <= known:
+        logger.warning(
+            "Schema revision %s is newer than this code (%s)",
+            ", ".join(sorted(current)), ", ".join(sorted(expected))
+        )
+        return
+
+    message = (
+        f"Database schema at revision {', '.join(sorted(current)) or 'none'}, "
+        f"expected {', '.join(sorted(expected))}: run `alembic upgrade head`"
+    )
+    if mode == "strict":
+        raise SchemaRevisionError(message)
+    logger.warning(message)
@@ -3,5 +3,14 @@ External services
 """
 
 from infrastructure.external.email_service import EmailService
+from infrastructure.external.email_templates import EmailTemplates, RenderedEmail, email_templates
+from infrastructure.external.smtp_pool import SMTPConnectionPool, smtp_pool
 
-__all__ = ["EmailService"]
+__all__ = [
+    "EmailService",
+    "EmailTemplates",
+    "RenderedEmail",
+    "email_templates",
+    "SMTPConnectionPool",
+    "smtp_pool",
+]
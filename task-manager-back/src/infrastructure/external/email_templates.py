@@ -0,0 +1,175 @@
+"""
+Modèles d'emails précompilés (sujet, texte, HTML) par langue
+"""
+
+import html
+import string
+from dataclasses import dataclass
+from pathlib import Path
+from config.settings import settings
+
+# Un dossier par langue: <nom>.subject.txt, <nom>.txt et <nom>.html (optionnel)
+TEMPLATES_DIR = Path(__file__).parent / "templates" / "email"
+
+
+def _escape_html(value) -> str:
+    return html.escape(str(value), quote=True)
+
+
+def _raw(value) -> str:
+    return str(value)
+
+
+class CompiledTemplate:
+    """
+    Modèle découpé une fois en fragments statiques et variables
+
+    Syntaxe string.Template (${variable}, $$ pour un $). Les valeurs sont
+    échappées selon le format (HTML) au rendu.
+    """
+
+    def __init__(self, source: str, escape):
+        self.escape = escape
+        # Alternance fragment statique / nom de variable, fragments statiques adjacents fusionnés
+        self.parts: list[tuple[bool, str]] = []
+        position = 0
+        for match in string.Template.pattern.finditer(source):
+            literal = source[position:match.start()]
+            position = match.end()
+            if match.group("escaped") is not None:
+                self._add_literal(literal + "$")
+            elif match.group("invalid") is not None:
+                raise ValueError(f"Variable invalide à la position {match.start()}")
+            else:
+                self._add_literal(literal)
+                self.parts.append((True, match.group("named") or match.group("braced")))
+        self._add_literal(source[position:])
+        self.variables = {name for is_variable, name in self.parts if is_variable}
+
+    def _add_literal(self, text: str) -> None:
+        if not text:
+            return
+        if self.parts and not self.parts[-1][0]:
+            self.parts[-1] = (False, self.parts[-1][1] + text)
+        else:
+            self.parts.append((False, text))
+
+    def bind(self, context: dict) -> "CompiledTemplate":
+        """Modèle partiel: les variables de `context` sont rendues une fois pour toutes"""
+        bound = CompiledTemplate.__new__(CompiledTemplate)
+        bound.escape = self.escape
+        bound.parts = []
+        for is_variable, value in self.parts:
+            if is_variable and value in context:
+                bound._add_literal(self.escape(context[value]))
+            elif is_variable:
+                bound.parts.append((True, value))
+            else:
+                bound._add_literal(value)
+        bound.variables = self.variables - context.keys()
+        return bound
+
+    def render(self, context: dict) -> str:
+        escape = self.escape
+        return "".join(
+            escape(context[value]) if is_variable else value
+            for is_variable, value in self.parts
+        )
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """Email prêt à l'envoi"""
+    subject: str
+    body: str
+    html_body: str | None
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    """Les trois parties compilées d'un modèle"""
+    subject: CompiledTemplate
+    text: CompiledTemplate
+    html: CompiledTemplate | None
+
+    def bind(self, context: dict) -> "EmailTemplate":
+        return EmailTemplate(
+            subject=self.subject.bind(context),
+            text=self.text.bind(context),
+            html=self.html.bind(context) if self.html is not None else None,
+        )
+
+    def render(self, context: dict) -> RenderedEmail:
+        return RenderedEmail(
+            subject=self.subject.render(context),
+            body=self.text.render(context),
+            html_body=self.html.render(context) if self.html is not None else None,
+        )
+
+
+class EmailTemplates:
+    """
+    Registre des modèles, chargés et compilés au démarrage
+
+    Langue demandée ("en-US"), puis sa langue de base ("en"), puis la
+    langue par défaut.
+    """
+
+    def __init__(self, directory: Path, default_locale: str):
+        self.default_locale = default_locale
+        self._templates: dict[tuple[str, str], EmailTemplate] = {}
+        for locale_dir in sorted(p for p in directory.iterdir() if p.is_dir()):
+            for subject_file in locale_dir.glob("*.subject.txt"):
+                name = subject_file.name.removesuffix(".subject.txt")
+                html_file = locale_dir / f"{name}.html"
+                self._templates[(locale_dir.name, name)] = EmailTemplate(
+                    subject=CompiledTemplate(subject_file.read_text(encoding="utf-8").strip(), _raw),
+                    text=CompiledTemplate((locale_dir / f"{name}.txt").read_text(encoding="utf-8").strip(), _raw),
+                    html=CompiledTemplate(html_file.read_text(encoding="utf-8").strip(), _escape_html)
+                    if html_file.exists() else None,
+                )
+        missing = {
+            name for _, name in self._templates
+            if (default_locale, name) not in self._templates
+        }
+        if missing:
+            raise ValueError(f"Modèles d'email absents pour la langue par défaut {default_locale}: {sorted(missing)}")
+
+    def get(self, name: str, locale: str | None = None) -> EmailTemplate:
+        """Modèle compilé dans la langue la plus proche"""
+        if locale:
+            for candidate in (locale, locale.split("-")[0].split("_")[0]):
+                template = self._templates.get((candidate.lower(), name))
+                if template is not None:
+                    return template
+        return self._templates[(self.default_locale, name)]
+
+    def render(self, name: str, context: dict, locale: str | None = None) -> RenderedEmail:
+        """Rendre un email"""
+        return self.get(name, locale).render(context)
+
+    def render_batch(
+        self,
+        name: str,
+        contexts: list[dict],
+        locale: str | None = None,
+        shared: dict | None = None,
+    ) -> list[RenderedEmail]:
+        """
+        Rendre un même modèle pour plusieurs destinataires
+
+        Les variables de `shared` (communes à tous) sont échappées et
+        insérées une seule fois; seules celles de chaque contexte le sont
+        par destinataire.
+        """
+        template = self.get(name, locale)
+        if shared:
+            template = template.bind(shared)
+        return [template.render(context) for context in contexts]
+
+    @property
+    def locales(self) -> list[str]:
+        return sorted({locale for locale, _ in self._templates})
+
+
+email_templates = EmailTemplates(TEMPLATES_DIR, settings.email_default_locale)
@@ -0,0 +1,224 @@
+"""
+Pool de connexions SMTP authentifiées
+"""
+
+import logging
+import queue
+import smtplib
+import threading
+import time
+from dataclasses import dataclass, field
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SMTPPoolMetrics:
+    """Compteurs du pool SMTP (par worker HTTP)"""
+    opened: int = 0
+    closed: int = 0
+    reused: int = 0
+    sent: int = 0
+    noop_failures: int = 0
+    retries: int = 0
+
+
+@dataclass
+class _PooledConnection:
+    """Connexion SMTP ouverte et ses compteurs"""
+    smtp: smtplib.SMTP
+    opened_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)  # dernier envoi
+    last_checked: float = field(default_factory=time.monotonic)  # dernier échange (envoi ou NOOP)
+    messages: int = 0
+
+
+class SMTPConnectionPool:
+    """
+    Connexions SMTP longue durée partagées par les envois
+
+    Les envois (bloquants) se font depuis le threadpool: au plus `size`
+    connexions ouvertes, une par envoi en cours. Une connexion restée
+    inactive plus de `noop_after` secondes est testée par NOOP avant
+    réutilisation; elle est fermée après `max_messages` messages ou
+    `max_idle` secondes d'inactivité. Une connexion coupée est rouverte
+    et l'envoi retenté une fois.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str = "",
+        password: str = "",
+        starttls: bool = True,
+        size: int = 4,
+        max_messages: int = 100,
+        noop_after: float = 30.0,
+        max_idle: float = 300.0,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.size = size
+        self.max_messages = max_messages
+        self.noop_after = noop_after
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.metrics = SMTPPoolMetrics()
+        self._idle: queue.LifoQueue[_PooledConnection] = queue.LifoQueue()
+        # Connexions ouvertes (au repos ou en cours d'utilisation)
+        self._slots = threading.BoundedSemaphore(size)
+        self._open = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> _PooledConnection:
+        """Ouvrir une connexion: TCP, STARTTLS puis AUTH"""
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.user:
+                smtp.login(self.user, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        with self._lock:
+            self._open += 1
+        self.metrics.opened += 1
+        return _PooledConnection(smtp)
+
+    def _close(self, connection: _PooledConnection) -> None:
+        """Fermer une connexion (QUIT si possible)"""
+        try:
+            connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
+        with self._lock:
+            self._open -= 1
+        self.metrics.closed += 1
+
+    def _is_alive(self, connection: _PooledConnection) -> bool:
+        """NOOP sur une connexion restée inactive"""
+        if time.monotonic() - connection.last_checked < self.noop_after:
+            return True
+        try:
+            if connection.smtp.noop()[0] == 250:
+                connection.last_checked = time.monotonic()
+                return True
+        except smtplib.SMTPException:
+            pass
+        except OSError:
+            pass
+        self.metrics.noop_failures += 1
+        return False
+
+    def _acquire(self) -> _PooledConnection:
+        """Prendre une connexion au repos valide, ou en ouvrir une"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if time.monotonic() - connection.last_used < self.max_idle and self._is_alive(connection):
+                self.metrics.reused += 1
+                return connection
+            self._close(connection)
+
+    def _release(self, connection: _PooledConnection) -> None:
+        """Rendre une connexion au pool, ou la fermer si elle a atteint son quota"""
+        connection.last_used = connection.last_checked = time.monotonic()
+        if connection.messages >= self.max_messages:
+            self._close(connection)
+        else:
+            self._idle.put(connection)
+
+    def send(self, from_addr: str, to_addrs: list[str], message: str) -> None:
+        """
+        Envoyer un message (bloquant, attend une connexion libre)
+
+        Raises:
+            smtplib.SMTPException: Refus du serveur (destinataire, authentification...)
+            OSError: Serveur injoignable
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise smtplib.SMTPException("No SMTP connection available in the pool")
+        try:
+            connection = self._acquire()
+            try:
+                connection.smtp.sendmail(from_addr, to_addrs, message)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+                # Refus du serveur (destinataire, expéditeur, contenu): réponse complète,
+                # la connexion reste utilisable, sauf si le serveur l'a fermée (421).
+                # Avant OSError: toutes les exceptions smtplib en héritent.
+                if connection.smtp.sock is None:
+                    self._close(connection)
+                else:
+                    self._release(connection)
+                raise
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Connexion coupée: une seconde tentative sur une connexion neuve
+                self._close(connection)
+                self.metrics.retries += 1
+                connection = self._connect()
+                try:
+                    connection.smtp.sendmail(from_addr, to_addrs, message)
+                except Exception:
+                    self._close(connection)
+                    raise
+            except Exception:
+                self._close(connection)
+                raise
+            connection.messages += 1
+            self.metrics.sent += 1
+            self._release(connection)
+        finally:
+            self._slots.release()
+
+    def keepalive(self) -> None:
+        """Tester par NOOP les connexions au repos et fermer les connexions mortes ou trop inactives"""
+        for _ in range(self._idle.qsize()):
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if time.monotonic() - connection.last_used >= self.max_idle or not self._is_alive(connection):
+                self._close(connection)
+            else:
+                self._idle.put(connection)
+
+    def close(self) -> None:
+        """Fermer les connexions au repos"""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def snapshot(self) -> dict:
+        """Connexions et compteurs"""
+        return {
+            "size": self.size,
+            "open": self._open,
+            "idle": self._idle.qsize(),
+            "max_messages": self.max_messages,
+            **self.metrics.__dict__,
+        }
+
+
+smtp_pool = SMTPConnectionPool(
+    host=settings.smtp_host,
+    port=settings.smtp_port,
+    user=settings.smtp_user,
+    password=settings.smtp_password,
+    starttls=settings.smtp_starttls,
+    size=settings.smtp_pool_size,
+    max_messages=settings.smtp_pool_max_messages,
+    noop_after=settings.smtp_pool_noop_after_seconds,
+    max_idle=settings.smtp_pool_max_idle_seconds,
+    timeout=settings.smtp_timeout,
+)
@@ -0,0 +1,19 @@
+"""
+Tâches de fond (par worker HTTP)
+"""
+
+from infrastructure.workers.email_outbox import EmailOutboxWorker, email_outbox_worker
+from infrastructure.workers.invitation_sweeper import InvitationSweeper, invitation_sweeper
+from infrastructure.workers.password_rehash import rehash_password, schedule_rehash
+from infrastructure.workers.revocation_sync import run_revocation_sync, sync_revocations
+
+__all__ = [
+    "EmailOutboxWorker",
+    "email_outbox_worker",
+    "InvitationSweeper",
+    "invitation_sweeper",
+    "rehash_password",
+    "schedule_rehash",
+    "run_revocation_sync",
+    "sync_revocations",
+]
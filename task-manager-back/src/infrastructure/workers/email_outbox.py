@@ -0,0 +1,181 @@
+"""
+Envoi en tâche de fond des emails de l'outbox
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.entities.outbox_email import OutboxEmail
+from infrastructure.database.repository.email_outbox_repository import EmailOutboxRepositoryImpl
+from infrastructure.external.email_service import EmailService
+from infrastructure.external.email_templates import RenderedEmail
+from infrastructure.external.smtp_pool import smtp_pool
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delay(attempts: int) -> float:
+    """Délai avant la tentative suivante: exponentiel, plafonné, avec gigue de ±20%"""
+    delay = min(
+        settings.email_outbox_backoff_seconds * 2 ** (attempts - 1),
+        settings.email_outbox_backoff_max_seconds,
+    )
+    return delay * random.uniform(0.8, 1.2)
+
+
+@dataclass
+class OutboxMetrics:
+    """Compteurs d'envoi (par worker HTTP)"""
+    batches: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    purged: int = 0
+
+
+class EmailOutboxWorker:
+    """
+    Vide l'outbox: réclame les emails dus par lots et les envoie en parallèle
+
+    Un email réclamé mais non traité (arrêt brutal du worker) redevient
+    disponible après email_outbox_lease_seconds: aucun email n'est perdu,
+    un email peut exceptionnellement être envoyé deux fois.
+    """
+
+    def __init__(self):
+        self.metrics = OutboxMetrics()
+        self._wakeup = asyncio.Event()
+
+    def wake(self) -> None:
+        """Signaler un nouvel email (envoi sans attendre le prochain cycle)"""
+        self._wakeup.set()
+
+    async def drain_once(self) -> int:
+        """Envoyer un lot d'emails dus; retourne la taille du lot"""
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            emails = await EmailOutboxRepositoryImpl(db).claim_due(
+                settings.email_outbox_batch_size,
+                now,
+                now + timedelta(seconds=settings.email_outbox_lease_seconds),
+            )
+        if emails:
+            self.metrics.batches += 1
+            rendered = self._render(emails)
+            semaphore = asyncio.Semaphore(settings.email_outbox_concurrency)
+            await asyncio.gather(*(
+                self._deliver(email, rendered[email.id], semaphore) for email in emails
+            ))
+        return len(emails)
+
+    @staticmethod
+    def _render(emails: list[OutboxEmail]) -> dict:
+        """
+        Rendre un lot: une passe par (type, langue)
+
+        Returns:
+            RenderedEmail, ou l'exception de rendu, par id d'email
+        """
+        groups: dict[tuple, list[OutboxEmail]] = {}
+        for email in emails:
+            groups.setdefault((email.kind.value, email.payload.get("locale")), []).append(email)
+
+        rendered = {}
+        for (template, locale), group in groups.items():
+            payloads = [
+                {key: value for key, value in email.payload.items() if key != "locale"}
+                for email in group
+            ]
+            try:
+                messages = EmailService.render(template, payloads, locale)
+            except Exception:
+                # Un payload invalide ne doit pas bloquer le reste du lot
+                messages = []
+                for payload in payloads:
+                    try:
+                        messages.extend(EmailService.render(template, [payload], locale))
+                    except Exception as e:
+                        messages.append(e)
+            rendered.update(zip((email.id for email in group), messages))
+        return rendered
+
+    async def _deliver(
+        self, email: OutboxEmail, message: RenderedEmail | Exception, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Envoyer un email et enregistrer le résultat"""
+        if isinstance(message, Exception):
+            sent, error = False, f"Rendering failed: {type(message).__name__}: {message}"
+        else:
+            async with semaphore:
+                try:
+                    sent = await asyncio.to_thread(EmailService.send_rendered, email.to_email, message)
+                    error = None if sent else "Delivery failed (see email service logs)"
+                except Exception as e:
+                    sent, error = False, f"{type(e).__name__}: {e}"
+
+        async with AsyncSessionLocal() as db:
+            repository = EmailOutboxRepositoryImpl(db)
+            if sent:
+                await repository.mark_sent(email.id, datetime.now(timezone.utc))
+                self.metrics.sent += 1
+            elif email.attempts >= settings.email_outbox_max_attempts:
+                await repository.mark_failed(email.id, error)
+                self.metrics.failed += 1
+                logger.error(f"Email {email.id} ({email.kind.value}) abandoned after {email.attempts} attempts: {error}")
+            else:
+                delay = backoff_delay(email.attempts)
+                await repository.reschedule(
+                    email.id, error, datetime.now(timezone.utc) + timedelta(seconds=delay)
+                )
+                self.metrics.retried += 1
+                logger.warning(f"Email {email.id} ({email.kind.value}) attempt {email.attempts} failed, retry in {delay:.0f}s: {error}")
+
+    async def purge_sent(self) -> int:
+        """Supprimer les emails envoyés depuis plus de email_outbox_retention_days"""
+        async with AsyncSessionLocal() as db:
+            purged = await EmailOutboxRepositoryImpl(db).delete_sent_before(
+                datetime.now(timezone.utc) - timedelta(days=settings.email_outbox_retention_days)
+            )
+        self.metrics.purged += purged
+        return purged
+
+    async def run(self) -> None:
+        """
+        Boucle d'envoi (tâche de fond du worker)
+
+        Enchaîne les lots tant qu'ils sont pleins, puis attend un nouvel
+        email (wake) ou au plus email_outbox_poll_seconds.
+        """
+        last_purge = time.monotonic()
+        while True:
+            try:
+                self._wakeup.clear()
+                if await self.drain_once() >= settings.email_outbox_batch_size:
+                    continue
+                # Connexions SMTP au repos: NOOP, fermeture des connexions mortes
+                await asyncio.to_thread(smtp_pool.keepalive)
+                if time.monotonic() - last_purge >= 3600:
+                    await self.purge_sent()
+                    last_purge = time.monotonic()
+            except Exception as e:
+                logger.error(f"Email outbox drain failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.email_outbox_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def snapshot(self) -> dict:
+        """Compteurs d'envoi"""
+        return {
+            "concurrency": settings.email_outbox_concurrency,
+            "batch_size": settings.email_outbox_batch_size,
+            **self.metrics.__dict__,
+        }
+
+
+email_outbox_worker = EmailOutboxWorker()
@@ -0,0 +1,88 @@
+"""
+Balayage des invitations expirées ou acceptées
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from infrastructure.database.repository.invitation_repository import InvitationRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SweepMetrics:
+    """Compteurs du balayage (par worker HTTP)"""
+    sweeps: int = 0
+    removed: int = 0
+    errors: int = 0
+    last_removed: int = 0
+    last_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    last_sweep_at: datetime | None = None
+
+
+class InvitationSweeper:
+    """
+    Supprime par lots les invitations expirées ou acceptées depuis plus de
+    invitation_retention_days
+
+    Chaque lot est une transaction courte (au plus invitation_sweep_batch_size
+    lignes): pas de verrou prolongé sur la table pendant un gros rattrapage.
+    """
+
+    def __init__(self):
+        self.metrics = SweepMetrics()
+
+    async def sweep_once(self) -> int:
+        """Balayer jusqu'à épuisement; retourne le nombre d'invitations supprimées"""
+        before = datetime.now(timezone.utc) - timedelta(days=settings.invitation_retention_days)
+        started = time.perf_counter()
+        removed = 0
+        async with AsyncSessionLocal() as db:
+            repository = InvitationRepositoryImpl(db)
+            while True:
+                deleted = await repository.delete_stale(before, settings.invitation_sweep_batch_size)
+                removed += deleted
+                if deleted < settings.invitation_sweep_batch_size:
+                    break
+                # Laisser passer les requêtes entre deux lots
+                await asyncio.sleep(settings.invitation_sweep_pause_seconds)
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.metrics.sweeps += 1
+        self.metrics.removed += removed
+        self.metrics.last_removed = removed
+        self.metrics.last_duration_ms = round(duration_ms, 1)
+        self.metrics.max_duration_ms = max(self.metrics.max_duration_ms, self.metrics.last_duration_ms)
+        self.metrics.last_sweep_at = datetime.now(timezone.utc)
+        return removed
+
+    async def run(self) -> None:
+        """Boucle de balayage (tâche de fond du worker), toutes les invitation_sweep_interval_seconds"""
+        while True:
+            try:
+                removed = await self.sweep_once()
+                if removed:
+                    logger.info(
+                        f"Swept {removed} stale invitations in {self.metrics.last_duration_ms:.0f}ms"
+                    )
+            except Exception as e:
+                self.metrics.errors += 1
+                logger.error(f"Invitation sweep failed: {e}")
+            await asyncio.sleep(settings.invitation_sweep_interval_seconds)
+
+    def snapshot(self) -> dict:
+        """Compteurs du balayage"""
+        return {
+            "retention_days": settings.invitation_retention_days,
+            "batch_size": settings.invitation_sweep_batch_size,
+            "interval_seconds": settings.invitation_sweep_interval_seconds,
+            **self.metrics.__dict__,
+        }
+
+
+invitation_sweeper = InvitationSweeper()
@@ -0,0 +1,53 @@
+"""
+Remplacement en tâche de fond des hashes de mot de passe obsolètes
+"""
+
+import asyncio
+import logging
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.entities.user import User
+from core.services.password_hasher import password_hasher
+from infrastructure.database.repository.user_repository import UserRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+# Tâches en cours (référence conservée jusqu'à leur fin)
+_pending: set[asyncio.Task] = set()
+
+
+async def rehash_password(user: User, password: str) -> bool:
+    """
+    Recalculer le hash d'un mot de passe vérifié avec la politique courante
+
+    Returns:
+        True si le hash a été remplacé
+    """
+    try:
+        new_hash = await password_hasher.hash(password)
+        async with AsyncSessionLocal() as db:
+            updated = await UserRepositoryImpl(db).update_password_hash(
+                user.id, user.password, new_hash
+            )
+    except Exception as e:
+        logger.warning(f"Password rehash failed for user {user.id}: {e}")
+        return False
+    if updated:
+        logger.info(f"Password hash upgraded for user {user.id}")
+    return updated
+
+
+def schedule_rehash(user: User, password: str) -> None:
+    """
+    Planifier le remplacement du hash si la politique a changé
+
+    Sans effet si trop de rehashs sont déjà en cours: le hash sera remplacé
+    à une connexion suivante.
+    """
+    if not password_hasher.needs_update(user.password):
+        return
+    if len(_pending) >= settings.password_rehash_max_pending:
+        return
+    task = asyncio.create_task(rehash_password(user, password))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
@@ -0,0 +1,62 @@
+"""
+Synchronisation du registre des révocations avec la table revoked_token
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.services.revocation_store import RevocationStore
+from infrastructure.database.repository.revoked_token_repository import RevokedTokenRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+# Recouvrement des fenêtres de synchronisation (transactions validées en retard)
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+async def sync_revocations(store: RevocationStore, since: datetime | None = None) -> datetime | None:
+    """
+    Importer les révocations enregistrées depuis `since` (toutes si None)
+
+    Returns:
+        La date de révocation la plus récente vue, point de départ de la synchronisation suivante
+    """
+    async with AsyncSessionLocal() as db:
+        revoked_tokens = await RevokedTokenRepositoryImpl(db).find_active(
+            since - SYNC_OVERLAP if since is not None else None
+        )
+    for revoked_token in revoked_tokens:
+        store.add(revoked_token.jti, revoked_token.expires_at.timestamp())
+        if since is None or revoked_token.revoked_at > since:
+            since = revoked_token.revoked_at
+    store.prune()
+    return since
+
+
+async def prune_revocations() -> int:
+    """Supprimer de la base les révocations expirées"""
+    async with AsyncSessionLocal() as db:
+        return await RevokedTokenRepositoryImpl(db).delete_expired(datetime.now(timezone.utc))
+
+
+async def run_revocation_sync(store: RevocationStore, since: datetime | None = None) -> None:
+    """
+    Boucle de synchronisation (tâche de fond du worker)
+
+    Importe toutes les auth_revocation_sync_seconds les révocations des autres
+    workers et purge la table toutes les auth_revocation_prune_seconds.
+    """
+    last_prune = time.monotonic()
+    while True:
+        await asyncio.sleep(settings.auth_revocation_sync_seconds)
+        try:
+            since = await sync_revocations(store, since)
+            if time.monotonic() - last_prune >= settings.auth_revocation_prune_seconds:
+                pruned = await prune_revocations()
+                last_prune = time.monotonic()
+                logger.info(f"Pruned {pruned} expired token revocations")
+        except Exception as e:
+            logger.error(f"Token revocation sync failed: {e}")
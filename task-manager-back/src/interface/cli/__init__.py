@@ -0,0 +1,3 @@
+"""
+Commandes en ligne (python -m interface.cli.<commande>, depuis src/)
+"""
@@ -0,0 +1,65 @@
+"""
+Import de tâches depuis un fichier NDJSON ou CSV (gzip accepté)
+
+Usage (depuis src/):
+    python -m interface.cli.import_tasks taches.ndjson
+    python -m interface.cli.import_tasks taches.csv.gz
+    python -m interface.cli.import_tasks export.txt --format csv
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+from config.database import AsyncSessionLocal, engine
+from core.dto.task_dto import TaskImportResultDTO
+from interface.http.controllers.task_controller import TaskController
+from interface.http.imports import ImportFormat, parse_records
+
+CHUNK_SIZE = 1 << 20
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Contenu du fichier par blocs (lectures locales, courtes)"""
+    with path.open("rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def import_file(path: Path, import_format: ImportFormat) -> TaskImportResultDTO:
+    """Importer un fichier de tâches"""
+    gzip = path.suffix == ".gz"
+    try:
+        async with AsyncSessionLocal() as db:
+            return await TaskController(db).import_tasks(
+                parse_records(_read_chunks(path), import_format, gzip)
+            )
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Importer des tâches (NDJSON ou CSV)")
+    parser.add_argument("path", type=Path, help="Fichier .ndjson, .csv (éventuellement .gz)")
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in ImportFormat],
+        help="Format du fichier (déduit de l'extension par défaut)",
+    )
+    args = parser.parse_args(argv)
+
+    name = args.path.name.removesuffix(".gz")
+    import_format = ImportFormat(args.format or ("csv" if name.endswith(".csv") else "ndjson"))
+    result = asyncio.run(import_file(args.path, import_format))
+
+    for error in result.errors:
+        print(f"ligne {error.line}: {'; '.join(error.errors)}", file=sys.stderr)
+    if result.rejected > len(result.errors):
+        print(f"... {result.rejected - len(result.errors)} autres lignes refusées", file=sys.stderr)
+    print(f"{result.imported} tâches importées, {result.rejected} lignes refusées")
+    return 1 if result.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
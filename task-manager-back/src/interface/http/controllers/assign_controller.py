@@ -2,10 +2,14 @@
 Controller pour Assign
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.dto.assign_dto import AssignCreateDTO, AssignResponseDTO
+from core.valueObjects.page import Page
 from infrastructure.database.repository.assign_repository import AssignRepositoryImpl
+from interface.http.dependencies.pagination import PageParams
 from interface.http.mappers.assign_mapper import (
     map_assign_create_dto_to_entity,
     map_assign_entity_to_response,
@@ -15,36 +19,66 @@ from interface.http.mappers.assign_mapper import (
 class AssignController:
     """Controller pour les opérations Assign"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
+        self.db = db
         self.repository = AssignRepositoryImpl(db)
 
-    def create(self, dto: AssignCreateDTO) -> AssignResponseDTO:
-        """Créer une assignation"""
+    async def create(self, dto: AssignCreateDTO) -> AssignResponseDTO | str:
+        """
+        Créer une assignation
+
+        Returns:
+            AssignResponseDTO ou message d'erreur (str) si déjà assignée
+        """
         entity = map_assign_create_dto_to_entity(dto)
-        saved_entity = self.repository.save(entity)
+        try:
+            saved_entity = await self.repository.save(entity)
+        except IntegrityError:
+            # Contrainte unique (task_id, user_id)
+            await self.db.rollback()
+            return "Cette tâche est déjà assignée à cet utilisateur"
         return map_assign_entity_to_response(saved_entity)
 
-    def get_all(self) -> list[AssignResponseDTO]:
+    async def get_all(self) -> list[AssignResponseDTO]:
         """Récupérer toutes les assignations"""
-        entities = self.repository.find_all()
+        entities = await self.repository.find_all()
         return [map_assign_entity_to_response(e) for e in entities]
 
-    def get_by_id(self, id: UUID) -> AssignResponseDTO | None:
+    async def export(self, batch_size: int) -> AsyncIterator[list[AssignResponseDTO]]:
+        """Exporter toutes les assignations par lots"""
+        async for entities in self.repository.stream_all(batch_size):
+            yield [map_assign_entity_to_response(e) for e in entities]
+
+    async def get_page(self, params: PageParams) -> Page[AssignResponseDTO]:
+        """Récupérer une page d'assignations"""
+        page = await self.repository.find_page(params.limit, params.after, params.with_total)
+        return page.map(map_assign_entity_to_response)
+
+    async def get_by_id(self, id: UUID) -> AssignResponseDTO | None:
         """Récupérer une assignation par son ID"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return None
         return map_assign_entity_to_response(entity)
 
-    def delete(self, id: UUID) -> bool:
+    async def delete(self, id: UUID) -> bool:
         """Supprimer une assignation"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return False
-        self.repository.delete(id)
+        await self.repository.delete(id)
         return True
 
-    def get_assignments_for_user(self, user_id: UUID) -> list[AssignResponseDTO]:
+    async def get_assignments_for_user(self, user_id: UUID) -> list[AssignResponseDTO]:
         """Récupérer les assignations d'un utilisateur"""
-        entities = self.repository.get_assignments_for_user(user_id)
+        entities = await self.repository.get_assignments_for_user(user_id)
         return [map_assign_entity_to_response(e) for e in entities]
+
+    async def get_assignments_page_for_user(
+        self, user_id: UUID, params: PageParams
+    ) -> Page[AssignResponseDTO]:
+        """Récupérer une page des assignations d'un utilisateur"""
+        page = await self.repository.get_assignments_page_for_user(
+            user_id, params.limit, params.after, params.with_total
+        )
+        return page.map(map_assign_entity_to_response)
@@ -4,30 +4,40 @@ Controller pour l'authentification
 
 from uuid import uuid4
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.dto.auth_dto import LoginDTO, RegisterDTO, TokenDTO, RefreshTokenDTO
 from core.dto.user_dto import UserResponseDTO
+from core.entities.outbox_email import OutboxEmail, OutboxEmailKind
 from core.entities.user import User, UserRole
 from core.services.auth_service import AuthService
+from core.services.password_hasher import password_hasher
+from core.services.rate_limiter import login_throttle
+from core.services.revocation_store import revocation_store
+from core.valueObjects.token_claims import TokenClaims
 from infrastructure.database.repository.user_repository import UserRepositoryImpl
-from infrastructure.external.email_service import EmailService
+from infrastructure.database.repository.revoked_token_repository import RevokedTokenRepositoryImpl
+from infrastructure.database.repository.email_outbox_repository import EmailOutboxRepositoryImpl
+from infrastructure.workers.email_outbox import email_outbox_worker
+from infrastructure.workers.password_rehash import schedule_rehash
 from interface.http.mappers.user_mapper import map_user_entity_to_response
 
 
 class AuthController:
     """Controller pour les opérations d'authentification"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.repository = UserRepositoryImpl(db)
+        self.revoked_token_repository = RevokedTokenRepositoryImpl(db)
+        self.outbox_repository = EmailOutboxRepositoryImpl(db)
         self.auth_service = AuthService()
 
-    def register(self, dto: RegisterDTO) -> UserResponseDTO:
+    async def register(self, dto: RegisterDTO) -> UserResponseDTO:
         """
         Inscrire un nouvel utilisateur (toujours OWNER)
         Retourne None si l'email existe déjà
         """
         # Vérifier si l'email existe déjà
-        existing_user = self.repository.find_by_email(dto.email)
+        existing_user = await self.repository.find_by_email(dto.email)
         if existing_user is not None:
             return None
 
@@ -38,74 +48,97 @@ class AuthController:
             first_name=dto.first_name,
             last_name=dto.last_name,
             email=dto.email,
-            password=AuthService.hash_password(dto.password),
+            password=await password_hasher.hash(dto.password),
             verified=True,
             role=UserRole.OWNER,
             created_at=now,
             updated_at=now,
         )
 
-        saved_user = self.repository.save(user)
+        # Email de bienvenue: enregistré dans la transaction de l'utilisateur, envoyé en tâche de fond
+        await self.outbox_repository.add(OutboxEmail(
+            id=uuid4(),
+            kind=OutboxEmailKind.WELCOME,
+            to_email=user.email,
+            payload={"first_name": user.first_name},
+        ))
 
-        # Envoyer l'email de bienvenue
-        EmailService.send_welcome_email(saved_user.email, saved_user.first_name)
+        saved_user = await self.repository.save(user)
+        email_outbox_worker.wake()
 
         return map_user_entity_to_response(saved_user)
 
-    def login(self, dto: LoginDTO) -> TokenDTO | None:
+    async def login(self, dto: LoginDTO, client_ip: str | None = None) -> TokenDTO | None:
         """
         Connecter un utilisateur
         Retourne None si les identifiants sont invalides
+
+        Raises:
+            RateLimitError: Trop de tentatives pour cette IP ou cet email (avant tout hashage)
         """
+        await login_throttle.check(client_ip, dto.email)
+
         # Trouver l'utilisateur par email
-        user = self.repository.find_by_email(dto.email)
+        user = await self.repository.find_by_email(dto.email)
         if user is None:
+            # Même coût qu'un mauvais mot de passe: pas d'énumération des comptes par le temps de réponse
+            await password_hasher.dummy_verify(dto.password)
             return None
 
-        # Vérifier le mot de passe
-        if not AuthService.verify_password(dto.password, user.password):
+        # Vérifier le mot de passe (échec déjà compté par check)
+        if not await password_hasher.verify(dto.password, user.password):
             return None
+        await login_throttle.record_success(dto.email)
+
+        # Hash d'un ancien algorithme ou coût: remplacé après la réponse
+        schedule_rehash(user, dto.password)
 
         # Créer les tokens
-        access_token = AuthService.create_access_token(user)
-        refresh_token = AuthService.create_refresh_token(user)
+        access_token, refresh_token = AuthService.create_token_pair(user)
 
         return TokenDTO(
             access_token=access_token,
             refresh_token=refresh_token,
         )
 
-    def refresh_token(self, dto: RefreshTokenDTO) -> TokenDTO | None:
+    async def refresh_token(self, dto: RefreshTokenDTO) -> TokenDTO | None:
         """
-        Rafraîchir le token d'accès
-        Retourne None si le refresh token est invalide
+        Rafraîchir le token d'accès (rotation du refresh token)
+        Retourne None si le refresh token est invalide, révoqué ou déjà utilisé
         """
-        # Vérifier que c'est bien un refresh token
-        if not AuthService.is_refresh_token(dto.refresh_token):
+        # Vérifier le refresh token (signature, expiration et type) en un seul décodage
+        claims = AuthService.verify_token(
+            dto.refresh_token, expected_type="refresh", use_cache=False
+        )
+        if claims is None:
             return None
 
-        # Vérifier si le token est expiré
-        if AuthService.is_token_expired(dto.refresh_token):
+        # Usage unique: une réutilisation révoque toute la session
+        if not await revocation_store.consume_refresh_token(self.revoked_token_repository, claims):
             return None
 
         # Récupérer l'utilisateur
-        user_id = AuthService.get_user_id_from_token(dto.refresh_token)
-        if user_id is None:
-            return None
-
-        user = self.repository.find_by_id(user_id)
+        user = await self.repository.find_by_id(claims.user_id)
         if user is None:
             return None
 
-        # Créer de nouveaux tokens
-        access_token = AuthService.create_access_token(user)
-        refresh_token = AuthService.create_refresh_token(user)
+        # Créer de nouveaux tokens dans la même session
+        access_token, refresh_token = AuthService.create_token_pair(user, session_id=claims.sid)
 
         return TokenDTO(
             access_token=access_token,
             refresh_token=refresh_token,
         )
 
+    async def logout(self, claims: TokenClaims) -> bool:
+        """
+        Révoquer la session du token (access et refresh tokens associés)
+
+        Returns:
+            False si le token n'est pas révocable (ancien token sans jti ni sid)
+        """
+        return await revocation_store.revoke_session(self.revoked_token_repository, claims)
+
     def get_me(self, user: User) -> UserResponseDTO:
         """Récupérer les informations de l'utilisateur courant"""
         return map_user_entity_to_response(user)
@@ -4,42 +4,64 @@ Controller pour les invitations
 
 import secrets
 from uuid import uuid4
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
 from core.dto.invitation_dto import (
     InviteCreateDTO,
+    InviteBulkCreateDTO,
+    InviteBulkStatus,
+    InviteBulkRowDTO,
+    InviteBulkResultDTO,
     InviteAcceptDTO,
     InvitationResponseDTO,
     InvitationDetailDTO,
 )
 from core.dto.auth_dto import TokenDTO
 from core.entities.invitation import Invitation
+from core.entities.outbox_email import OutboxEmail, OutboxEmailKind
 from core.entities.user import User, UserRole
 from core.entities.assign import Assign
 from core.services.auth_service import AuthService
+from core.services.password_hasher import password_hasher
+from core.valueObjects.page import Page
 from infrastructure.database.repository.invitation_repository import InvitationRepositoryImpl
 from infrastructure.database.repository.user_repository import UserRepositoryImpl
 from infrastructure.database.repository.task_repository import TaskRepositoryImpl
 from infrastructure.database.repository.assign_repository import AssignRepositoryImpl
-from infrastructure.external.email_service import EmailService
+from infrastructure.database.repository.email_outbox_repository import EmailOutboxRepositoryImpl
+from infrastructure.workers.email_outbox import email_outbox_worker
+from interface.http.dependencies.pagination import PageParams
 from interface.http.mappers.invitation_mapper import (
     map_invitation_entity_to_response,
-    map_invitation_entity_to_detail,
+    map_invitation_details_to_dto,
 )
 
+_email_adapter = TypeAdapter(EmailStr)
+
+# Messages des lignes refusées d'une invitation groupée
+_BULK_ERRORS = {
+    InviteBulkStatus.INVALID_EMAIL: "Adresse email invalide",
+    InviteBulkStatus.DUPLICATE: "Email présent plusieurs fois dans la requête",
+    InviteBulkStatus.TASK_NOT_FOUND: "Tâche non trouvée",
+    InviteBulkStatus.USER_EXISTS: "Un utilisateur avec cet email existe déjà. Assignez-le directement à la tâche.",
+    InviteBulkStatus.ALREADY_PENDING: "Une invitation est déjà en attente pour cet email et cette tâche",
+}
+
 
 class InvitationController:
     """Controller pour les opérations d'invitation"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.invitation_repo = InvitationRepositoryImpl(db)
         self.user_repo = UserRepositoryImpl(db)
         self.task_repo = TaskRepositoryImpl(db)
         self.assign_repo = AssignRepositoryImpl(db)
-        self.email_service = EmailService()
+        self.outbox_repo = EmailOutboxRepositoryImpl(db)
 
-    def create_invitation(
+    async def create_invitation(
         self,
         dto: InviteCreateDTO,
         current_user: User
@@ -51,17 +73,17 @@ class InvitationController:
             InvitationResponseDTO si succès, str avec message d'erreur sinon
         """
         # Vérifier que la tâche existe
-        task = self.task_repo.find_by_id(dto.task_id)
+        task = await self.task_repo.find_by_id(dto.task_id)
         if task is None:
             return "Tâche non trouvée"
 
         # Vérifier si l'utilisateur existe déjà
-        existing_user = self.user_repo.find_by_email(dto.email)
+        existing_user = await self.user_repo.find_by_email(dto.email)
         if existing_user is not None:
             return "Un utilisateur avec cet email existe déjà. Assignez-le directement à la tâche."
 
         # Vérifier s'il y a déjà une invitation en attente pour cet email et cette tâche
-        existing_invitations = self.invitation_repo.find_by_email(dto.email)
+        existing_invitations = await self.invitation_repo.find_by_email(dto.email)
         for inv in existing_invitations:
             if inv.task_id == dto.task_id and inv.is_valid():
                 return "Une invitation est déjà en attente pour cet email et cette tâche"
@@ -70,7 +92,7 @@ class InvitationController:
         token = secrets.token_urlsafe(32)
 
         # Créer l'invitation
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         invitation = Invitation(
             id=uuid4(),
             email=dto.email,
@@ -82,64 +104,139 @@ class InvitationController:
             created_at=now,
         )
 
-        saved_invitation = self.invitation_repo.save(invitation)
+        # Email d'invitation: enregistré dans la transaction de l'invitation, envoyé en tâche de fond
+        await self._add_invitation_email(dto.email, current_user, task.title, token)
 
-        # Envoyer l'email d'invitation
-        inviter_name = f"{current_user.first_name} {current_user.last_name}"
-        self.email_service.send_invitation_email(
-            to_email=dto.email,
-            inviter_name=inviter_name,
-            task_title=task.title,
-            invitation_token=token,
-        )
+        saved_invitation = await self.invitation_repo.save(invitation)
+        email_outbox_worker.wake()
 
         return map_invitation_entity_to_response(saved_invitation)
 
-    def get_all_pending(self) -> list[InvitationDetailDTO]:
-        """Récupérer toutes les invitations en attente avec détails"""
-        invitations = self.invitation_repo.find_pending()
-        result = []
+    async def create_invitations_bulk(
+        self,
+        dto: InviteBulkCreateDTO,
+        current_user: User
+    ) -> InviteBulkResultDTO | str:
+        """
+        Inviter plusieurs emails à plusieurs tâches
 
-        for inv in invitations:
-            task = self.task_repo.find_by_id(inv.task_id)
-            inviter = self.user_repo.find_by_id(inv.invited_by)
+        Mêmes règles que create_invitation, vérifiées par requêtes groupées;
+        les invitations valides et leurs emails sont enregistrés dans une
+        seule transaction. Chaque couple (email, tâche) a son résultat.
 
-            task_title = task.title if task else "Tâche supprimée"
-            inviter_name = f"{inviter.first_name} {inviter.last_name}" if inviter else "Utilisateur supprimé"
+        Returns:
+            InviteBulkResultDTO si succès, str avec message d'erreur sinon
+        """
+        task_ids = list(dict.fromkeys(dto.task_ids))
+        if len(dto.emails) * len(task_ids) > settings.invitation_bulk_max_rows:
+            return f"Au plus {settings.invitation_bulk_max_rows} invitations par requête"
+
+        # Validation des emails et doublons (sans tenir compte de la casse)
+        # (email, motif de refus ou None)
+        emails: list[tuple[str, InviteBulkStatus | None]] = []
+        seen: set[str] = set()
+        for raw in dto.emails:
+            try:
+                email = _email_adapter.validate_python(raw.strip())
+            except ValidationError:
+                emails.append((raw, InviteBulkStatus.INVALID_EMAIL))
+                continue
+            if email.lower() in seen:
+                emails.append((email, InviteBulkStatus.DUPLICATE))
+                continue
+            seen.add(email.lower())
+            emails.append((email, None))
+        valid_emails = [email for email, rejected in emails if rejected is None]
+
+        # Vérifications groupées: une requête par règle
+        titles = await self.task_repo.find_titles(task_ids)
+        existing_users = await self.user_repo.find_existing_emails(valid_emails)
+        pending = await self.invitation_repo.find_pending_pairs(valid_emails, list(titles))
+
+        now = datetime.now(timezone.utc)
+        inviter_name = f"{current_user.first_name} {current_user.last_name}"
+        invitations: list[Invitation] = []
+        results: list[InviteBulkRowDTO] = []
+        for email, rejected in emails:
+            for task_id in task_ids:
+                if rejected is not None:
+                    status = rejected
+                elif task_id not in titles:
+                    status = InviteBulkStatus.TASK_NOT_FOUND
+                elif email.lower() in existing_users:
+                    status = InviteBulkStatus.USER_EXISTS
+                elif (email.lower(), task_id) in pending:
+                    status = InviteBulkStatus.ALREADY_PENDING
+                else:
+                    invitation = Invitation(
+                        id=uuid4(),
+                        email=email,
+                        task_id=task_id,
+                        token=secrets.token_urlsafe(32),
+                        invited_by=current_user.id,
+                        accepted=False,
+                        expires_at=now + timedelta(days=7),
+                        created_at=now,
+                    )
+                    invitations.append(invitation)
+                    await self.outbox_repo.add(OutboxEmail(
+                        id=uuid4(),
+                        kind=OutboxEmailKind.INVITATION,
+                        to_email=email,
+                        payload={
+                            "inviter_name": inviter_name,
+                            "task_title": titles[task_id],
+                            "invitation_token": invitation.token,
+                        },
+                    ))
+                    results.append(InviteBulkRowDTO(
+                        email=email,
+                        task_id=task_id,
+                        status=InviteBulkStatus.CREATED,
+                        invitation_id=invitation.id,
+                    ))
+                    continue
+                results.append(InviteBulkRowDTO(
+                    email=email, task_id=task_id, status=status, detail=_BULK_ERRORS[status]
+                ))
+
+        if invitations:
+            await self.invitation_repo.save_many(invitations)
+            email_outbox_worker.wake()
+
+        return InviteBulkResultDTO(
+            created=len(invitations),
+            rejected=len(results) - len(invitations),
+            results=results,
+        )
 
-            result.append(map_invitation_entity_to_detail(inv, task_title, inviter_name))
+    async def get_all_pending(self) -> list[InvitationDetailDTO]:
+        """Récupérer toutes les invitations en attente avec détails"""
+        details = await self.invitation_repo.find_pending_with_details()
+        return [map_invitation_details_to_dto(d) for d in details]
 
-        return result
+    async def get_pending_page(self, params: PageParams) -> Page[InvitationDetailDTO]:
+        """Récupérer une page d'invitations en attente avec détails"""
+        page = await self.invitation_repo.find_pending_page_with_details(
+            params.limit, params.after, params.with_total
+        )
+        return page.map(map_invitation_details_to_dto)
 
-    def get_by_id(self, id) -> InvitationDetailDTO | None:
+    async def get_by_id(self, id) -> InvitationDetailDTO | None:
         """Récupérer une invitation par son ID avec détails"""
-        invitation = self.invitation_repo.find_by_id(id)
-        if invitation is None:
+        details = await self.invitation_repo.find_by_id_with_details(id)
+        if details is None:
             return None
+        return map_invitation_details_to_dto(details)
 
-        task = self.task_repo.find_by_id(invitation.task_id)
-        inviter = self.user_repo.find_by_id(invitation.invited_by)
-
-        task_title = task.title if task else "Tâche supprimée"
-        inviter_name = f"{inviter.first_name} {inviter.last_name}" if inviter else "Utilisateur supprimé"
-
-        return map_invitation_entity_to_detail(invitation, task_title, inviter_name)
-
-    def get_by_token(self, token: str) -> InvitationDetailDTO | None:
+    async def get_by_token(self, token: str) -> InvitationDetailDTO | None:
         """Récupérer une invitation par son token avec détails"""
-        invitation = self.invitation_repo.find_by_token(token)
-        if invitation is None:
+        details = await self.invitation_repo.find_by_token_with_details(token)
+        if details is None:
             return None
+        return map_invitation_details_to_dto(details)
 
-        task = self.task_repo.find_by_id(invitation.task_id)
-        inviter = self.user_repo.find_by_id(invitation.invited_by)
-
-        task_title = task.title if task else "Tâche supprimée"
-        inviter_name = f"{inviter.first_name} {inviter.last_name}" if inviter else "Utilisateur supprimé"
-
-        return map_invitation_entity_to_detail(invitation, task_title, inviter_name)
-
-    def accept_invitation(self, dto: InviteAcceptDTO) -> TokenDTO | str:
+    async def accept_invitation(self, dto: InviteAcceptDTO) -> TokenDTO | str:
         """
         Accepter une invitation: créer le compte et assigner la tâche
 
@@ -147,7 +244,7 @@ class InvitationController:
             TokenDTO si succès, str avec message d'erreur sinon
         """
         # Trouver l'invitation par token
-        invitation = self.invitation_repo.find_by_token(dto.token)
+        invitation = await self.invitation_repo.find_by_token(dto.token)
         if invitation is None:
             return "Invitation non trouvée"
 
@@ -159,25 +256,33 @@ class InvitationController:
             return "Cette invitation a expiré"
 
         # Vérifier que l'email n'est pas déjà utilisé
-        existing_user = self.user_repo.find_by_email(invitation.email)
+        existing_user = await self.user_repo.find_by_email(invitation.email)
         if existing_user is not None:
             return "Un compte existe déjà avec cet email"
 
         # Créer le nouvel utilisateur
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         new_user = User(
             id=uuid4(),
             first_name=dto.first_name,
             last_name=dto.last_name,
             email=invitation.email,
-            password=AuthService.hash_password(dto.password),
+            password=await password_hasher.hash(dto.password),
             verified=True,  # Vérifié car invité par un OWNER
             role=UserRole.MEMBER,
             created_at=now,
             updated_at=now,
         )
 
-        saved_user = self.user_repo.save(new_user)
+        # Email de bienvenue: enregistré dans la transaction de l'utilisateur
+        await self.outbox_repo.add(OutboxEmail(
+            id=uuid4(),
+            kind=OutboxEmailKind.WELCOME,
+            to_email=new_user.email,
+            payload={"first_name": new_user.first_name},
+        ))
+
+        saved_user = await self.user_repo.save(new_user)
 
         # Créer l'assignation à la tâche
         assign = Assign(
@@ -185,54 +290,59 @@ class InvitationController:
             task_id=invitation.task_id,
             user_id=saved_user.id,
         )
-        self.assign_repo.save(assign)
+        await self.assign_repo.save(assign)
 
         # Marquer l'invitation comme acceptée
         invitation.accepted = True
-        self.invitation_repo.update(invitation)
-
-        # Envoyer l'email de bienvenue
-        self.email_service.send_welcome_email(
-            to_email=saved_user.email,
-            first_name=saved_user.first_name,
-        )
+        await self.invitation_repo.update(invitation)
+        email_outbox_worker.wake()
 
         # Générer les tokens pour connexion automatique
-        access_token = AuthService.create_access_token(saved_user)
-        refresh_token = AuthService.create_refresh_token(saved_user)
+        access_token, refresh_token = AuthService.create_token_pair(saved_user)
 
         return TokenDTO(
             access_token=access_token,
             refresh_token=refresh_token,
         )
 
-    def delete(self, id) -> bool:
+    async def delete(self, id) -> bool:
         """Supprimer/Annuler une invitation"""
-        invitation = self.invitation_repo.find_by_id(id)
+        invitation = await self.invitation_repo.find_by_id(id)
         if invitation is None:
             return False
-        self.invitation_repo.delete(id)
+        await self.invitation_repo.delete(id)
         return True
 
-    def resend_invitation(self, id, current_user: User) -> bool:
+    async def resend_invitation(self, id, current_user: User) -> bool:
         """Renvoyer l'email d'invitation"""
-        invitation = self.invitation_repo.find_by_id(id)
+        invitation = await self.invitation_repo.find_by_id(id)
         if invitation is None:
             return False
 
         if invitation.accepted:
             return False
 
-        task = self.task_repo.find_by_id(invitation.task_id)
+        task = await self.task_repo.find_by_id(invitation.task_id)
         if task is None:
             return False
 
-        inviter_name = f"{current_user.first_name} {current_user.last_name}"
-        self.email_service.send_invitation_email(
-            to_email=invitation.email,
-            inviter_name=inviter_name,
-            task_title=task.title,
-            invitation_token=invitation.token,
-        )
+        await self._add_invitation_email(invitation.email, current_user, task.title, invitation.token)
+        await self.db.commit()
+        email_outbox_worker.wake()
 
         return True
+
+    async def _add_invitation_email(
+        self, to_email: str, inviter: User, task_title: str, token: str
+    ) -> None:
+        """Ajouter l'email d'invitation à la transaction en cours"""
+        await self.outbox_repo.add(OutboxEmail(
+            id=uuid4(),
+            kind=OutboxEmailKind.INVITATION,
+            to_email=to_email,
+            payload={
+                "inviter_name": f"{inviter.first_name} {inviter.last_name}",
+                "task_title": task_title,
+                "invitation_token": token,
+            },
+        ))
@@ -2,10 +2,24 @@
 Controller pour Task
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
-from sqlalchemy.orm import Session
-from core.dto.task_dto import TaskCreateDTO, TaskUpdateDTO, TaskResponseDTO
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from core.dto.task_dto import (
+    TaskCreateDTO,
+    TaskUpdateDTO,
+    TaskResponseDTO,
+    TaskImportErrorDTO,
+    TaskImportResultDTO,
+)
+from core.errors.task_errors import TaskAssigneesConflictError
+from core.valueObjects.page import Page
 from infrastructure.database.repository.task_repository import TaskRepositoryImpl
+from infrastructure.database.repository.user_repository import UserRepositoryImpl
+from interface.http.dependencies.pagination import PageParams
 from interface.http.mappers.task_mapper import (
     map_task_create_dto_to_entity,
     map_task_entity_to_response,
@@ -15,30 +29,75 @@ from interface.http.mappers.task_mapper import (
 class TaskController:
     """Controller pour les opérations Task"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
+        self.db = db
         self.repository = TaskRepositoryImpl(db)
+        self.user_repository = UserRepositoryImpl(db)
+
+    async def _unknown_assignees(self, assigned_to: list[UUID]) -> str | None:
+        """Message d'erreur si des assignés n'existent pas (une requête)"""
+        existing = await self.user_repository.find_existing_ids(list(set(assigned_to)))
+        unknown = [str(user_id) for user_id in dict.fromkeys(assigned_to) if user_id not in existing]
+        if unknown:
+            return f"Utilisateurs assignés introuvables: {', '.join(unknown)}"
+        return None
+
+    async def create(self, dto: TaskCreateDTO) -> TaskResponseDTO | str:
+        """
+        Créer une tâche et ses assignations
+
+        Returns:
+            TaskResponseDTO si succès, str avec message d'erreur sinon
 
-    def create(self, dto: TaskCreateDTO) -> TaskResponseDTO:
-        """Créer une tâche"""
+        Raises:
+            TaskAssigneesConflictError: Assigné supprimé entre la vérification et l'insertion
+        """
+        error = await self._unknown_assignees(dto.assigned_to)
+        if error is not None:
+            return error
         entity = map_task_create_dto_to_entity(dto)
-        saved_entity = self.repository.save(entity)
+        try:
+            saved_entity = await self.repository.save(entity)
+        except IntegrityError:
+            await self.db.rollback()
+            raise TaskAssigneesConflictError()
         return map_task_entity_to_response(saved_entity)
 
-    def get_all(self) -> list[TaskResponseDTO]:
+    async def get_all(self) -> list[TaskResponseDTO]:
         """Récupérer toutes les tâches"""
-        entities = self.repository.find_all()
+        entities = await self.repository.find_all()
         return [map_task_entity_to_response(e) for e in entities]
 
-    def get_by_id(self, id: UUID) -> TaskResponseDTO | None:
+    async def export(self, batch_size: int) -> AsyncIterator[list[TaskResponseDTO]]:
+        """Exporter toutes les tâches par lots"""
+        async for entities in self.repository.stream_all(batch_size):
+            yield [map_task_entity_to_response(e) for e in entities]
+
+    async def get_page(self, params: PageParams) -> Page[TaskResponseDTO]:
+        """Récupérer une page de tâches"""
+        page = await self.repository.find_page(params.limit, params.after, params.with_total)
+        return page.map(map_task_entity_to_response)
+
+    async def get_by_id(self, id: UUID) -> TaskResponseDTO | None:
         """Récupérer une tâche par son ID"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return None
         return map_task_entity_to_response(entity)
 
-    def update(self, id: UUID, dto: TaskUpdateDTO) -> TaskResponseDTO | None:
-        """Mettre à jour une tâche"""
-        entity = self.repository.find_by_id(id)
+    async def update(self, id: UUID, dto: TaskUpdateDTO) -> TaskResponseDTO | str | None:
+        """
+        Mettre à jour une tâche; assigned_to, s'il est fourni, remplace les assignés
+
+        Returns:
+            TaskResponseDTO si succès, None si la tâche n'existe pas,
+            str avec message d'erreur sinon
+
+        Raises:
+            TaskAssigneesConflictError: Assigné supprimé entre la vérification et la mise à jour,
+                ou même assigné ajouté en parallèle
+        """
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return None
 
@@ -54,19 +113,104 @@ class TaskController:
             entity.start_date = dto.start_date
         if dto.due_date is not None:
             entity.due_date = dto.due_date
+        if dto.assigned_to is not None:
+            error = await self._unknown_assignees(dto.assigned_to)
+            if error is not None:
+                return error
+            entity.assigned_to = dto.assigned_to
 
-        updated_entity = self.repository.update(entity)
+        try:
+            updated_entity = await self.repository.update(entity)
+        except IntegrityError:
+            await self.db.rollback()
+            raise TaskAssigneesConflictError()
+        if updated_entity is None:
+            return None
         return map_task_entity_to_response(updated_entity)
 
-    def delete(self, id: UUID) -> bool:
+    async def delete(self, id: UUID) -> bool:
         """Supprimer une tâche"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return False
-        self.repository.delete(id)
+        await self.repository.delete(id)
         return True
 
-    def get_tasks_for_user(self, user_id: UUID) -> list[TaskResponseDTO]:
+    async def get_tasks_for_user(self, user_id: UUID) -> list[TaskResponseDTO]:
         """Récupérer les tâches assignées à un utilisateur"""
-        entities = self.repository.get_tasks_for_user(user_id)
+        entities = await self.repository.get_tasks_for_user(user_id)
         return [map_task_entity_to_response(e) for e in entities]
+
+    async def get_tasks_page_for_user(
+        self, user_id: UUID, params: PageParams
+    ) -> Page[TaskResponseDTO]:
+        """Récupérer une page des tâches assignées à un utilisateur"""
+        page = await self.repository.get_tasks_page_for_user(
+            user_id, params.limit, params.after, params.with_total
+        )
+        return page.map(map_task_entity_to_response)
+
+    async def import_tasks(
+        self, records: AsyncIterator[tuple[int, dict | str]]
+    ) -> TaskImportResultDTO:
+        """
+        Importer des tâches par lots de task_import_batch_size lignes
+
+        Chaque lot est validé (TaskCreateDTO, assignés existants) puis inséré
+        avec ses assignations dans une transaction; les lignes refusées sont
+        rapportées avec leur numéro, les autres sont importées.
+        """
+        result = TaskImportResultDTO()
+        batch: list[tuple[int, TaskCreateDTO]] = []
+        async for line, record in records:
+            if isinstance(record, str):
+                self._reject(result, line, [record])
+                continue
+            try:
+                batch.append((line, TaskCreateDTO.model_validate(record)))
+            except ValidationError as e:
+                self._reject(result, line, [
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                ])
+                continue
+            if len(batch) >= settings.task_import_batch_size:
+                await self._import_batch(batch, result)
+                batch = []
+        if batch:
+            await self._import_batch(batch, result)
+        return result
+
+    async def _import_batch(
+        self, batch: list[tuple[int, TaskCreateDTO]], result: TaskImportResultDTO
+    ) -> None:
+        """Vérifier les assignés du lot (une requête) et insérer les lignes valides"""
+        existing = await self.user_repository.find_existing_ids(
+            list({user_id for _, dto in batch for user_id in dto.assigned_to})
+        )
+        entities, lines = [], []
+        for line, dto in batch:
+            unknown = [str(user_id) for user_id in dto.assigned_to if user_id not in existing]
+            if unknown:
+                self._reject(result, line, [f"assigned_to: utilisateurs inconnus: {', '.join(unknown)}"])
+                continue
+            entities.append(map_task_create_dto_to_entity(dto))
+            lines.append(line)
+        if not entities:
+            return
+        try:
+            await self.repository.insert_many(entities)
+        except IntegrityError:
+            # Assigné supprimé entre la vérification et l'insertion: le lot est refusé
+            await self.db.rollback()
+            for line in lines:
+                self._reject(result, line, ["Insertion refusée par la base de données"])
+            return
+        result.imported += len(entities)
+
+    @staticmethod
+    def _reject(result: TaskImportResultDTO, line: int, errors: list[str]) -> None:
+        """Compter une ligne refusée (détaillée dans la limite de task_import_max_errors)"""
+        result.rejected += 1
+        if len(result.errors) < settings.task_import_max_errors:
+            result.errors.append(TaskImportErrorDTO(line=line, errors=errors))
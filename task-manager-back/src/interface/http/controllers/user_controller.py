@@ -2,11 +2,14 @@
 Controller pour User
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.dto.user_dto import UserCreateDTO, UserUpdateDTO, UserResponseDTO
 from core.entities.user import User
+from core.valueObjects.page import Page
 from infrastructure.database.repository.user_repository import UserRepositoryImpl
+from interface.http.dependencies.pagination import PageParams
 from interface.http.mappers.user_mapper import (
     map_user_create_dto_to_entity,
     map_user_entity_to_response,
@@ -16,30 +19,40 @@ from interface.http.mappers.user_mapper import (
 class UserController:
     """Controller pour les opérations User"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.repository = UserRepositoryImpl(db)
 
-    def create(self, dto: UserCreateDTO) -> UserResponseDTO:
+    async def create(self, dto: UserCreateDTO) -> UserResponseDTO:
         """Créer un utilisateur"""
         entity = map_user_create_dto_to_entity(dto)
-        saved_entity = self.repository.save(entity)
+        saved_entity = await self.repository.save(entity)
         return map_user_entity_to_response(saved_entity)
 
-    def get_all(self) -> list[UserResponseDTO]:
+    async def get_all(self) -> list[UserResponseDTO]:
         """Récupérer tous les utilisateurs"""
-        entities = self.repository.find_all()
+        entities = await self.repository.find_all()
         return [map_user_entity_to_response(e) for e in entities]
 
-    def get_by_id(self, id: UUID) -> UserResponseDTO | None:
+    async def export(self, batch_size: int) -> AsyncIterator[list[UserResponseDTO]]:
+        """Exporter toutes les utilisateurs par lots"""
+        async for entities in self.repository.stream_all(batch_size):
+            yield [map_user_entity_to_response(e) for e in entities]
+
+    async def get_page(self, params: PageParams) -> Page[UserResponseDTO]:
+        """Récupérer une page d'utilisateurs"""
+        page = await self.repository.find_page(params.limit, params.after, params.with_total)
+        return page.map(map_user_entity_to_response)
+
+    async def get_by_id(self, id: UUID) -> UserResponseDTO | None:
         """Récupérer un utilisateur par son ID"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return None
         return map_user_entity_to_response(entity)
 
-    def update(self, id: UUID, dto: UserUpdateDTO) -> UserResponseDTO | None:
+    async def update(self, id: UUID, dto: UserUpdateDTO) -> UserResponseDTO | None:
         """Mettre à jour un utilisateur"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return None
 
@@ -54,21 +67,21 @@ class UserController:
         if dto.role is not None:
             entity.role = dto.role
 
-        updated_entity = self.repository.update(entity)
+        updated_entity = await self.repository.update(entity)
         return map_user_entity_to_response(updated_entity)
 
-    def delete(self, id: UUID) -> bool:
+    async def delete(self, id: UUID) -> bool:
         """Supprimer un utilisateur"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return False
-        self.repository.delete(id)
+        await self.repository.delete(id)
         return True
 
-    def verify(self, id: UUID) -> UserResponseDTO | None:
+    async def verify(self, id: UUID) -> UserResponseDTO | None:
         """Vérifier un utilisateur"""
-        entity = self.repository.find_by_id(id)
+        entity = await self.repository.find_by_id(id)
         if entity is None:
             return None
-        verified_entity = self.repository.verify(id)
+        verified_entity = await self.repository.verify(id)
         return map_user_entity_to_response(verified_entity)
@@ -2,9 +2,13 @@
 HTTP Dependencies
 """
 
-from interface.http.dependencies.db import get_db
+from interface.http.dependencies.db import get_db, get_read_db
+from interface.http.dependencies.client import get_client_ip
+from interface.http.dependencies.pagination import PageParams, get_page_params
 from interface.http.dependencies.auth import (
+    get_token_claims,
     get_current_user,
+    get_current_db_user,
     get_current_verified_user,
     get_current_owner,
     require_role,
@@ -12,7 +16,13 @@ from interface.http.dependencies.auth import (
 
 __all__ = [
     "get_db",
+    "get_read_db",
+    "get_client_ip",
+    "PageParams",
+    "get_page_params",
+    "get_token_claims",
     "get_current_user",
+    "get_current_db_user",
     "get_current_verified_user",
     "get_current_owner",
     "require_role",
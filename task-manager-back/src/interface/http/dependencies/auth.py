@@ -2,48 +2,113 @@
 Dépendances d'authentification
 """
 
-from uuid import UUID
-from fastapi import Depends, HTTPException, status
+import secrets
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
 from core.entities.user import User, UserRole
-from core.services.auth_service import AuthService
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.services.auth_service import (
+    AuthService,
+    TOKEN_VERSION_DELETED,
+    token_versions,
+    user_cache,
+)
+from core.services.revocation_store import revocation_store
+from core.valueObjects.token_claims import TokenClaims
 from infrastructure.database.repository.user_repository import UserRepositoryImpl
-from interface.http.dependencies.db import get_db
 
 # Schéma de sécurité Bearer
 security = HTTPBearer()
+# Bearer facultatif: la télémétrie accepte aussi le jeton interne
+optional_security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+async def get_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> TokenClaims:
     """
-    Dépendance pour récupérer l'utilisateur courant depuis le token JWT
-    """
-    token = credentials.credentials
+    Dépendance pour récupérer les claims vérifiés du token d'accès
 
-    # Décoder le token
-    user_id = AuthService.get_user_id_from_token(token)
-    if user_id is None:
+    Le token est vérifié une seule fois par requête (dépendance mise en cache
+    par FastAPI), et les claims d'un même token sont réutilisés entre requêtes.
+    """
+    claims = AuthService.verify_token(credentials.credentials, expected_type="access")
+    if claims is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token invalide",
+            detail="Token invalide ou expiré",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Vérifier si le token est expiré
-    if AuthService.is_token_expired(token):
+    # Révocation (logout, session compromise): recherche en mémoire, sans requête
+    if revocation_store.is_revoked(claims):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token expiré",
+            detail="Token révoqué",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return claims
+
+
+async def _principal_from_claims(claims: TokenClaims) -> User | None:
+    """
+    Principal sans état: l'utilisateur est construit depuis les claims
+
+    Valable seulement si la version du token (claim "ver") est toujours la
+    version courante de l'utilisateur. La version connue est gardée en mémoire
+    et revérifiée sur le primaire après auth_token_version_ttl secondes: un
+    réplica en retard accepterait un token déjà invalidé.
+    """
+    principal = AuthService.principal_from_claims(claims)
+    if principal is None:
+        return None
+
+    version = token_versions.get(claims.user_id)
+    if version is None:
+        async with AsyncSessionLocal() as db:
+            version = await UserRepositoryImpl(db).get_token_version(claims.user_id)
+        version = TOKEN_VERSION_DELETED if version is None else version
+        token_versions.set(claims.user_id, version)
+
+    if version != principal.token_version:
+        return None
+    return principal
+
+
+async def get_current_user(
+    claims: TokenClaims = Depends(get_token_claims),
+) -> User:
+    """
+    Dépendance pour récupérer l'utilisateur courant depuis le token JWT
 
-    # Récupérer l'utilisateur
-    repository = UserRepositoryImpl(db)
-    user = repository.find_by_id(user_id)
+    En mode principal sans état (auth_stateless_principal), l'utilisateur est
+    construit depuis les claims; la base n'est lue que si l'utilisateur a été
+    modifié ou supprimé depuis l'émission du token.
+    """
+    if settings.auth_stateless_principal:
+        principal = await _principal_from_claims(claims)
+        if principal is not None:
+            return principal
+    return await get_current_db_user(claims)
+
+
+async def get_current_db_user(
+    claims: TokenClaims = Depends(get_token_claims),
+) -> User:
+    """
+    Dépendance pour récupérer l'utilisateur courant lu en base (profil complet)
+
+    Les utilisateurs sont gardés en cache (TTL + LRU); le repository invalide
+    l'entrée lors d'un update, verify ou delete. Lu sur le primaire, comme la
+    version du token: session ouverte seulement si le cache ne répond pas.
+    """
+    user = user_cache.get(claims.user_id)
+    if user is not None:
+        return user
+
+    async with AsyncSessionLocal() as db:
+        user = await UserRepositoryImpl(db).find_by_id(claims.user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -51,6 +116,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    user_cache.set(user.id, user)
     return user
 
 
@@ -96,3 +162,30 @@ def require_role(allowed_roles: list[UserRole]):
             )
         return current_user
     return role_checker
+
+
+async def require_health_access(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+) -> None:
+    """
+    Dépendance protégeant la télémétrie interne (/health/*)
+
+    Accès avec le jeton interne (en-tête X-Health-Token, settings.health_token)
+    pour les sondes et le monitoring, sinon avec le token d'accès d'un OWNER.
+    """
+    health_token = request.headers.get("x-health-token")
+    if settings.health_token and health_token is not None and secrets.compare_digest(
+        health_token.encode(), settings.health_token.encode()
+    ):
+        return
+
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentification requise",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    claims = await get_token_claims(credentials)
+    current_user = await get_current_verified_user(await get_current_user(claims))
+    await get_current_owner(current_user)
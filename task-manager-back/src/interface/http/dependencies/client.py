@@ -0,0 +1,20 @@
+"""
+Dépendances HTTP liées au client
+"""
+
+from fastapi import Request
+from config.settings import settings
+
+
+def get_client_ip(request: Request) -> str | None:
+    """
+    Adresse IP du client
+
+    Derrière un proxy de confiance (auth_trust_forwarded_for), la dernière
+    adresse de X-Forwarded-For est celle ajoutée par ce proxy.
+    """
+    if settings.auth_trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.rsplit(",", 1)[-1].strip()
+    return request.client.host if request.client else None
@@ -2,14 +2,54 @@
 Dépendances HTTP
 """
 
-from config.database import SessionLocal
+import time
+from collections.abc import AsyncIterator
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import AsyncSessionLocal, ReadSessionLocal
+from config.settings import settings
 
-def get_db():
+# Cookie portant l'échéance (timestamp) de lecture forcée sur le primaire
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+
+def _is_sticky(request: Request) -> bool:
+    """Le client a-t-il écrit récemment (read-your-writes)?"""
+    value = request.cookies.get(PRIMARY_STICKY_COOKIE)
+    if value is None:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_db(response: Response) -> AsyncIterator[AsyncSession]:
     """
-    Dépendance HTTP de la base de données
+    Dépendance HTTP de la base de données primaire (écritures)
+
+    Marque le client pour qu'il lise sur le primaire le temps que les
+    réplicas rattrapent ses écritures.
     """
-    db = SessionLocal()
-    try:
+    if settings.db_replica_urls and settings.db_replica_sticky_seconds > 0:
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            str(time.time() + settings.db_replica_sticky_seconds),
+            max_age=settings.db_replica_sticky_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Dépendance HTTP de lecture (routes GET)
+
+    Lit sur un réplica, sauf si le client vient d'écrire.
+    """
+    async with ReadSessionLocal() as db:
+        if _is_sticky(request):
+            db.info["use_primary"] = True
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Dépendance HTTP de pagination par curseur
+"""
+
+from dataclasses import dataclass
+from fastapi import HTTPException, Query, status
+from core.errors.base import ValidationError
+from core.valueObjects.cursor import Cursor
+from core.valueObjects.page import Page
+from core.dto.response_dto import cursor_paginated_response
+from interface.http.responses import FastJSONResponse
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass
+class PageParams:
+    """Paramètres de pagination d'une requête de liste"""
+    limit: int
+    after: Cursor | None = None
+    with_total: bool = False
+
+    def response(self, page: Page) -> FastJSONResponse:
+        """
+        Construire la réponse paginée d'une page de DTOs
+
+        Les items sont déjà des DTOs de réponse: la réponse est sérialisée
+        directement, sans revalidation par le response_model de la route
+        (qui ne sert plus qu'à la documentation OpenAPI).
+        """
+        return FastJSONResponse(cursor_paginated_response(
+            items=page.items,
+            limit=self.limit,
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+            total=page.total,
+        ))
+
+
+def get_page_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Taille de la page"),
+    cursor: str | None = Query(None, description="Curseur renvoyé par la page précédente"),
+    include_total: bool = Query(False, description="Inclure le nombre total (requête COUNT)"),
+) -> PageParams:
+    """
+    Dépendance HTTP de pagination
+
+    Raises:
+        HTTPException: 400 si le curseur est invalide
+    """
+    try:
+        after = Cursor.decode(cursor) if cursor else None
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message
+        )
+    return PageParams(limit=limit, after=after, with_total=include_total)
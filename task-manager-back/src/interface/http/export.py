@@ -0,0 +1,110 @@
+"""
+Export en flux (NDJSON ou CSV, gzip optionnel)
+"""
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from enum import Enum
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+import pydantic_core
+from config.database import ReadSessionLocal
+
+
+class ExportFormat(str, Enum):
+    """Format d'export"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _ndjson_lines(batch: list[BaseModel]) -> bytes:
+    """Un objet JSON par ligne"""
+    return b"".join(pydantic_core.to_json(dto) + b"\n" for dto in batch)
+
+
+def _csv_value(value) -> str:
+    """Valeur d'une cellule CSV (booléens comme en JSON, listes séparées par des ';')"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return ";".join(str(v) for v in value)
+    return str(value)
+
+
+class _CSVEncoder:
+    """Encodeur CSV réutilisant un seul tampon"""
+
+    def __init__(self, dto_type: type[BaseModel]):
+        self.fields = list(dto_type.model_fields)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _flush(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writerow(self.fields)
+        return self._flush()
+
+    def rows(self, batch: list[BaseModel]) -> bytes:
+        for dto in batch:
+            values = dto.model_dump(mode="json")
+            self._writer.writerow([_csv_value(values[field]) for field in self.fields])
+        return self._flush()
+
+
+def export_response(
+    name: str,
+    dto_type: type[BaseModel],
+    batches: Callable[[AsyncSession], AsyncIterator[list[BaseModel]]],
+    export_format: ExportFormat,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """
+    Réponse d'export en flux: mémoire constante quelle que soit la taille de la table
+
+    La session de lecture est ouverte dans le générateur: les dépendances
+    de la route sont déjà refermées quand le corps de la réponse est envoyé.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        compressor = zlib.compressobj(wbits=31) if gzip else None  # wbits=31: format gzip
+
+        def encode(chunk: bytes) -> bytes:
+            return compressor.compress(chunk) if compressor is not None else chunk
+
+        csv_encoder = _CSVEncoder(dto_type) if export_format == ExportFormat.CSV else None
+        if csv_encoder is not None:
+            yield encode(csv_encoder.header())
+        async with ReadSessionLocal() as db:
+            async for batch in batches(db):
+                chunk = encode(csv_encoder.rows(batch) if csv_encoder is not None else _ndjson_lines(batch))
+                if chunk:
+                    yield chunk
+        if compressor is not None:
+            yield compressor.flush()
+
+    filename = f"{name}-{datetime.utcnow():%Y%m%d-%H%M%S}.{export_format.value}"
+    if gzip:
+        filename += ".gz"
+    return StreamingResponse(
+        body(),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
@@ -0,0 +1,108 @@
+"""
+Lecture en flux d'un import (NDJSON ou CSV, gzip optionnel)
+"""
+
+import codecs
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from interface.http.export import ExportFormat
+
+# Mêmes formats que l'export: un fichier exporté peut être réimporté
+ImportFormat = ExportFormat
+
+
+async def read_lines(chunks: AsyncIterator[bytes], gzip: bool = False) -> AsyncIterator[str]:
+    """Lignes (fin de ligne incluse) d'un flux d'octets UTF-8, décompressé à la volée"""
+    decompressor = zlib.decompressobj(wbits=31) if gzip else None
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        pending += decoder.decode(chunk)
+        if "\n" not in pending:
+            continue
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(decompressor.flush() if decompressor is not None else b"", final=True)
+    *lines, pending = pending.split("\n")
+    for line in lines:
+        yield line + "\n"
+    if pending:
+        yield pending
+
+
+def _csv_record(row: dict[str, str]) -> dict:
+    """Cellules vides ignorées (valeurs par défaut), assigned_to séparé par des ';'"""
+    record = {key: value for key, value in row.items() if value != ""}
+    if "assigned_to" in record:
+        record["assigned_to"] = [v.strip() for v in record["assigned_to"].split(";") if v.strip()]
+    return record
+
+
+async def _parse_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict | str]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError as e:
+            yield number, f"JSON invalide: {e}"
+            continue
+        if not isinstance(value, dict):
+            yield number, "Objet JSON attendu"
+            continue
+        yield number, value
+
+
+async def _parse_csv(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict | str]]:
+    header: list[str] | None = None
+    number = start = 0
+    record = ""
+    async for line in lines:
+        number += 1
+        if not record:
+            start = number
+        record += line
+        # Nombre impair de guillemets: un champ entre guillemets continue sur la ligne suivante
+        if record.count('"') % 2:
+            continue
+        text, record = record, ""
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader(io.StringIO(text)))
+        except csv.Error as e:
+            yield start, f"CSV invalide: {e}"
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"{len(values)} colonnes au lieu de {len(header)}"
+            continue
+        yield start, _csv_record(dict(zip(header, values)))
+    if record:
+        yield start, "CSV invalide: guillemet non fermé"
+
+
+def parse_records(
+    chunks: AsyncIterator[bytes], import_format: ImportFormat, gzip: bool = False
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """
+    Enregistrements d'un import, lus au fil du flux
+
+    Produit (numéro de ligne, enregistrement) ou (numéro de ligne, message
+    d'erreur) pour une ligne illisible. En CSV, la première ligne nomme les
+    colonnes; les colonnes inconnues (id, created_at...) sont ignorées.
+    """
+    lines = read_lines(chunks, gzip)
+    if import_format == ImportFormat.CSV:
+        return _parse_csv(lines)
+    return _parse_ndjson(lines)
@@ -17,6 +17,7 @@ from interface.http.mappers.assign_mapper import (
 from interface.http.mappers.invitation_mapper import (
     map_invitation_entity_to_response,
     map_invitation_entity_to_detail,
+    map_invitation_details_to_dto,
 )
 
 __all__ = [
@@ -28,4 +29,5 @@ __all__ = [
     "map_assign_create_dto_to_entity",
     "map_invitation_entity_to_response",
     "map_invitation_entity_to_detail",
+    "map_invitation_details_to_dto",
 ]
@@ -2,7 +2,7 @@
 Mappers HTTP pour Invitation (Entity <-> DTO)
 """
 
-from core.entities.invitation import Invitation
+from core.entities.invitation import Invitation, InvitationDetails
 from core.dto.invitation_dto import InvitationResponseDTO, InvitationDetailDTO
 
 
@@ -36,3 +36,12 @@ def map_invitation_entity_to_detail(
         expires_at=invitation.expires_at,
         created_at=invitation.created_at,
     )
+
+
+def map_invitation_details_to_dto(details: InvitationDetails) -> InvitationDetailDTO:
+    """Convertir une InvitationDetails (jointure tâche/invitant) en DTO détaillé"""
+    return map_invitation_entity_to_detail(
+        details.invitation,
+        task_title=details.task_title or "Tâche supprimée",
+        inviter_name=details.inviter_name or "Utilisateur supprimé",
+    )
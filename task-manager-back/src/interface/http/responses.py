@@ -0,0 +1,34 @@
+"""
+Réponse JSON rapide: sérialisation directe en octets
+"""
+
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # extra optionnel "orjson"
+    orjson = None
+
+
+def _orjson_default(value: Any) -> Any:
+    """Types inconnus d'orjson (UUID, datetime et Enum sont natifs)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return pydantic_core.to_jsonable_python(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Réponse JSON sérialisée par orjson, ou par pydantic-core s'il n'est pas installé
+
+    Les DTOs Pydantic, UUID et datetime sont sérialisés directement, sans
+    passer par jsonable_encoder. Classe de réponse par défaut de l'application.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        return pydantic_core.to_json(content)
@@ -3,52 +3,85 @@ Routes pour Assign (assignation de tâches)
 """
 
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
 from core.dto.assign_dto import AssignCreateDTO, AssignResponseDTO
+from core.dto.response_dto import CursorPaginatedResponse
 from core.entities.user import User, UserRole
 from interface.http.controllers.assign_controller import AssignController
-from interface.http.dependencies.db import get_db
+from interface.http.dependencies.db import get_db, get_read_db
 from interface.http.dependencies.auth import get_current_verified_user, get_current_owner
+from interface.http.dependencies.pagination import PageParams, get_page_params
+from interface.http.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/assignments", tags=["Assignments"])
 
 
 @router.post("", response_model=AssignResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_assignment(
+async def create_assignment(
     dto: AssignCreateDTO,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Créer une assignation (OWNER uniquement)"""
     controller = AssignController(db)
-    return controller.create(dto)
+    result = await controller.create(dto)
+
+    if isinstance(result, str):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=result
+        )
+
+    return result
 
 
-@router.get("", response_model=list[AssignResponseDTO])
-def get_all_assignments(
-    db: Session = Depends(get_db),
+@router.get("", response_model=CursorPaginatedResponse[AssignResponseDTO])
+async def get_all_assignments(
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
-    """Récupérer toutes les assignations (OWNER uniquement)"""
+    """Récupérer les assignations, paginées par curseur (OWNER uniquement)"""
     controller = AssignController(db)
-    return controller.get_all()
+    return params.response(await controller.get_page(params))
 
 
-@router.get("/my", response_model=list[AssignResponseDTO])
-def get_my_assignments(
-    db: Session = Depends(get_db),
+@router.get("/my", response_model=CursorPaginatedResponse[AssignResponseDTO])
+async def get_my_assignments(
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
-    """Récupérer mes assignations"""
+    """Récupérer mes assignations (paginées par curseur)"""
     controller = AssignController(db)
-    return controller.get_assignments_for_user(current_user.id)
+    return params.response(
+        await controller.get_assignments_page_for_user(current_user.id, params)
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_assignments(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    gzip: bool = Query(False, description="Compresser le flux (fichier .gz)"),
+    current_user: User = Depends(get_current_owner)  # OWNER uniquement
+):
+    """Exporter toutes les assignations en NDJSON ou CSV, en flux (OWNER uniquement)"""
+    return export_response(
+        "assignments",
+        AssignResponseDTO,
+        lambda db: AssignController(db).export(settings.export_batch_size),
+        export_format,
+        gzip,
+    )
 
 
 @router.get("/{id}", response_model=AssignResponseDTO)
-def get_assignment_by_id(
+async def get_assignment_by_id(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
     """
@@ -57,7 +90,7 @@ def get_assignment_by_id(
     - MEMBER: peut voir uniquement ses propres assignations
     """
     controller = AssignController(db)
-    assignment = controller.get_by_id(id)
+    assignment = await controller.get_by_id(id)
     if assignment is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,14 +108,14 @@ def get_assignment_by_id(
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_assignment(
+async def delete_assignment(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Supprimer une assignation (OWNER uniquement)"""
     controller = AssignController(db)
-    deleted = controller.delete(id)
+    deleted = await controller.delete(id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -90,10 +123,11 @@ def delete_assignment(
         )
 
 
-@router.get("/user/{user_id}", response_model=list[AssignResponseDTO])
-def get_assignments_for_user(
+@router.get("/user/{user_id}", response_model=CursorPaginatedResponse[AssignResponseDTO])
+async def get_assignments_for_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
     """
@@ -109,4 +143,4 @@ def get_assignments_for_user(
         )
 
     controller = AssignController(db)
-    return controller.get_assignments_for_user(user_id)
+    return params.response(await controller.get_assignments_page_for_user(user_id, params))
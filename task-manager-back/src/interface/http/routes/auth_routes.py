@@ -3,23 +3,26 @@ Routes pour l'authentification
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.dto.auth_dto import LoginDTO, RegisterDTO, TokenDTO, RefreshTokenDTO, LogoutResponseDTO
 from core.dto.user_dto import UserResponseDTO
 from core.dto.response_dto import ApiResponse, success_response
 from core.entities.user import User
+from core.errors.base import RateLimitError
 from interface.http.controllers.auth_controller import AuthController
-from interface.http.dependencies.db import get_db
-from interface.http.dependencies.auth import get_current_user
+from interface.http.dependencies.db import get_db, get_read_db
+from interface.http.dependencies.client import get_client_ip
+from core.valueObjects.token_claims import TokenClaims
+from interface.http.dependencies.auth import get_current_db_user, get_token_claims
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def register(dto: RegisterDTO, db: Session = Depends(get_db)):
+async def register(dto: RegisterDTO, db: AsyncSession = Depends(get_db)):
     """Inscrire un nouvel utilisateur"""
     controller = AuthController(db)
-    user = controller.register(dto)
+    user = await controller.register(dto)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,10 +32,21 @@ def register(dto: RegisterDTO, db: Session = Depends(get_db)):
 
 
 @router.post("/login")
-def login(dto: LoginDTO, db: Session = Depends(get_db)):
-    """Connecter un utilisateur"""
+async def login(
+    dto: LoginDTO,
+    db: AsyncSession = Depends(get_db),
+    client_ip: str | None = Depends(get_client_ip),
+):
+    """Connecter un utilisateur (tentatives limitées par IP et par email)"""
     controller = AuthController(db)
-    tokens = controller.login(dto)
+    try:
+        tokens = await controller.login(dto, client_ip)
+    except RateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after)},
+        )
     if tokens is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -43,10 +57,10 @@ def login(dto: LoginDTO, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh")
-def refresh_token(dto: RefreshTokenDTO, db: Session = Depends(get_db)):
+async def refresh_token(dto: RefreshTokenDTO, db: AsyncSession = Depends(get_db)):
     """Rafraîchir le token d'accès"""
     controller = AuthController(db)
-    tokens = controller.refresh_token(dto)
+    tokens = await controller.refresh_token(dto)
     if tokens is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -57,9 +71,9 @@ def refresh_token(dto: RefreshTokenDTO, db: Session = Depends(get_db)):
 
 
 @router.get("/me")
-def get_me(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_me(
+    current_user: User = Depends(get_current_db_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Récupérer les informations de l'utilisateur connecté"""
     controller = AuthController(db)
@@ -67,14 +81,24 @@ def get_me(
 
 
 @router.post("/logout")
-def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    claims: TokenClaims = Depends(get_token_claims),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Déconnecter l'utilisateur
 
-    Note: Avec JWT stateless, le serveur ne peut pas invalider le token.
-    Le client doit supprimer le token de son stockage local.
-    Cette route sert à :
-    - Confirmer la déconnexion côté API
-    - Permettre l'ajout futur d'une blacklist de tokens
+    Révoque la session du token: le token d'accès et le refresh token
+    associés sont refusés dès maintenant sur ce worker, et sur les autres
+    après leur prochaine synchronisation (auth_revocation_sync_seconds).
+    Un ancien token sans jti ni sid est refusé (401): l'utilisateur doit se
+    reconnecter pour obtenir un token révocable.
     """
+    controller = AuthController(db)
+    if not await controller.logout(claims):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token non révocable, reconnectez-vous",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return success_response(data=None, message="Déconnexion réussie")
@@ -0,0 +1,80 @@
+"""
+Routes de télémétrie interne (/health/*)
+
+Ces endpoints exposent l'état interne du worker (pools, caches, files
+d'envoi): réservés aux OWNER ou aux sondes munies du jeton interne
+(settings.health_token). /health, sans détail, reste public.
+"""
+
+from fastapi import APIRouter, Depends
+from config.database import AsyncSessionLocal, all_engines
+from core.dto.response_dto import success_response
+from core.services.auth_service import claims_cache, token_versions, user_cache
+from core.services.password_hasher import password_hasher
+from core.services.rate_limiter import login_throttle
+from core.services.revocation_store import revocation_store
+from infrastructure.database.pool_metrics import pool_snapshot
+from infrastructure.database.repository.email_outbox_repository import EmailOutboxRepositoryImpl
+from infrastructure.external.smtp_pool import smtp_pool
+from infrastructure.workers.email_outbox import email_outbox_worker
+from infrastructure.workers.invitation_sweeper import invitation_sweeper
+from interface.http.dependencies.auth import require_health_access
+
+router = APIRouter(prefix="/health", tags=["Health"], dependencies=[Depends(require_health_access)])
+
+
+@router.get("/db")
+def db_health_check():
+    """Télémétrie des pools de connexions (primaire et réplicas) du worker courant"""
+    return success_response(
+        data={"pools": [pool_snapshot(db_engine.sync_engine) for db_engine in all_engines()]},
+        message="État du pool de connexions"
+    )
+
+
+@router.get("/hasher")
+def hasher_health_check():
+    """Télémétrie du pool de hashage des mots de passe du worker courant"""
+    return success_response(
+        data=password_hasher.snapshot(),
+        message="État du pool de hashage"
+    )
+
+
+@router.get("/auth")
+def auth_health_check():
+    """Télémétrie des caches d'authentification du worker courant"""
+    return success_response(
+        data={
+            "claims_cache": claims_cache.snapshot(),
+            "user_cache": user_cache.snapshot(),
+            "token_versions": token_versions.snapshot(),
+            "revocations": revocation_store.snapshot(),
+            "login_throttle": login_throttle.snapshot(),
+        },
+        message="État des caches d'authentification"
+    )
+
+
+@router.get("/email")
+async def email_health_check():
+    """État de l'outbox des emails (toutes instances) et compteurs d'envoi du worker courant"""
+    async with AsyncSessionLocal() as db:
+        outbox = await EmailOutboxRepositoryImpl(db).count_by_status()
+    return success_response(
+        data={
+            "outbox": outbox,
+            "worker": email_outbox_worker.snapshot(),
+            "smtp": smtp_pool.snapshot(),
+        },
+        message="État de l'envoi des emails"
+    )
+
+
+@router.get("/invitations")
+def invitations_health_check():
+    """Compteurs du balayage des invitations du worker courant"""
+    return success_response(
+        data=invitation_sweeper.snapshot(),
+        message="État du balayage des invitations"
+    )
@@ -4,26 +4,30 @@ Routes pour les invitations
 
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.dto.invitation_dto import (
     InviteCreateDTO,
+    InviteBulkCreateDTO,
+    InviteBulkResultDTO,
     InviteAcceptDTO,
     InvitationResponseDTO,
     InvitationDetailDTO,
 )
 from core.dto.auth_dto import TokenDTO
+from core.dto.response_dto import CursorPaginatedResponse
 from core.entities.user import User
 from interface.http.controllers.invitation_controller import InvitationController
-from interface.http.dependencies.db import get_db
+from interface.http.dependencies.db import get_db, get_read_db
 from interface.http.dependencies.auth import get_current_owner
+from interface.http.dependencies.pagination import PageParams, get_page_params
 
 router = APIRouter(prefix="/invitations", tags=["Invitations"])
 
 
 @router.post("", response_model=InvitationResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_invitation(
+async def create_invitation(
     dto: InviteCreateDTO,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """
@@ -33,7 +37,7 @@ def create_invitation(
     et sera automatiquement assigné à la tâche spécifiée.
     """
     controller = InvitationController(db)
-    result = controller.create_invitation(dto, current_user)
+    result = await controller.create_invitation(dto, current_user)
 
     if isinstance(result, str):
         raise HTTPException(
@@ -44,20 +48,45 @@ def create_invitation(
     return result
 
 
-@router.get("", response_model=list[InvitationDetailDTO])
-def get_all_pending_invitations(
-    db: Session = Depends(get_db),
+@router.post("/bulk", response_model=InviteBulkResultDTO)
+async def create_invitations_bulk(
+    dto: InviteBulkCreateDTO,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
-    """Récupérer toutes les invitations en attente (OWNER uniquement)"""
+    """
+    Inviter plusieurs emails à une ou plusieurs tâches (OWNER uniquement)
+
+    Chaque couple (email, tâche) est traité séparément: les invitations
+    valides sont créées, les autres sont retournées avec leur motif.
+    """
+    controller = InvitationController(db)
+    result = await controller.create_invitations_bulk(dto, current_user)
+
+    if isinstance(result, str):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result
+        )
+
+    return result
+
+
+@router.get("", response_model=CursorPaginatedResponse[InvitationDetailDTO])
+async def get_all_pending_invitations(
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_owner)  # OWNER uniquement
+):
+    """Récupérer les invitations en attente, paginées par curseur (OWNER uniquement)"""
     controller = InvitationController(db)
-    return controller.get_all_pending()
+    return params.response(await controller.get_pending_page(params))
 
 
 @router.get("/check/{token}", response_model=InvitationDetailDTO)
-def check_invitation_by_token(
+async def check_invitation_by_token(
     token: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Vérifier une invitation par son token (public)
@@ -66,7 +95,7 @@ def check_invitation_by_token(
     avant que l'utilisateur ne crée son compte.
     """
     controller = InvitationController(db)
-    invitation = controller.get_by_token(token)
+    invitation = await controller.get_by_token(token)
 
     if invitation is None:
         raise HTTPException(
@@ -78,9 +107,9 @@ def check_invitation_by_token(
 
 
 @router.post("/accept", response_model=TokenDTO)
-def accept_invitation(
+async def accept_invitation(
     dto: InviteAcceptDTO,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Accepter une invitation et créer son compte (public)
@@ -91,7 +120,7 @@ def accept_invitation(
     3. Recevoir un token JWT pour se connecter immédiatement
     """
     controller = InvitationController(db)
-    result = controller.accept_invitation(dto)
+    result = await controller.accept_invitation(dto)
 
     if isinstance(result, str):
         raise HTTPException(
@@ -103,14 +132,14 @@ def accept_invitation(
 
 
 @router.get("/{id}", response_model=InvitationDetailDTO)
-def get_invitation_by_id(
+async def get_invitation_by_id(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Récupérer une invitation par son ID (OWNER uniquement)"""
     controller = InvitationController(db)
-    invitation = controller.get_by_id(id)
+    invitation = await controller.get_by_id(id)
 
     if invitation is None:
         raise HTTPException(
@@ -122,14 +151,14 @@ def get_invitation_by_id(
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_invitation(
+async def delete_invitation(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Annuler/Supprimer une invitation (OWNER uniquement)"""
     controller = InvitationController(db)
-    deleted = controller.delete(id)
+    deleted = await controller.delete(id)
 
     if not deleted:
         raise HTTPException(
@@ -139,14 +168,14 @@ def delete_invitation(
 
 
 @router.post("/{id}/resend", status_code=status.HTTP_200_OK)
-def resend_invitation(
+async def resend_invitation(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Renvoyer l'email d'invitation (OWNER uniquement)"""
     controller = InvitationController(db)
-    success = controller.resend_invitation(id, current_user)
+    success = await controller.resend_invitation(id, current_user)
 
     if not success:
         raise HTTPException(
@@ -3,59 +3,111 @@ Routes pour Task
 """
 
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from core.dto.task_dto import TaskCreateDTO, TaskUpdateDTO, TaskResponseDTO
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from core.dto.task_dto import TaskCreateDTO, TaskUpdateDTO, TaskResponseDTO, TaskImportResultDTO
+from core.dto.response_dto import CursorPaginatedResponse
 from core.entities.user import User, UserRole
 from interface.http.controllers.task_controller import TaskController
-from interface.http.dependencies.db import get_db
+from interface.http.dependencies.db import get_db, get_read_db
 from interface.http.dependencies.auth import get_current_verified_user, get_current_owner
+from interface.http.dependencies.pagination import PageParams, get_page_params
+from interface.http.export import ExportFormat, export_response
+from interface.http.imports import ImportFormat, parse_records
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
 @router.post("", response_model=TaskResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     dto: TaskCreateDTO,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # Seul OWNER peut créer
 ):
-    """Créer une tâche (OWNER uniquement)"""
+    """Créer une tâche et l'assigner aux utilisateurs de assigned_to (OWNER uniquement)"""
     controller = TaskController(db)
-    return controller.create(dto)
+    result = await controller.create(dto)
 
+    if isinstance(result, str):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result
+        )
+
+    return result
 
-@router.get("", response_model=list[TaskResponseDTO])
-def get_all_tasks(
-    db: Session = Depends(get_db),
+
+@router.get("", response_model=CursorPaginatedResponse[TaskResponseDTO])
+async def get_all_tasks(
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
     """
-    Récupérer les tâches
+    Récupérer les tâches (paginées par curseur)
     - OWNER: toutes les tâches
     - MEMBER: uniquement ses tâches assignées
     """
     controller = TaskController(db)
     if current_user.role == UserRole.OWNER:
-        return controller.get_all()
+        page = await controller.get_page(params)
     else:
-        return controller.get_tasks_for_user(current_user.id)
+        page = await controller.get_tasks_page_for_user(current_user.id, params)
+    return params.response(page)
 
 
-@router.get("/my", response_model=list[TaskResponseDTO])
-def get_my_tasks(
-    db: Session = Depends(get_db),
+@router.get("/my", response_model=CursorPaginatedResponse[TaskResponseDTO])
+async def get_my_tasks(
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
-    """Récupérer mes tâches assignées"""
+    """Récupérer mes tâches assignées (paginées par curseur)"""
     controller = TaskController(db)
-    return controller.get_tasks_for_user(current_user.id)
+    return params.response(await controller.get_tasks_page_for_user(current_user.id, params))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    gzip: bool = Query(False, description="Compresser le flux (fichier .gz)"),
+    current_user: User = Depends(get_current_owner)  # OWNER uniquement
+):
+    """Exporter toutes les tâches en NDJSON ou CSV, en flux (OWNER uniquement)"""
+    return export_response(
+        "tasks",
+        TaskResponseDTO,
+        lambda db: TaskController(db).export(settings.export_batch_size),
+        export_format,
+        gzip,
+    )
+
+
+@router.post("/import", response_model=TaskImportResultDTO)
+async def import_tasks(
+    request: Request,
+    import_format: ImportFormat = Query(ImportFormat.NDJSON, alias="format"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_owner)  # OWNER uniquement
+):
+    """
+    Importer des tâches en NDJSON ou CSV (OWNER uniquement)
+
+    Le corps de la requête est le fichier (Content-Encoding: gzip accepté),
+    lu en flux. Mêmes champs que la création d'une tâche; les lignes
+    invalides sont rapportées avec leur numéro, les autres sont importées.
+    """
+    gzip = request.headers.get("content-encoding", "").lower() == "gzip"
+    controller = TaskController(db)
+    return await controller.import_tasks(parse_records(request.stream(), import_format, gzip))
 
 
 @router.get("/{id}", response_model=TaskResponseDTO)
-def get_task_by_id(
+async def get_task_by_id(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
     """
@@ -64,7 +116,7 @@ def get_task_by_id(
     - MEMBER: peut voir uniquement si assigné
     """
     controller = TaskController(db)
-    task = controller.get_by_id(id)
+    task = await controller.get_by_id(id)
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -83,32 +135,41 @@ def get_task_by_id(
 
 
 @router.put("/{id}", response_model=TaskResponseDTO)
-def update_task(
+async def update_task(
     id: UUID,
     dto: TaskUpdateDTO,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # Seul OWNER peut modifier
 ):
-    """Mettre à jour une tâche (OWNER uniquement)"""
+    """
+    Mettre à jour une tâche (OWNER uniquement)
+
+    assigned_to, s'il est fourni, remplace la liste des assignés.
+    """
     controller = TaskController(db)
-    task = controller.update(id, dto)
+    task = await controller.update(id, dto)
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tâche non trouvée"
         )
+    if isinstance(task, str):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=task
+        )
     return task
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # Seul OWNER peut supprimer
 ):
     """Supprimer une tâche (OWNER uniquement)"""
     controller = TaskController(db)
-    deleted = controller.delete(id)
+    deleted = await controller.delete(id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -116,10 +177,11 @@ def delete_task(
         )
 
 
-@router.get("/user/{user_id}", response_model=list[TaskResponseDTO])
-def get_tasks_for_user(
+@router.get("/user/{user_id}", response_model=CursorPaginatedResponse[TaskResponseDTO])
+async def get_tasks_for_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_verified_user)
 ):
     """
@@ -135,4 +197,4 @@ def get_tasks_for_user(
         )
 
     controller = TaskController(db)
-    return controller.get_tasks_for_user(user_id)
+    return params.response(await controller.get_tasks_page_for_user(user_id, params))
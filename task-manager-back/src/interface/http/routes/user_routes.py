@@ -3,36 +3,58 @@ Routes pour User (OWNER uniquement sauf exception)
 """
 
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
 from core.dto.user_dto import UserUpdateDTO, UserResponseDTO
+from core.dto.response_dto import CursorPaginatedResponse
 from core.entities.user import User
 from interface.http.controllers.user_controller import UserController
-from interface.http.dependencies.db import get_db
+from interface.http.dependencies.db import get_db, get_read_db
 from interface.http.dependencies.auth import get_current_owner
+from interface.http.dependencies.pagination import PageParams, get_page_params
+from interface.http.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
-@router.get("", response_model=list[UserResponseDTO])
-def get_all_users(
-    db: Session = Depends(get_db),
+@router.get("", response_model=CursorPaginatedResponse[UserResponseDTO])
+async def get_all_users(
+    params: PageParams = Depends(get_page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
-    """Récupérer tous les utilisateurs (OWNER uniquement)"""
+    """Récupérer les utilisateurs, paginés par curseur (OWNER uniquement)"""
     controller = UserController(db)
-    return controller.get_all()
+    return params.response(await controller.get_page(params))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    gzip: bool = Query(False, description="Compresser le flux (fichier .gz)"),
+    current_user: User = Depends(get_current_owner)  # OWNER uniquement
+):
+    """Exporter tous les utilisateurs (sans mot de passe) en NDJSON ou CSV, en flux (OWNER uniquement)"""
+    return export_response(
+        "users",
+        UserResponseDTO,
+        lambda db: UserController(db).export(settings.export_batch_size),
+        export_format,
+        gzip,
+    )
 
 
 @router.get("/{id}", response_model=UserResponseDTO)
-def get_user_by_id(
+async def get_user_by_id(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Récupérer un utilisateur par son ID (OWNER uniquement)"""
     controller = UserController(db)
-    user = controller.get_by_id(id)
+    user = await controller.get_by_id(id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,15 +64,15 @@ def get_user_by_id(
 
 
 @router.put("/{id}", response_model=UserResponseDTO)
-def update_user(
+async def update_user(
     id: UUID,
     dto: UserUpdateDTO,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Mettre à jour un utilisateur (OWNER uniquement)"""
     controller = UserController(db)
-    user = controller.update(id, dto)
+    user = await controller.update(id, dto)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,14 +82,14 @@ def update_user(
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Supprimer un utilisateur (OWNER uniquement)"""
     controller = UserController(db)
-    deleted = controller.delete(id)
+    deleted = await controller.delete(id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,14 +98,14 @@ def delete_user(
 
 
 @router.post("/{id}/verify", response_model=UserResponseDTO)
-def verify_user(
+async def verify_user(
     id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_owner)  # OWNER uniquement
 ):
     """Vérifier un utilisateur (OWNER uniquement)"""
     controller = UserController(db)
-    user = controller.verify(id)
+    user = await controller.verify(id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
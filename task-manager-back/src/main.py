@@ -2,16 +2,27 @@
 Fichier principal - Point d'entrée de l'application
 """
 
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError, HTTPException
 from pydantic import ValidationError
-# /home/attito/Boulot/compo/TASK_MANAGEMENT_BACK/task-manager-back/src/infrastructure/database/init_db.py
-from infrastructure.database.init_db import init_db
+from config.database import all_engines, engine
+from config.settings import settings
+from infrastructure.database.schema_check import check_schema_revision
+from core.services.password_hasher import password_hasher
+from core.services.key_ring import key_ring
+from core.services.revocation_store import revocation_store
+from infrastructure.workers.revocation_sync import run_revocation_sync, sync_revocations
+from infrastructure.workers.email_outbox import email_outbox_worker
+from infrastructure.workers.invitation_sweeper import invitation_sweeper
+from infrastructure.external.smtp_pool import smtp_pool
+from interface.http.responses import FastJSONResponse
 from interface.http.routes.user_routes import router as user_router
 from interface.http.routes.task_routes import router as task_router
 from interface.http.routes.assign_routes import router as assign_router
 from interface.http.routes.auth_routes import router as auth_router
 from interface.http.routes.invitation_routes import router as invitation_router
+from interface.http.routes.health_routes import router as health_router
 from middleware.exception_handler import (
     app_exception_handler,
     http_exception_handler,
@@ -29,6 +40,7 @@ def create_app() -> FastAPI:
         title="Task Manager API",
         description="API de gestion de tâches",
         version="1.0.0",
+        default_response_class=FastJSONResponse,
     )
 
     # Gestionnaires d'exceptions globaux (ordre important: du plus spécifique au plus général)
@@ -44,6 +56,8 @@ def create_app() -> FastAPI:
     app.include_router(task_router, prefix="/api")
     app.include_router(assign_router, prefix="/api")
     app.include_router(invitation_router, prefix="/api")
+    # Télémétrie interne (/health/*): OWNER ou jeton interne, voir settings.health_token
+    app.include_router(health_router)
 
     return app
 
@@ -53,8 +67,47 @@ app = create_app()
 
 @app.on_event("startup")
 async def startup():
-    """Initialisation de la base de données au démarrage"""
-    init_db()
+    """
+    Démarrage du worker
+    - Vérification de la révision du schéma (migrations: alembic upgrade head)
+    - Chargement des révocations de tokens et synchronisation en tâche de fond
+    - Auto-calibrage du coût de hashage (password_hash_target_ms)
+    - Préparation du hash factice des connexions sur email inconnu
+    - Envoi des emails de l'outbox en tâche de fond
+    - Balayage des invitations expirées ou acceptées en tâche de fond
+    """
+    await check_schema_revision(engine, settings.db_schema_check)
+    if settings.password_hash_target_ms > 0:
+        await password_hasher.calibrate(settings.password_hash_target_ms)
+    await password_hasher.dummy_verify("")
+    since = await sync_revocations(revocation_store)
+    app.state.revocation_sync = asyncio.create_task(run_revocation_sync(revocation_store, since))
+    app.state.email_outbox = asyncio.create_task(email_outbox_worker.run())
+    app.state.invitation_sweeper = asyncio.create_task(invitation_sweeper.run())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Arrêt des tâches de fond, des pools de connexions (base, SMTP) et du pool de hashage"""
+    app.state.revocation_sync.cancel()
+    app.state.email_outbox.cancel()
+    app.state.invitation_sweeper.cancel()
+    for db_engine in all_engines():
+        await db_engine.dispose()
+    password_hasher.shutdown()
+    smtp_pool.close()
+
+
+@app.get("/.well-known/jwks.json", tags=["Auth"])
+def jwks(request: Request):
+    """Clés publiques de vérification des tokens (vide en HS256)"""
+    headers = {
+        "Cache-Control": f"public, max-age={settings.jwt_jwks_max_age}",
+        "ETag": key_ring.jwks_etag,
+    }
+    if request.headers.get("if-none-match") == key_ring.jwks_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=key_ring.jwks, media_type="application/json", headers=headers)
 
 
 @app.get("/health", tags=["Health"])
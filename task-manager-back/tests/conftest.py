@@ -0,0 +1,43 @@
+"""
+Configuration des tests: base SQLite jetable, sans SMTP ni pool de processus
+"""
+
+import os
+import tempfile
+
+# Avant tout import de config.settings
+_db_dir = tempfile.mkdtemp(prefix="task-manager-tests-")
+os.environ.update(
+    APP_ENV="development",
+    DATABASE_URL=f"sqlite+aiosqlite:///{_db_dir}/test.db",
+    DB_REPLICA_URLS="[]",
+    DB_SCHEMA_CHECK="off",
+    SMTP_USER="",
+    SMTP_PASSWORD="",
+    PASSWORD_HASH_WORKERS="0",
+    PASSWORD_HASH_ROUNDS="4",
+)
+
+import pytest
+from config.database import engine
+from infrastructure.database.models import Base
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def schema(anyio_backend):
+    """
+    Tables créées sur l'engine de l'application, supprimées après le test
+
+    Le pool est vidé: ses connexions sont liées à la boucle d'événements du test.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
@@ -0,0 +1,92 @@
+"""
+Lectures de sécurité (version du token, utilisateur courant) sur le primaire
+"""
+
+import uuid
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from config.database import AsyncSessionLocal, ReadSessionLocal
+from config.settings import settings
+from core.entities.user import User, UserRole
+from core.services.auth_service import AuthService, token_versions, user_cache
+from infrastructure.database.models import Base
+from infrastructure.database.models.userModel import UserModel
+from interface.http.dependencies.auth import get_current_db_user, get_current_user
+
+pytestmark = pytest.mark.anyio
+
+
+def user_model(user_id: uuid.UUID, role: UserRole, token_version: int) -> UserModel:
+    return UserModel(
+        id=user_id, first_name="Ada", last_name="Lovelace", email="ada@example.com",
+        password="x", verified=True, role=role, token_version=token_version,
+    )
+
+
+@pytest.fixture
+async def stale_replica(schema, tmp_path):
+    """Réplica en retard: l'utilisateur y est encore OWNER, en version 0"""
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db")
+    async with replica.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    ReadSessionLocal.configure(replicas=[replica.sync_engine])
+    token_versions.clear()
+    user_cache.clear()
+    yield async_sessionmaker(replica, expire_on_commit=False)
+    ReadSessionLocal.configure(replicas=[])
+    token_versions.clear()
+    user_cache.clear()
+    await replica.dispose()
+
+
+async def token_claims_for(user_id: uuid.UUID):
+    """Claims d'un token émis avant la rétrogradation (OWNER, version 0)"""
+    async with AsyncSessionLocal() as db:
+        model = await db.get(UserModel, user_id)
+        user = User(
+            id=user_id, first_name="Ada", last_name="Lovelace", email="ada@example.com",
+            password="", verified=True, role=UserRole.OWNER,
+            created_at=model.created_at, updated_at=model.updated_at, token_version=0,
+        )
+    return AuthService.verify_token(AuthService.create_access_token(user), use_cache=False)
+
+
+@pytest.mark.parametrize("stateless", [True, False])
+async def test_demoted_user_is_read_from_primary(stale_replica, monkeypatch, stateless):
+    monkeypatch.setattr(settings, "auth_stateless_principal", stateless)
+    user_id = uuid.uuid4()
+    async with stale_replica() as replica_db:
+        replica_db.add(user_model(user_id, UserRole.OWNER, 0))
+        await replica_db.commit()
+    async with AsyncSessionLocal() as db:
+        db.add(user_model(user_id, UserRole.MEMBER, 1))
+        await db.commit()
+    claims = await token_claims_for(user_id)
+
+    current_user = await get_current_user(claims)
+
+    assert current_user.role == UserRole.MEMBER
+    assert current_user.token_version == 1
+
+
+async def test_user_deleted_on_primary_is_rejected(stale_replica, monkeypatch):
+    monkeypatch.setattr(settings, "auth_stateless_principal", True)
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as db:
+        db.add(user_model(user_id, UserRole.OWNER, 0))
+        await db.commit()
+    claims = await token_claims_for(user_id)
+    async with stale_replica() as replica_db:
+        replica_db.add(user_model(user_id, UserRole.OWNER, 0))
+        await replica_db.commit()
+    async with AsyncSessionLocal() as db:
+        await db.delete(await db.get(UserModel, user_id))
+        await db.commit()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(claims)
+    assert exc_info.value.status_code == 401
+
+    with pytest.raises(HTTPException):
+        await get_current_db_user(claims)
@@ -0,0 +1,81 @@
+"""
+Pagination par curseur: encodage opaque et parcours des pages
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from config.database import AsyncSessionLocal
+from core.entities.task import TaskPriority, TaskStatus
+from core.errors.base import ValidationError
+from core.valueObjects.cursor import Cursor
+from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.repository.task_repository import TaskRepositoryImpl
+
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2026, 10, 18, 12, 30, 5, 123456),
+    datetime(2026, 10, 18, 12, 30, 5, tzinfo=timezone.utc),
+    datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=2))),
+])
+def test_encode_decode_round_trip(created_at):
+    cursor = Cursor(created_at=created_at, id=uuid.uuid4())
+
+    encoded = cursor.encode()
+
+    assert "=" not in encoded
+    assert str(cursor) == encoded
+    assert Cursor.decode(encoded) == cursor
+
+
+def test_encoded_cursor_is_url_safe():
+    for _ in range(50):
+        encoded = Cursor(created_at=datetime.now(timezone.utc), id=uuid.uuid4()).encode()
+        assert set(encoded) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("value", [
+    "not base64!",
+    "abc",
+    Cursor(created_at=datetime(2026, 1, 1), id=uuid.uuid4()).encode()[:-4],
+    "bm8tc2VwYXJhdG9y",  # "no-separator"
+    "MjAyNi0wMS0wMXxub3QtYS11dWlk",  # "2026-01-01|not-a-uuid"
+    "/w",  # octet non UTF-8
+])
+def test_decode_rejects_invalid_cursor(value):
+    with pytest.raises(ValidationError) as exc_info:
+        Cursor.decode(value)
+    assert exc_info.value.code == "INVALID_CURSOR"
+    assert exc_info.value.field == "cursor"
+
+
+@pytest.mark.anyio
+async def test_pages_cover_every_row_once_with_equal_created_at(schema):
+    same_instant = datetime(2026, 10, 18, 12, 0, 0)
+    ids = {uuid.uuid4() for _ in range(7)}
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            TaskModel(
+                id=task_id, title="t", description="d", status=TaskStatus.TODO,
+                priority=TaskPriority.LOW, created_at=same_instant,
+            )
+            for task_id in ids
+        )
+        await db.commit()
+
+    seen = []
+    after = None
+    async with AsyncSessionLocal() as db:
+        repo = TaskRepositoryImpl(db)
+        while True:
+            page = await repo.find_page(limit=3, after=after, with_total=True)
+            assert page.total == len(ids)
+            seen.extend(task.id for task in page.items)
+            if page.next_cursor is None:
+                break
+            # Le curseur fait l'aller-retour par le client sous forme opaque
+            after = Cursor.decode(page.next_cursor.encode())
+
+    assert len(seen) == len(ids)
+    assert set(seen) == ids
+    assert seen == sorted(seen, key=str)
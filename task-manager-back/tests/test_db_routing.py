@@ -0,0 +1,81 @@
+"""
+Lecture sur le primaire après une écriture (cookie db_primary_until)
+"""
+
+import time
+import pytest
+from fastapi import Request, Response
+from config.settings import settings
+from interface.http.dependencies import db as db_dependencies
+from interface.http.dependencies.db import PRIMARY_STICKY_COOKIE, _is_sticky, get_db, get_read_db
+
+pytestmark = pytest.mark.anyio
+
+
+def make_request(cookie: str | None = None) -> Request:
+    headers = []
+    if cookie is not None:
+        headers.append((b"cookie", f"{PRIMARY_STICKY_COOKIE}={cookie}".encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+async def open_session(dependency, arg):
+    generator = dependency(arg)
+    return generator, await generator.__anext__()
+
+
+async def test_get_db_sets_cookie_when_replicas_configured(monkeypatch):
+    monkeypatch.setattr(settings, "db_replica_urls", ["sqlite+aiosqlite://"])
+    monkeypatch.setattr(settings, "db_replica_sticky_seconds", 5)
+    response = Response()
+
+    generator, _ = await open_session(get_db, response)
+    await generator.aclose()
+
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{PRIMARY_STICKY_COOKIE}=")
+    assert "Max-Age=5" in cookie
+    assert "HttpOnly" in cookie
+    until = float(cookie.split(";")[0].split("=", 1)[1])
+    assert time.time() < until <= time.time() + 5
+
+
+@pytest.mark.parametrize("replicas, sticky_seconds", [([], 5), (["sqlite+aiosqlite://"], 0)])
+async def test_get_db_without_cookie(monkeypatch, replicas, sticky_seconds):
+    monkeypatch.setattr(settings, "db_replica_urls", replicas)
+    monkeypatch.setattr(settings, "db_replica_sticky_seconds", sticky_seconds)
+    response = Response()
+
+    generator, _ = await open_session(get_db, response)
+    await generator.aclose()
+
+    assert "set-cookie" not in response.headers
+
+
+def test_is_sticky():
+    assert not _is_sticky(make_request())
+    assert _is_sticky(make_request(str(time.time() + 60)))
+    assert not _is_sticky(make_request(str(time.time() - 1)))
+    assert not _is_sticky(make_request("garbage"))
+
+
+async def test_get_read_db_routes_sticky_client_to_primary():
+    generator, db = await open_session(get_read_db, make_request(str(time.time() + 60)))
+    assert db.info.get("use_primary") is True
+    await generator.aclose()
+
+    generator, db = await open_session(get_read_db, make_request())
+    assert "use_primary" not in db.info
+    await generator.aclose()
+
+
+async def test_cookie_from_get_db_makes_next_read_sticky(monkeypatch):
+    monkeypatch.setattr(settings, "db_replica_urls", ["sqlite+aiosqlite://"])
+    response = Response()
+    generator, _ = await open_session(get_db, response)
+    await generator.aclose()
+    value = response.headers["set-cookie"].split(";")[0].split("=", 1)[1]
+
+    assert _is_sticky(make_request(value))
+    monkeypatch.setattr(db_dependencies.time, "time", lambda: float(value) + 1)
+    assert not _is_sticky(make_request(value))
@@ -0,0 +1,89 @@
+"""
+Outbox des emails: enregistrée avec l'opération, envoyée en tâche de fond
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+import pytest
+from config.database import AsyncSessionLocal
+from core.dto.invitation_dto import InviteCreateDTO
+from core.entities.task import TaskPriority, TaskStatus
+from core.entities.user import User, UserRole
+from core.useCase.invitation.create_invitation_use_case import (
+    CreateInvitationInput,
+    CreateInvitationUseCase,
+)
+from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.repository.email_outbox_repository import EmailOutboxRepositoryImpl
+from infrastructure.database.repository.invitation_repository import InvitationRepositoryImpl
+from infrastructure.database.repository.task_repository import TaskRepositoryImpl
+from infrastructure.database.repository.user_repository import UserRepositoryImpl
+from infrastructure.external.email_service import EmailService
+from infrastructure.workers.email_outbox import EmailOutboxWorker
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def server_timezone(monkeypatch):
+    """Serveur hors UTC: une date naïve décalerait les échéances de plusieurs heures"""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def sent(monkeypatch) -> list[str]:
+    """Destinataires des emails envoyés (sans SMTP)"""
+    recipients: list[str] = []
+
+    def send_rendered(to_email, email):
+        recipients.append(to_email)
+        return True
+
+    monkeypatch.setattr(EmailService, "send_rendered", send_rendered)
+    return recipients
+
+
+async def seed_task() -> uuid.UUID:
+    task_id = uuid.uuid4()
+    async with AsyncSessionLocal() as db:
+        db.add(TaskModel(id=task_id, title="Tâche", description="d", status=TaskStatus.TODO, priority=TaskPriority.LOW))
+        await db.commit()
+    return task_id
+
+
+def owner() -> User:
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid.uuid4(), first_name="Ada", last_name="Owner", email="owner@example.com",
+        password="x", verified=True, role=UserRole.OWNER, created_at=now, updated_at=now,
+    )
+
+
+async def test_invitation_use_case_enqueues_and_worker_delivers(schema, server_timezone, sent):
+    task_id = await seed_task()
+    async with AsyncSessionLocal() as db:
+        inviter = await UserRepositoryImpl(db).save(owner())
+        use_case = CreateInvitationUseCase(
+            InvitationRepositoryImpl(db), UserRepositoryImpl(db), TaskRepositoryImpl(db),
+            EmailOutboxRepositoryImpl(db),
+        )
+        invitation = await use_case.execute(CreateInvitationInput(
+            dto=InviteCreateDTO(email="guest@example.com", task_id=task_id), current_user=inviter,
+        ))
+        assert invitation.email == "guest@example.com"
+        assert await EmailOutboxRepositoryImpl(db).count_by_status() == {"pending": 1}
+    assert sent == []
+
+    worker = EmailOutboxWorker()
+    assert await worker.drain_once() == 1
+
+    assert sent == ["guest@example.com"]
+    assert worker.metrics.sent == 1
+    async with AsyncSessionLocal() as db:
+        assert await EmailOutboxRepositoryImpl(db).count_by_status() == {"sent": 1}
+    assert await worker.drain_once() == 0
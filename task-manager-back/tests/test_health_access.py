@@ -0,0 +1,56 @@
+"""
+Télémétrie interne (/health/*): réservée aux OWNER et aux sondes munies du jeton interne
+"""
+
+import uuid
+from datetime import datetime, timezone
+import httpx
+import pytest
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.entities.user import User, UserRole
+from core.services.auth_service import AuthService
+from infrastructure.database.repository.user_repository import UserRepositoryImpl
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+
+async def access_token(role: UserRole) -> str:
+    now = datetime.now(timezone.utc)
+    user = User(
+        id=uuid.uuid4(), first_name="Ada", last_name="Lovelace", email=f"{role.value.lower()}@example.com",
+        password="x", verified=True, role=role, created_at=now, updated_at=now,
+    )
+    async with AsyncSessionLocal() as db:
+        await UserRepositoryImpl(db).save(user)
+    return AuthService.create_access_token(user)
+
+
+async def get(path: str, headers: dict[str, str] | None = None) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+async def test_liveness_stays_public():
+    assert (await get("/health")).status_code == 200
+
+
+async def test_telemetry_requires_an_owner(schema):
+    assert (await get("/health/invitations")).status_code == 401
+
+    member = await access_token(UserRole.MEMBER)
+    assert (await get("/health/invitations", {"Authorization": f"Bearer {member}"})).status_code == 403
+
+    owner = await access_token(UserRole.OWNER)
+    response = await get("/health/db", {"Authorization": f"Bearer {owner}"})
+    assert response.status_code == 200
+    assert response.json()["data"]["pools"]
+
+
+async def test_telemetry_accepts_the_internal_token(monkeypatch):
+    assert (await get("/health/hasher", {"X-Health-Token": ""})).status_code == 401
+
+    monkeypatch.setattr(settings, "health_token", "probe-secret")
+    assert (await get("/health/hasher", {"X-Health-Token": "probe-secret"})).status_code == 200
+    assert (await get("/health/hasher", {"X-Health-Token": "wrong"})).status_code == 401
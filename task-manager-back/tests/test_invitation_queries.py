@@ -0,0 +1,156 @@
+"""
+Invitations: détails en une seule requête, invitations en attente et balayage
+"""
+
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import event, select
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.entities.invitation import Invitation
+from core.entities.task import TaskPriority, TaskStatus
+from core.dto.invitation_dto import InviteBulkCreateDTO, InviteBulkStatus
+from core.entities.user import User, UserRole
+from infrastructure.database.models.invitationModel import InvitationModel
+from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.models.userModel import UserModel
+from infrastructure.workers.invitation_sweeper import InvitationSweeper
+from interface.http.controllers.invitation_controller import InvitationController
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed_invitations(count: int) -> list[InvitationModel]:
+    owner = UserModel(
+        id=uuid.uuid4(), first_name="Ada", last_name="Owner", email="owner@example.com",
+        password="x", verified=True, role=UserRole.OWNER,
+    )
+    tasks = [
+        TaskModel(
+            id=uuid.uuid4(), title=f"Tâche {i}", description="d",
+            status=TaskStatus.TODO, priority=TaskPriority.LOW,
+        )
+        for i in range(count)
+    ]
+    invitations = [
+        InvitationModel(
+            id=uuid.uuid4(), email=f"guest{i}@example.com", task_id=tasks[i].id,
+            token=secrets.token_urlsafe(16), invited_by=owner.id,
+        )
+        for i in range(count)
+    ]
+    async with AsyncSessionLocal() as db:
+        db.add(owner)
+        db.add_all(tasks)
+        await db.flush()
+        db.add_all(invitations)
+        await db.commit()
+    return invitations
+
+
+@pytest.fixture
+def statements(schema):
+    """Requêtes SQL exécutées pendant le test"""
+    executed: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(schema.sync_engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(schema.sync_engine, "before_cursor_execute", count)
+
+
+@pytest.mark.parametrize("count", [1, 5, 25])
+async def test_details_use_one_query(statements, count):
+    invitations = await seed_invitations(count)
+
+    async with AsyncSessionLocal() as db:
+        controller = InvitationController(db)
+
+        statements.clear()
+        pending = await controller.get_all_pending()
+        assert len(pending) == count
+        assert {p.task_title for p in pending} == {f"Tâche {i}" for i in range(count)}
+        assert len(statements) == 1
+
+        statements.clear()
+        detail = await controller.get_by_id(invitations[-1].id)
+        assert detail.email == invitations[-1].email
+        assert len(statements) == 1
+
+        statements.clear()
+        detail = await controller.get_by_token(invitations[0].token)
+        assert detail.id == invitations[0].id
+        assert len(statements) == 1
+
+
+async def test_expired_invitation_is_not_pending(schema):
+    invitations = await seed_invitations(2)
+    async with AsyncSessionLocal() as db:
+        expired = await db.get(InvitationModel, invitations[0].id)
+        expired.expires_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        pending = await InvitationController(db).get_all_pending()
+    assert [p.id for p in pending] == [invitations[1].id]
+
+
+@pytest.mark.parametrize("tzinfo", [timezone.utc, None])
+def test_is_expired_accepts_naive_utc_dates(tzinfo):
+    now = datetime.now(timezone.utc).replace(tzinfo=tzinfo)
+    invitation = Invitation(
+        id=uuid.uuid4(), email="guest@example.com", task_id=uuid.uuid4(), token="t",
+        invited_by=uuid.uuid4(), accepted=False, expires_at=now + timedelta(minutes=5), created_at=now,
+    )
+
+    assert invitation.is_valid()
+    invitation.expires_at = now - timedelta(minutes=5)
+    assert invitation.is_expired()
+
+
+async def test_bulk_skips_pending_pairs_only(schema):
+    invitations = await seed_invitations(2)
+    expired, pending = invitations
+    async with AsyncSessionLocal() as db:
+        model = await db.get(InvitationModel, expired.id)
+        model.expires_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        await db.commit()
+
+    now = datetime.now(timezone.utc)
+    owner = User(
+        id=pending.invited_by, first_name="Ada", last_name="Owner", email="owner@example.com",
+        password="x", verified=True, role=UserRole.OWNER, created_at=now, updated_at=now,
+    )
+    async with AsyncSessionLocal() as db:
+        result = await InvitationController(db).create_invitations_bulk(
+            InviteBulkCreateDTO(emails=[expired.email, pending.email.upper()], task_ids=[expired.task_id, pending.task_id]),
+            owner,
+        )
+
+    statuses = {(row.email.lower(), row.task_id): row.status for row in result.results}
+    assert statuses.pop((pending.email, pending.task_id)) == InviteBulkStatus.ALREADY_PENDING
+    assert set(statuses.values()) == {InviteBulkStatus.CREATED}
+    assert (result.created, result.rejected) == (3, 1)
+
+
+async def test_sweep_removes_only_invitations_expired_past_retention(schema, monkeypatch):
+    monkeypatch.setattr(settings, "invitation_retention_days", 30)
+    monkeypatch.setattr(settings, "invitation_sweep_batch_size", 2)
+    invitations = await seed_invitations(5)
+    async with AsyncSessionLocal() as db:
+        for days, invitation in zip((40, 35, 31, 20), invitations):
+            model = await db.get(InvitationModel, invitation.id)
+            model.expires_at = datetime.now(timezone.utc) - timedelta(days=days)
+        await db.commit()
+
+    sweeper = InvitationSweeper()
+    assert await sweeper.sweep_once() == 3
+
+    async with AsyncSessionLocal() as db:
+        remaining = {model.id for model in (await db.scalars(select(InvitationModel))).all()}
+    assert remaining == {invitations[3].id, invitations[4].id}
+    assert sweeper.metrics.last_sweep_at.tzinfo is not None
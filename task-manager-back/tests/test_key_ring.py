@@ -0,0 +1,53 @@
+"""
+Décodage des tokens: un en-tête malformé est un token invalide, pas une erreur 500
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from jose import JWTError, jwt
+from core.services.auth_service import AuthService
+from core.services.key_ring import key_ring
+
+
+def payload() -> dict:
+    return {
+        "sub": str(uuid.uuid4()),
+        "type": "access",
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=5),
+    }
+
+
+def signed_with_kid(kid) -> str:
+    signing_key = key_ring.signing_key
+    return jwt.encode(payload(), signing_key.key, algorithm=signing_key.alg, headers={"kid": kid})
+
+
+def test_decode_round_trip():
+    token = key_ring.sign(payload())
+    assert key_ring.decode(token)["type"] == "access"
+
+
+@pytest.mark.parametrize("kid", [["a", "b"], {"kid": "x"}, 42, "unknown-kid"])
+def test_invalid_kid_raises_jwt_error(kid):
+    token = signed_with_kid(kid)
+
+    with pytest.raises(JWTError):
+        key_ring.decode(token)
+    assert AuthService.verify_token(token, use_cache=False) is None
+
+
+@pytest.mark.parametrize("token", ["", "garbage", "a.b.c", "W10.e30.sig"])
+def test_malformed_token_raises_jwt_error(token):
+    with pytest.raises(JWTError):
+        key_ring.decode(token)
+
+
+def test_unexpected_header_error_becomes_jwt_error(monkeypatch):
+    def broken_header(token):
+        raise ValueError("unexpected")
+
+    monkeypatch.setattr(jwt, "get_unverified_header", broken_header)
+
+    with pytest.raises(JWTError):
+        key_ring.decode(key_ring.sign(payload()))
@@ -0,0 +1,82 @@
+"""
+Tentatives de connexion simultanées: l'échec est réservé avant la vérification
+"""
+
+import asyncio
+import uuid
+import pytest
+from config.database import AsyncSessionLocal
+from core.dto.auth_dto import LoginDTO
+from core.entities.user import UserRole
+from core.errors.base import RateLimitError
+from core.services.password_hasher import password_hasher
+from core.services.rate_limiter import LoginThrottle, MemoryRateLimitStorage
+from infrastructure.database.models.userModel import UserModel
+from interface.http.controllers import auth_controller
+from interface.http.controllers.auth_controller import AuthController
+
+pytestmark = pytest.mark.anyio
+
+EMAIL_LIMIT = 5
+
+
+@pytest.fixture
+def throttle(monkeypatch):
+    throttle = LoginThrottle(MemoryRateLimitStorage(max_keys=1000, max_ttl=3600))
+    throttle.by_ip.limit = 1000
+    throttle.by_email.limit = EMAIL_LIMIT
+    monkeypatch.setattr(auth_controller, "login_throttle", throttle)
+    return throttle
+
+
+async def test_concurrent_checks_do_not_exceed_email_limit(throttle):
+    results = await asyncio.gather(
+        *(throttle.check("10.0.0.1", "victim@example.com") for _ in range(12)),
+        return_exceptions=True,
+    )
+
+    assert sum(result is None for result in results) == EMAIL_LIMIT
+    assert all(isinstance(r, RateLimitError) for r in results if r is not None)
+    assert throttle.rejected_email == 12 - EMAIL_LIMIT
+
+
+async def test_success_releases_reserved_attempt(throttle):
+    for _ in range(EMAIL_LIMIT - 1):
+        await throttle.check(None, "user@example.com")
+    await throttle.record_success("User@Example.com ")
+
+    for _ in range(EMAIL_LIMIT):
+        await throttle.check(None, "user@example.com")
+    with pytest.raises(RateLimitError):
+        await throttle.check(None, "user@example.com")
+
+
+async def test_rejected_attempt_is_not_counted(throttle):
+    for _ in range(EMAIL_LIMIT):
+        await throttle.check(None, "user@example.com")
+    retry_after = await throttle.by_email.retry_after(throttle._email_key("user@example.com"))
+
+    for _ in range(3):
+        with pytest.raises(RateLimitError) as exc_info:
+            await throttle.check(None, "user@example.com")
+        assert exc_info.value.retry_after == retry_after
+
+
+async def test_concurrent_wrong_passwords_hit_limit(schema, throttle):
+    async with AsyncSessionLocal() as db:
+        db.add(UserModel(
+            id=uuid.uuid4(), first_name="Ada", last_name="Lovelace", email="ada@example.com",
+            password=await password_hasher.hash("correct-horse"), verified=True, role=UserRole.MEMBER,
+        ))
+        await db.commit()
+
+    async def attempt(password: str):
+        async with AsyncSessionLocal() as db:
+            return await AuthController(db).login(LoginDTO(email="ada@example.com", password=password))
+
+    results = await asyncio.gather(*(attempt("wrong") for _ in range(10)), return_exceptions=True)
+
+    assert sum(result is None for result in results) == EMAIL_LIMIT
+    assert sum(isinstance(result, RateLimitError) for result in results) == 10 - EMAIL_LIMIT
+    with pytest.raises(RateLimitError):
+        await attempt("correct-horse")
@@ -0,0 +1,109 @@
+"""
+Fenêtres glissantes de la limitation des tentatives de connexion
+"""
+
+import time
+import pytest
+from core.errors.base import RateLimitError
+from core.services.rate_limiter import LoginThrottle, MemoryRateLimitStorage, SlidingWindowLimiter
+
+pytestmark = pytest.mark.anyio
+
+WINDOW = 60
+T0 = 1_000_000 * WINDOW  # début d'une fenêtre
+
+
+class Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(T0)
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+def limiter(limit: int) -> SlidingWindowLimiter:
+    return SlidingWindowLimiter(MemoryRateLimitStorage(1000, 4 * WINDOW), "test", limit, WINDOW)
+
+
+async def acquired(window: SlidingWindowLimiter, count: int) -> int:
+    return sum([await window.acquire("subject") == 0 for _ in range(count)])
+
+
+async def test_limit_per_window(clock):
+    window = limiter(3)
+
+    assert await acquired(window, 5) == 3
+    assert await window.retry_after("subject") > 0
+    assert await window.retry_after("other") == 0
+
+
+async def test_previous_window_is_weighted_by_overlap(clock):
+    window = limiter(4)
+    clock.now = T0 + 50
+    assert await acquired(window, 4) == 4
+
+    # Mi-fenêtre suivante: la précédente compte pour moitié (4 * 0.5 = 2)
+    clock.now = T0 + WINDOW + 30
+    assert await acquired(window, 5) == 2
+
+    # Deux fenêtres plus tard, plus rien ne compte
+    clock.now = T0 + 3 * WINDOW
+    assert await acquired(window, 5) == 4
+
+
+@pytest.mark.parametrize("previous, current, elapsed", [
+    (0, 4, 0),
+    (6, 2, 0),  # attente exacte: 40 secondes
+    (5, 1, 17.5),
+    (3, 4, 59),
+])
+async def test_retry_after_is_enough(clock, previous, current, elapsed):
+    window = limiter(4)
+    storage = window.storage
+    previous_key, current_key = (f"test:subject:{T0 // WINDOW + i}" for i in (0, 1))
+    await storage.incr(previous_key, T0 + 3 * WINDOW, amount=previous)
+    await storage.incr(current_key, T0 + 3 * WINDOW, amount=current)
+    clock.now = T0 + WINDOW + elapsed
+
+    retry_after = await window.retry_after("subject")
+
+    assert retry_after >= 1
+    clock.now += retry_after
+    assert await window.retry_after("subject") == 0
+    assert await window.acquire("subject") == 0
+
+
+async def test_disabled_limit(clock):
+    window = limiter(0)
+    assert await acquired(window, 100) == 100
+    assert await window.retry_after("subject") == 0
+
+
+async def test_login_throttle_ip_and_email_windows(clock):
+    throttle = LoginThrottle(MemoryRateLimitStorage(1000, 4 * WINDOW))
+    throttle.by_ip = SlidingWindowLimiter(throttle.storage, "login:ip", 3, WINDOW)
+    throttle.by_email = SlidingWindowLimiter(throttle.storage, "login:email", 2, WINDOW)
+
+    # Échecs par email, quelle que soit l'IP
+    await throttle.check("10.0.0.1", "a@example.com")
+    await throttle.check("10.0.0.2", "A@example.com")
+    with pytest.raises(RateLimitError):
+        await throttle.check("10.0.0.3", "a@example.com")
+
+    # Toutes les tentatives par IP, quel que soit l'email
+    await throttle.check("10.0.0.1", "b@example.com")
+    await throttle.check("10.0.0.1", "c@example.com")
+    with pytest.raises(RateLimitError) as exc_info:
+        await throttle.check("10.0.0.1", "d@example.com")
+    assert throttle.rejected_ip == 1
+    assert throttle.rejected_email == 1
+
+    clock.now += exc_info.value.retry_after
+    await throttle.check("10.0.0.1", "d@example.com")
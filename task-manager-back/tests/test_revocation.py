@@ -0,0 +1,135 @@
+"""
+Révocation des tokens: logout, rotation des refresh tokens, détection de réutilisation
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from config.database import AsyncSessionLocal
+from core.dto.auth_dto import LoginDTO, RefreshTokenDTO
+from core.entities.user import UserRole
+from core.services.auth_service import AuthService
+from core.services.key_ring import key_ring
+from core.services.password_hasher import password_hasher
+from core.services.revocation_store import RevocationStore
+from core.services.rate_limiter import LoginThrottle, MemoryRateLimitStorage
+from infrastructure.database.models.revokedTokenModel import RevokedTokenModel
+from infrastructure.database.models.userModel import UserModel
+from infrastructure.workers.revocation_sync import sync_revocations
+from interface.http.controllers import auth_controller
+from interface.http.controllers.auth_controller import AuthController
+from interface.http.routes.auth_routes import logout as logout_route
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def store(schema, monkeypatch):
+    store = RevocationStore()
+    monkeypatch.setattr(auth_controller, "revocation_store", store)
+    monkeypatch.setattr(
+        auth_controller, "login_throttle", LoginThrottle(MemoryRateLimitStorage(1000, 3600))
+    )
+    async with AsyncSessionLocal() as db:
+        db.add(UserModel(
+            id=uuid.uuid4(), first_name="Ada", last_name="Lovelace", email="ada@example.com",
+            password=await password_hasher.hash("correct-horse"), verified=True, role=UserRole.MEMBER,
+        ))
+        await db.commit()
+    return store
+
+
+async def login():
+    async with AsyncSessionLocal() as db:
+        return await AuthController(db).login(LoginDTO(email="ada@example.com", password="correct-horse"))
+
+
+async def refresh(refresh_token: str):
+    async with AsyncSessionLocal() as db:
+        return await AuthController(db).refresh_token(RefreshTokenDTO(refresh_token=refresh_token))
+
+
+def claims_of(token: str, expected_type: str = "access"):
+    return AuthService.verify_token(token, expected_type=expected_type, use_cache=False)
+
+
+async def revoked_rows() -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(func.count()).select_from(RevokedTokenModel))
+
+
+async def test_logout_revokes_access_and_refresh_tokens_of_session(store):
+    tokens = await login()
+    other_session = await login()
+
+    async with AsyncSessionLocal() as db:
+        assert await AuthController(db).logout(claims_of(tokens.access_token)) is True
+
+    assert store.is_revoked(claims_of(tokens.access_token))
+    assert store.is_revoked(claims_of(tokens.refresh_token, "refresh"))
+    assert await refresh(tokens.refresh_token) is None
+    assert not store.is_revoked(claims_of(other_session.access_token))
+    assert await refresh(other_session.refresh_token) is not None
+
+    # Les autres workers l'apprennent par la table revoked_token
+    other_worker = RevocationStore()
+    await sync_revocations(other_worker)
+    assert other_worker.is_revoked(claims_of(tokens.access_token))
+
+
+async def test_refresh_token_rotation(store):
+    tokens = await login()
+
+    rotated = await refresh(tokens.refresh_token)
+
+    assert rotated is not None
+    assert claims_of(rotated.refresh_token, "refresh").sid == claims_of(tokens.refresh_token, "refresh").sid
+    assert await refresh(rotated.refresh_token) is not None
+    assert store.reuse_detected == 0
+
+
+async def test_refresh_token_reuse_revokes_whole_session(store):
+    tokens = await login()
+    rotated = await refresh(tokens.refresh_token)
+
+    # Le token déjà échangé est rejoué (vol): toute la session tombe
+    assert await refresh(tokens.refresh_token) is None
+
+    assert store.reuse_detected == 1
+    assert store.is_revoked(claims_of(rotated.access_token))
+    assert await refresh(rotated.refresh_token) is None
+
+
+async def test_reuse_is_detected_across_workers(store):
+    tokens = await login()
+    assert await refresh(tokens.refresh_token) is not None
+
+    # Autre worker, registre vide: la clé primaire en base détecte la réutilisation
+    other_worker = RevocationStore()
+    async with AsyncSessionLocal() as db:
+        claims = claims_of(tokens.refresh_token, "refresh")
+        assert not await other_worker.consume_refresh_token(
+            AuthController(db).revoked_token_repository, claims
+        )
+    assert other_worker.reuse_detected == 1
+    assert other_worker.is_revoked(claims_of(tokens.access_token))
+
+
+async def test_logout_rejects_token_without_jti_or_sid(store):
+    legacy_token = key_ring.sign({
+        "sub": str(uuid.uuid4()),
+        "type": "access",
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=5),
+    })
+    claims = claims_of(legacy_token)
+
+    async with AsyncSessionLocal() as db:
+        assert await AuthController(db).logout(claims) is False
+        with pytest.raises(HTTPException) as exc_info:
+            await logout_route(claims, db)
+
+    assert exc_info.value.status_code == 401
+    assert len(store) == 0
+    assert await revoked_rows() == 0
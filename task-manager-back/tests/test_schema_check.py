@@ -0,0 +1,60 @@
+"""
+Vérification de la révision Alembic au démarrage
+"""
+
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from infrastructure.database.schema_check import (
+    MIGRATIONS_DIR,
+    SchemaRevisionError,
+    check_schema_revision,
+    current_revisions,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def sqlite_engine(anyio_backend, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/schema.db")
+    yield engine
+    await engine.dispose()
+
+
+async def set_revision(engine, revision: str) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32))"))
+        await conn.execute(text("DELETE FROM alembic_version"))
+        await conn.execute(text("INSERT INTO alembic_version VALUES (:r)"), {"r": revision})
+
+
+async def test_unmigrated_sqlite_database_has_no_revision(sqlite_engine):
+    assert await current_revisions(sqlite_engine) == set()
+
+
+async def test_current_revisions(sqlite_engine):
+    await set_revision(sqlite_engine, "0005")
+    assert await current_revisions(sqlite_engine) == {"0005"}
+
+
+async def test_strict_mode(sqlite_engine):
+    with pytest.raises(SchemaRevisionError, match="revision none"):
+        await check_schema_revision(sqlite_engine, "strict")
+
+    await set_revision(sqlite_engine, "0001")
+    with pytest.raises(SchemaRevisionError, match="revision 0001"):
+        await check_schema_revision(sqlite_engine, "strict")
+    await check_schema_revision(sqlite_engine, "warn")
+    await check_schema_revision(sqlite_engine, "off")
+
+
+async def test_head_and_newer_revisions_pass(sqlite_engine):
+    (head,) = ScriptDirectory(str(MIGRATIONS_DIR)).get_heads()
+    await set_revision(sqlite_engine, head)
+    await check_schema_revision(sqlite_engine, "strict")
+
+    await set_revision(sqlite_engine, "9999")
+    await check_schema_revision(sqlite_engine, "strict")
+
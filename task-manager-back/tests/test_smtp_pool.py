@@ -0,0 +1,147 @@
+"""
+Pool SMTP: un refus du serveur ne rouvre pas de connexion, une coupure est retentée une fois
+"""
+
+import smtplib
+import socketserver
+import threading
+import pytest
+from infrastructure.external.smtp_pool import SMTPConnectionPool
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    Serveur SMTP minimal
+
+    - RCPT refused@...: 550, RCPT closing@...: 421 puis fermeture
+    - MAIL FROM blocked@...: 553
+    - drop_after_messages: coupe la connexion après ce nombre de messages
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubSMTPHandler)
+        self.connections = 0
+        self.delivered: list[str] = []
+        self.drop_after_messages: int | None = None
+
+
+class StubSMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server: StubSMTPServer = self.server
+        server.connections += 1
+        messages = 0
+        recipients: list[str] = []
+        self.reply("220 stub ESMTP")
+        for raw in self.rfile:
+            command = raw.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 stub")
+            elif verb == "MAIL":
+                if "blocked@" in command:
+                    self.reply("553 5.7.1 Sender rejected")
+                else:
+                    self.reply("250 OK")
+            elif verb == "RCPT":
+                if "refused@" in command:
+                    self.reply("550 5.1.1 No such user")
+                elif "closing@" in command:
+                    self.reply("421 4.3.2 Closing connection")
+                    return
+                else:
+                    recipients.append(command[command.index("<") + 1:command.index(">")])
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for line in self.rfile:
+                    if line == b".\r\n":
+                        break
+                server.delivered.extend(recipients)
+                recipients = []
+                messages += 1
+                self.reply("250 OK")
+                if server.drop_after_messages is not None and messages >= server.drop_after_messages:
+                    return
+            elif verb in ("RSET", "NOOP"):
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+@pytest.fixture
+def server():
+    server = StubSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pool(server):
+    pool = SMTPConnectionPool(
+        host="127.0.0.1", port=server.server_address[1], starttls=False,
+        size=2, noop_after=3600, timeout=5,
+    )
+    yield pool
+    pool.close()
+
+
+MESSAGE = "Subject: test\r\n\r\nHello\r\n"
+
+
+def test_refused_recipient_keeps_connection_and_does_not_retry(server, pool):
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pool.send("app@example.com", ["refused@example.com"], MESSAGE)
+
+    assert server.connections == 1
+    assert pool.metrics.retries == 0
+    assert pool.metrics.opened == 1
+    assert pool.snapshot()["idle"] == 1
+
+    pool.send("app@example.com", ["ok@example.com"], MESSAGE)
+
+    assert server.connections == 1
+    assert pool.metrics.reused == 1
+    assert server.delivered == ["ok@example.com"]
+
+
+def test_refused_sender_does_not_retry(server, pool):
+    with pytest.raises(smtplib.SMTPSenderRefused):
+        pool.send("blocked@example.com", ["ok@example.com"], MESSAGE)
+
+    assert server.connections == 1
+    assert pool.metrics.retries == 0
+    assert pool.snapshot()["idle"] == 1
+
+
+def test_connection_closed_by_refusal_is_not_pooled(server, pool):
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pool.send("app@example.com", ["closing@example.com"], MESSAGE)
+
+    assert pool.metrics.retries == 0
+    assert pool.snapshot()["idle"] == 0
+    assert pool.snapshot()["open"] == 0
+
+
+def test_dropped_connection_is_retried_once(server, pool):
+    server.drop_after_messages = 1
+    pool.send("app@example.com", ["first@example.com"], MESSAGE)
+
+    # La connexion au repos a été coupée par le serveur: rouverte, envoi retenté
+    pool.send("app@example.com", ["second@example.com"], MESSAGE)
+
+    assert pool.metrics.retries == 1
+    assert server.connections == 2
+    assert pool.metrics.sent == 2
+    assert server.delivered == ["first@example.com", "second@example.com"]
@@ -0,0 +1,128 @@
+"""
+Création et mise à jour des tâches: tâche disparue et assignés refusés par la base
+"""
+
+import uuid
+import pytest
+from sqlalchemy import event, func, select
+from config.database import AsyncSessionLocal
+from core.dto.task_dto import TaskCreateDTO, TaskUpdateDTO
+from core.entities.task import TaskPriority, TaskStatus
+from core.entities.user import UserRole
+from core.errors.task_errors import TaskAssigneesConflictError
+from infrastructure.database.models.taskAssignment import TaskAssignmentModel
+from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.models.userModel import UserModel
+from infrastructure.database.repository.task_repository import TaskRepositoryImpl
+from interface.http.controllers.task_controller import TaskController
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def foreign_keys(schema):
+    """Clés étrangères appliquées par SQLite (désactivées par défaut)"""
+    def enable(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    event.listen(schema.sync_engine, "connect", enable)
+    await schema.dispose()
+    yield
+    event.remove(schema.sync_engine, "connect", enable)
+
+
+async def add_user() -> uuid.UUID:
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as db:
+        db.add(UserModel(
+            id=user_id, first_name="Ada", last_name="Lovelace", email=f"{user_id}@example.com",
+            password="x", verified=True, role=UserRole.MEMBER,
+        ))
+        await db.commit()
+    return user_id
+
+
+async def assignments() -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(func.count()).select_from(TaskAssignmentModel))
+
+
+def skip_assignee_check(controller: TaskController) -> None:
+    """Assigné supprimé entre la vérification et l'écriture"""
+    async def no_unknown(assigned_to):
+        return None
+    controller._unknown_assignees = no_unknown
+
+
+async def test_update_of_deleted_task_returns_none(foreign_keys):
+    async with AsyncSessionLocal() as db:
+        controller = TaskController(db)
+        created = await controller.create(TaskCreateDTO(title="t", description="d"))
+        entity = await controller.repository.find_by_id(created.id)
+        await db.delete(await db.get(TaskModel, created.id))
+        await db.commit()
+
+        assert await TaskRepositoryImpl(db).update(entity) is None
+        assert await controller.update(created.id, TaskUpdateDTO(title="nouveau")) is None
+
+
+async def test_create_with_vanished_assignee_is_a_conflict(foreign_keys):
+    user_id = await add_user()
+    async with AsyncSessionLocal() as db:
+        controller = TaskController(db)
+        skip_assignee_check(controller)
+
+        with pytest.raises(TaskAssigneesConflictError) as exc_info:
+            await controller.create(TaskCreateDTO(title="t", description="d", assigned_to=[uuid.uuid4()]))
+        assert exc_info.value.status_code == 409
+
+        # Transaction annulée: la session reste utilisable, rien n'a été écrit
+        created = await controller.create(TaskCreateDTO(title="t2", description="d", assigned_to=[user_id]))
+        assert created.assigned_to == [user_id]
+        assert await db.scalar(select(func.count()).select_from(TaskModel)) == 1
+    assert await assignments() == 1
+
+
+async def test_update_with_vanished_assignee_is_a_conflict(foreign_keys):
+    user_id = await add_user()
+    async with AsyncSessionLocal() as db:
+        controller = TaskController(db)
+        created = await controller.create(TaskCreateDTO(title="t", description="d", assigned_to=[user_id]))
+        skip_assignee_check(controller)
+
+        with pytest.raises(TaskAssigneesConflictError):
+            await controller.update(created.id, TaskUpdateDTO(title="nouveau", assigned_to=[uuid.uuid4()]))
+
+    async with AsyncSessionLocal() as db:
+        task = await TaskRepositoryImpl(db).find_by_id(created.id)
+    assert task.title == "t"
+    assert task.assigned_to == [user_id]
+
+
+async def test_unknown_assignee_is_rejected_before_writing(foreign_keys):
+    async with AsyncSessionLocal() as db:
+        result = await TaskController(db).create(
+            TaskCreateDTO(title="t", description="d", assigned_to=[uuid.uuid4()])
+        )
+    assert isinstance(result, str)
+    assert await assignments() == 0
+
+
+async def test_update_replaces_assignees(foreign_keys):
+    first, second = await add_user(), await add_user()
+    async with AsyncSessionLocal() as db:
+        controller = TaskController(db)
+        created = await controller.create(TaskCreateDTO(
+            title="t", description="d", status=TaskStatus.TODO, priority=TaskPriority.LOW,
+            assigned_to=[first, first],
+        ))
+        assert created.assigned_to == [first]
+
+        updated = await controller.update(created.id, TaskUpdateDTO(assigned_to=[second, first]))
+        assert updated.assigned_to == [second, first]
+
+        updated = await controller.update(created.id, TaskUpdateDTO(assigned_to=[]))
+        assert updated.assigned_to == []
+    assert await assignments() == 0
@@ -0,0 +1,137 @@
+"""
+Import de tâches: validation ligne par ligne (NDJSON, CSV, gzip)
+"""
+
+import gzip
+import json
+import uuid
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from config.database import AsyncSessionLocal
+from config.settings import settings
+from core.dto.task_dto import TaskUpdateDTO
+from core.entities.user import UserRole
+from infrastructure.database.models.taskAssignment import TaskAssignmentModel
+from infrastructure.database.models.taskModel import TaskModel
+from infrastructure.database.models.userModel import UserModel
+from interface.http.controllers.task_controller import TaskController
+from interface.http.imports import ImportFormat, parse_records
+
+pytestmark = pytest.mark.anyio
+
+
+async def chunks_of(data: bytes, size: int = 7):
+    """Flux découpé en petits morceaux: les lignes et caractères UTF-8 sont coupés"""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def run_import(data: bytes, import_format: ImportFormat, compressed: bool = False):
+    async with AsyncSessionLocal() as db:
+        return await TaskController(db).import_tasks(parse_records(chunks_of(data), import_format, compressed))
+
+
+async def count(model) -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.fixture
+async def user_id(schema) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as db:
+        db.add(UserModel(
+            id=user_id, first_name="Ada", last_name="Lovelace", email="ada@example.com",
+            password="x", verified=True, role=UserRole.MEMBER,
+        ))
+        await db.commit()
+    return user_id
+
+
+def ndjson(*lines) -> bytes:
+    return "".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines).encode()
+
+
+async def test_ndjson_rows_are_validated_line_by_line(user_id):
+    data = ndjson(
+        {"title": "Tâche é", "description": "ok", "assigned_to": [str(user_id), str(user_id)]},
+        "{not json",
+        "[1, 2]",
+        "",
+        {"title": "x" * 256, "description": "trop long"},
+        {"title": "sans description"},
+        {"title": "t", "description": "d", "status": "UNKNOWN"},
+        {"title": "t", "description": "d", "assigned_to": [str(uuid.uuid4())]},
+        {"title": "Deuxième", "description": "ok", "priority": "HIGH", "id": "ignored"},
+    )
+
+    result = await run_import(data, ImportFormat.NDJSON)
+
+    assert result.imported == 2
+    assert result.rejected == 6
+    errors = {error.line: error.errors for error in result.errors}
+    assert sorted(errors) == [2, 3, 5, 6, 7, 8]
+    assert errors[2][0].startswith("JSON invalide")
+    assert errors[3] == ["Objet JSON attendu"]
+    assert errors[5][0].startswith("title:")
+    assert errors[6][0].startswith("description:")
+    assert errors[7][0].startswith("status:")
+    assert errors[8][0].startswith("assigned_to: utilisateurs inconnus")
+    assert await count(TaskModel) == 2
+    # Assigné en double dans la ligne: une seule assignation
+    assert await count(TaskAssignmentModel) == 1
+
+
+async def test_csv_import(user_id):
+    data = (
+        "title,description,status,assigned_to,created_at\n"
+        f'Première,"Sur deux\nlignes",DONE,{user_id},2026-01-01\n'
+        "Deuxième,sans assigné,,,\n"
+        "colonnes,manquantes\n"
+        'fin,"guillemet non fermé\n'
+    ).encode()
+
+    result = await run_import(data, ImportFormat.CSV)
+
+    assert result.imported == 2
+    assert [(error.line, error.errors) for error in result.errors] == [
+        (5, ["2 colonnes au lieu de 5"]),
+        (6, ["CSV invalide: guillemet non fermé"]),
+    ]
+    async with AsyncSessionLocal() as db:
+        description = await db.scalar(select(TaskModel.description).where(TaskModel.title == "Première"))
+    assert description == "Sur deux\nlignes"
+    assert await count(TaskAssignmentModel) == 1
+
+
+async def test_gzip_import(user_id):
+    data = gzip.compress(ndjson(*({"title": f"t{i}", "description": "d"} for i in range(10))))
+
+    result = await run_import(data, ImportFormat.NDJSON, compressed=True)
+
+    assert result.imported == 10
+    assert result.rejected == 0
+
+
+async def test_batches_and_error_report_limit(user_id, monkeypatch):
+    monkeypatch.setattr(settings, "task_import_batch_size", 3)
+    monkeypatch.setattr(settings, "task_import_max_errors", 2)
+    data = ndjson(*(
+        {"title": f"t{i}", "description": "d"} if i % 2 else {"title": f"t{i}"}
+        for i in range(10)
+    ))
+
+    result = await run_import(data, ImportFormat.NDJSON)
+
+    assert result.imported == 5
+    assert result.rejected == 5
+    assert [error.line for error in result.errors] == [1, 3]
+    assert await count(TaskModel) == 5
+
+
+def test_update_dto_enforces_column_lengths():
+    assert TaskUpdateDTO(title="x" * 255, description="y" * 255).title == "x" * 255
+    for field in ("title", "description"):
+        with pytest.raises(ValidationError):
+            TaskUpdateDTO(**{field: "x" * 256})
@@ -0,0 +1,68 @@
+"""
+Dates des tokens: UTC avec fuseau, quel que soit le fuseau du serveur
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from config.database import AsyncSessionLocal
+from core.entities.user import User, UserRole
+from core.services.auth_service import AuthService
+from core.services.revocation_store import RevocationStore
+from infrastructure.database.repository.revoked_token_repository import RevokedTokenRepositoryImpl
+from infrastructure.workers.revocation_sync import sync_revocations
+
+
+@pytest.fixture(autouse=True)
+def server_timezone(monkeypatch):
+    """Serveur hors UTC: une date naïve y serait décalée de plusieurs heures"""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def make_user() -> User:
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid.uuid4(), first_name="Ada", last_name="Lovelace", email="ada@example.com",
+        password="", verified=True, role=UserRole.MEMBER, created_at=now, updated_at=now,
+    )
+
+
+def test_issued_at_is_current_utc_time():
+    access_token, refresh_token = AuthService.create_token_pair(make_user())
+
+    for token in (access_token, refresh_token):
+        payload = AuthService.decode_token(token)
+        assert abs(payload["iat"] - time.time()) < 5
+        assert payload["iat"] < payload["exp"]
+        assert not AuthService.is_token_expired(token)
+
+
+def test_principal_dates_are_aware():
+    claims = AuthService.verify_token(AuthService.create_access_token(make_user()), use_cache=False)
+
+    principal = AuthService.principal_from_claims(claims)
+
+    assert principal.created_at.tzinfo is not None
+    assert abs(principal.created_at - datetime.now(timezone.utc)) < timedelta(seconds=5)
+    assert principal.created_at < claims.exp
+
+
+@pytest.mark.anyio
+async def test_synced_revocation_keeps_utc_expiry(schema):
+    claims = AuthService.verify_token(AuthService.create_access_token(make_user()), use_cache=False)
+    async with AsyncSessionLocal() as db:
+        await RevocationStore().revoke(RevokedTokenRepositoryImpl(db), claims.jti, claims.exp)
+
+    store = RevocationStore()
+    since = await sync_revocations(store)
+
+    assert store.is_revoked(claims)
+    assert since.tzinfo is not None
+    # Entrée purgée à l'expiration du token, pas quelques heures avant ou après
+    assert store.prune(claims.exp.timestamp() - 1) == 0
+    assert store.prune(claims.exp.timestamp() + 1) == 1